@@ -1,23 +1,49 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+import asyncio
 import hashlib
-import json
+import os
+import re
+import threading
 import urllib.error
 import urllib.request
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
+from functools import lru_cache, partial
 from uuid import uuid4
 import html as _html
 import zipfile
 import xml.etree.ElementTree as ET
 import io
+import shutil
 
-from fastapi import FastAPI, File, Form, HTTPException, UploadFile
+try:
+	import httpx  # type: ignore
+except ModuleNotFoundError:
+	httpx = None  # type: ignore[assignment]
+
+from fastapi import FastAPI, File, Form, HTTPException, Response, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from pydantic import BaseModel, Field
 
+from canonicalizer import CANONICAL_SHARD_NAME, read_canonical
+from chunker import CHUNKS_SHARD_NAME, load_release_chunks
 from cleaner import clean_html_text
+from embeddings import (
+	PackedEmbeddingStore,
+	f32_sidecar_path,
+	load_embedding_vector,
+	make_embedding_ref,
+	parse_det_embedding_ref,
+	parse_embedding_ref,
+	parse_packed_embedding_ref,
+)
 from env import (
 	get_canonical_root,
 	get_chunks_root,
@@ -28,13 +54,50 @@ from env import (
 	get_vector_index_root,
 )
 from integrity import sign_content_hash
+import jsonio
 from observability import ObservabilityStore
-from pipeline import run_ingestion
+from pipeline import (
+	close_ingestion_embedder,
+	finish_ingestion,
+	get_ingestion_pool,
+	prepare_ingestion,
+	run_ingestion,
+	shutdown_ingestion_pool,
+)
 from releases import ReleaseManager
 from retrieval_service import RetrievalService
 
 
-app = FastAPI(title="Ingestion Service")
+# Shared keep-alive client for captures; None when httpx is missing or outside the app lifespan.
+_http_client: Optional["httpx.AsyncClient"] = None
+
+
+@asynccontextmanager
+async def _lifespan(_app: FastAPI):
+	global _http_client
+	if httpx is not None:
+		_http_client = httpx.AsyncClient(
+			headers=_UA_HEADERS,
+			follow_redirects=True,
+			limits=httpx.Limits(max_keepalive_connections=64, max_connections=128),
+		)
+	try:
+		yield
+	finally:
+		if _http_client is not None:
+			await _http_client.aclose()
+			_http_client = None
+		shutdown_ingestion_pool()
+		close_ingestion_embedder()
+
+
+# orjson-backed responses when available; FastAPI's stdlib JSONResponse otherwise.
+app = FastAPI(
+	title="Ingestion Service",
+	lifespan=_lifespan,
+	default_response_class=ORJSONResponse if jsonio.HAS_ORJSON else JSONResponse,
+)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 app.add_middleware(
 	CORSMiddleware,
 	allow_origins=["*"],
@@ -183,20 +246,58 @@ class RetrieveRequest(BaseModel):
 	release_id: Optional[str] = None
 
 
+@lru_cache(maxsize=1)
+def _get_obs() -> ObservabilityStore:
+	# Stateless apart from its resolved root, so one instance serves every request.
+	return ObservabilityStore()
+
+
+@lru_cache(maxsize=1)
+def _get_release_manager() -> ReleaseManager:
+	return ReleaseManager()
+
+
+@lru_cache(maxsize=1)
+def _get_retrieval_service() -> RetrievalService:
+	# Holds only resolved config + stateless helpers, so it is safe to share across requests.
+	return RetrievalService.from_env()
+
+
+_UTC = timezone.utc
+_ISO_FMT = "%Y-%m-%dT%H:%M:%S.%fZ"
+_TS_FMT = "%Y%m%d-%H%M%S"
+_UA_HEADERS = {"User-Agent": "ingestion-service/1.0"}
+
+
 def _utc_now_iso() -> str:
-	return datetime.now(tz=timezone.utc).isoformat().replace("+00:00", "Z")
+	return datetime.now(_UTC).strftime(_ISO_FMT)
+
 
+def _is_blank(value: Optional[str]) -> bool:
+	# isspace() answers without allocating a stripped copy.
+	return not value or value.isspace()
 
-def _sha256_hex(text: str) -> str:
-	h = hashlib.sha256()
-	h.update((text or "").encode("utf-8"))
-	return h.hexdigest()
+
+def _sha256_hex_bytes(data: bytes) -> str:
+	# Hash the payload as received; no decode/re-encode round trip.
+	return hashlib.sha256(data).hexdigest()
 
 
 def _capture_root(domain: str) -> Path:
 	return get_ingestion_data_root() / "captures" / domain
 
 
+@lru_cache(maxsize=256)
+def _ensure_dir(path: Path) -> Path:
+	# Keyed by the resolved path so a changed data root still gets created; dirs are never removed mid-process.
+	path.mkdir(parents=True, exist_ok=True)
+	return path
+
+
+def _ensure_capture_root(domain: str) -> Path:
+	return _ensure_dir(_capture_root(domain))
+
+
 def _capture_html_path(domain: str, capture_id: str) -> Path:
 	return _capture_root(domain) / f"{capture_id}.html"
 
@@ -205,36 +306,105 @@ def _capture_meta_path(domain: str, capture_id: str) -> Path:
 	return _capture_root(domain) / f"{capture_id}.json"
 
 
+# Raw bytes of the most recent captures written by this process, so a run that
+# immediately follows its capture skips re-reading the file.
+_RECENT_CAPTURES_MAX = 32
+_recent_captures: "OrderedDict[tuple[str, str], bytes]" = OrderedDict()
+_recent_captures_lock = threading.Lock()
+
+
+def _decode_html(data: bytes) -> str:
+	return data.decode("utf-8", errors="replace")
+
+
+def _remember_capture_html(domain: str, capture_id: str, raw_bytes: bytes) -> None:
+	key = (domain, capture_id)
+	with _recent_captures_lock:
+		_recent_captures[key] = raw_bytes
+		_recent_captures.move_to_end(key)
+		while len(_recent_captures) > _RECENT_CAPTURES_MAX:
+			_recent_captures.popitem(last=False)
+
+
+def _recent_capture_html(domain: str, capture_id: str) -> Optional[bytes]:
+	with _recent_captures_lock:
+		return _recent_captures.get((domain, capture_id))
+
+
+class _StatCache:
+	"""Small LRU of values loaded from a path, revalidated against (mtime_ns, size) on every hit."""
+
+	def __init__(self, maxsize: int) -> None:
+		self._maxsize = maxsize
+		self._data: "OrderedDict[str, tuple[tuple[int, int], Any]]" = OrderedDict()
+		self._lock = threading.Lock()
+
+	def _store(self, key: str, sig: tuple[int, int], value: Any) -> None:
+		with self._lock:
+			self._data[key] = (sig, value)
+			self._data.move_to_end(key)
+			while len(self._data) > self._maxsize:
+				self._data.popitem(last=False)
+
+	def get(self, path: Path, loader) -> Any:
+		st = os.stat(path)  # FileNotFoundError propagates
+		key = str(path)
+		sig = (st.st_mtime_ns, st.st_size)
+		with self._lock:
+			hit = self._data.get(key)
+			if hit is not None and hit[0] == sig:
+				self._data.move_to_end(key)
+				return hit[1]
+		value = loader(path)
+		self._store(key, sig, value)
+		return value
+
+	def put(self, path: Path, value: Any) -> None:
+		st = os.stat(path)
+		self._store(str(path), (st.st_mtime_ns, st.st_size), value)
+
+
+# Parsed capture metadata and per-domain release listings, kept in-process.
+_capture_meta_cache = _StatCache(maxsize=512)
+_release_list_cache = _StatCache(maxsize=64)
+
+
 def _load_capture(domain: str, capture_id: str) -> Dict[str, Any]:
 	meta_path = _capture_meta_path(domain, capture_id)
-	if not meta_path.exists():
-		raise FileNotFoundError("capture not found")
-	return json.loads(meta_path.read_text(encoding="utf-8"))
+	try:
+		payload = _capture_meta_cache.get(meta_path, jsonio.read_json)
+	except FileNotFoundError:
+		raise FileNotFoundError("capture not found") from None
+	# Callers only set top-level keys, so a shallow copy keeps the cached dict intact.
+	return dict(payload)
 
 
 def _save_capture(domain: str, capture_id: str, payload: Dict[str, Any]) -> None:
-	root = _capture_root(domain)
-	root.mkdir(parents=True, exist_ok=True)
-	_capture_meta_path(domain, capture_id).write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+	_ensure_capture_root(domain)
+	meta_path = _capture_meta_path(domain, capture_id)
+	jsonio.write_json(meta_path, payload)
+	_capture_meta_cache.put(meta_path, dict(payload))
+
+# Any char that is not alphanumeric, "-" or "_" becomes "_" (one per char).
+_SLUG_RE = re.compile(r"[^\w-]")
 
 def _safe_slug(value: str) -> str:
-	raw = "".join(ch if ch.isalnum() or ch in ("-", "_") else "_" for ch in (value or "").strip().lower())
-	raw = raw.strip("_")
+	raw = _SLUG_RE.sub("_", (value or "").strip().lower()).strip("_")
 	return raw or "domain"
 
 def _generate_release_id(domain: str) -> str:
-	ts = datetime.now(tz=timezone.utc).strftime("%Y%m%d-%H%M%S")
+	ts = datetime.now(_UTC).strftime(_TS_FMT)
 	suffix = str(uuid4()).split("-", 1)[0]
 	return f"{_safe_slug(domain)}_{ts}_{suffix}"
 
 def _iter_domain_dirs(root: Path) -> List[str]:
-	if not root.exists():
+	# scandir's DirEntry.is_dir() uses the d_type from readdir, avoiding a stat per entry.
+	# Dot-directories (e.g. the embedding cache) are internal, not domains or releases.
+	try:
+		with os.scandir(root) as it:
+			return [e.name for e in it if e.is_dir() and not e.name.startswith(".")]
+	except (FileNotFoundError, NotADirectoryError):
 		return []
-	out: List[str] = []
-	for p in root.iterdir():
-		if p.is_dir():
-			out.append(p.name)
-	return out
 
 @app.get("/domains")
 def list_domains() -> Dict[str, Any]:
@@ -250,58 +420,131 @@ def list_domains() -> Dict[str, Any]:
 		get_vector_index_root(),
 	):
 		candidates.extend(_iter_domain_dirs(Path(d)))
-	unique = sorted({c for c in candidates if isinstance(c, str) and c.strip()})
+	unique = sorted({c for c in candidates if isinstance(c, str) and not _is_blank(c)})
 	return {"domains": unique}
 
 
-def _fetch_url(url: str, timeout: int) -> tuple[int, Dict[str, Any], str]:
-	req = urllib.request.Request(url=url, headers={"User-Agent": "ingestion-service/1.0"})
+# Upper bound on in-flight fetches for batch capture endpoints.
+_CAPTURE_CONCURRENCY = 20
+
+
+# Capture bodies are streamed to disk in blocks; bodies up to _KEEP_BODY_MAX are
+# also kept in memory (for the recent-capture cache) unless the caller needs them anyway.
+_STREAM_BLOCK = 64 * 1024
+_KEEP_BODY_MAX = 1 << 20
+
+
+class _CaptureSink:
+	"""Writes a streamed body to a temp file beside `dest`, hashing it on the way."""
+
+	def __init__(self, dest: Path, *, keep_body: bool) -> None:
+		self.dest = dest
+		self.tmp = dest.with_name(f".{dest.name}.{uuid4().hex[:8]}.part")
+		self.size = 0
+		self.blank = True
+		self._f = open(self.tmp, "wb")
+		self._h = hashlib.sha256()
+		self._keep_body = keep_body
+		self._parts: Optional[List[bytes]] = []
+
+	def write(self, block: bytes) -> None:
+		if not block:
+			return
+		self._f.write(block)
+		self._h.update(block)
+		self.size += len(block)
+		if self.blank and not block.isspace():
+			self.blank = False
+		if self._parts is not None:
+			if self._keep_body or self.size <= _KEEP_BODY_MAX:
+				self._parts.append(block)
+			else:
+				self._parts = None
+
+	def commit(self) -> tuple[str, Optional[bytes]]:
+		"""Move the body into place; returns (sha256 hex, body if it was kept)."""
+		self._f.close()
+		os.replace(self.tmp, self.dest)
+		body = b"".join(self._parts) if self._parts is not None else None
+		return self._h.hexdigest(), body
+
+	def discard(self) -> None:
+		self._f.close()
+		try:
+			os.unlink(self.tmp)
+		except FileNotFoundError:
+			pass
+
+
+def _fetch_url_blocking(url: str, timeout: int, sink: _CaptureSink) -> tuple[int, Dict[str, Any]]:
+	req = urllib.request.Request(url=url, headers=_UA_HEADERS)
 	try:
 		with urllib.request.urlopen(req, timeout=timeout) as resp:
 			status = int(getattr(resp, "status", 200))
-			raw = resp.read().decode("utf-8", errors="replace")
 			headers = {k: v for k, v in resp.headers.items()}
-			return status, headers, raw
+			for block in iter(lambda: resp.read(_STREAM_BLOCK), b""):
+				sink.write(block)
+			return status, headers
 	except urllib.error.HTTPError as exc:
-		raw = exc.read().decode("utf-8", errors="replace") if hasattr(exc, "read") else ""
+		if hasattr(exc, "read"):
+			for block in iter(lambda: exc.read(_STREAM_BLOCK), b""):
+				sink.write(block)
 		headers = dict(getattr(exc, "headers", {}) or {})
-		return int(exc.code or 500), headers, raw
+		return int(exc.code or 500), headers
+	except Exception as exc:
+		raise RuntimeError(f"Failed to fetch URL: {exc}") from exc
+
+async def _fetch_url(url: str, timeout: int, sink: _CaptureSink) -> tuple[int, Dict[str, Any]]:
+	"""Stream `url` into `sink`; returns (status, headers)."""
+	client = _http_client
+	if client is None:
+		# urlopen blocks; run it off the event loop so concurrent captures overlap.
+		return await asyncio.to_thread(_fetch_url_blocking, url, timeout, sink)
+	try:
+		async with client.stream("GET", url, timeout=timeout) as resp:
+			async for block in resp.aiter_bytes(_STREAM_BLOCK):
+				await asyncio.to_thread(sink.write, block)
 	except Exception as exc:
 		raise RuntimeError(f"Failed to fetch URL: {exc}") from exc
+	enc = resp.headers.encoding
+	# .raw keeps the server's header casing, matching what urllib reported.
+	headers = {k.decode(enc): v.decode(enc) for k, v in resp.headers.raw}
+	return resp.status_code, headers
+
+async def _record_event(**kwargs: Any) -> None:
+	# record_event commits to SQLite and appends to the event log; keep it off the event loop.
+	await asyncio.to_thread(_get_obs().record_event, **kwargs)
 
-def _model_to_dict(value: Any) -> Any:
-	if value is None:
-		return None
-	dumper = getattr(value, "model_dump", None)
-	if callable(dumper):
-		return dumper()
-	to_dict = getattr(value, "dict", None)
-	if callable(to_dict):
-		return to_dict()
-	return value
+def _json_response(content: Dict[str, Any]) -> Response:
+	# Batch payloads are assembled from already-validated parts; serialize them
+	# once here instead of re-validating them against the response_model.
+	return Response(content=jsonio.dumps(content), media_type="application/json")
 
 
 @app.post("/ingestion/run", response_model=IngestionRunResponse)
-def ingestion_run(req: IngestionRunRequest) -> IngestionRunResponse:
-	raw_html = req.raw_html
+async def ingestion_run(req: IngestionRunRequest) -> IngestionRunResponse:
+	# File inputs stay as bytes; run_ingestion hashes them directly and decodes once.
+	raw_html: Union[str, bytes, None] = req.raw_html
 	if not raw_html and req.raw_html_path:
 		path = Path(req.raw_html_path).expanduser().resolve()
 		if not path.exists():
 			raise HTTPException(status_code=404, detail="raw_html_path not found")
-		raw_html = path.read_text(encoding="utf-8")
+		raw_html = await asyncio.to_thread(path.read_bytes)
 	if not raw_html and req.capture_id:
+		raw_html = _recent_capture_html(req.domain, req.capture_id)
+	if not raw_html and req.capture_id:
+		# Captures always live at their canonical path under the capture root.
 		try:
-			meta = _load_capture(req.domain, req.capture_id)
-			path = Path(str(meta.get("raw_html_path", ""))).expanduser().resolve()
-			if not path.exists():
-				raise HTTPException(status_code=404, detail="capture raw_html_path not found")
-			raw_html = path.read_text(encoding="utf-8")
+			raw_html = await asyncio.to_thread(_capture_html_path(req.domain, req.capture_id).read_bytes)
 		except FileNotFoundError:
+			if _capture_meta_path(req.domain, req.capture_id).exists():
+				raise HTTPException(status_code=404, detail="capture raw_html_path not found")
 			raise HTTPException(status_code=404, detail="capture not found")
 	if not raw_html:
 		raise HTTPException(status_code=400, detail="raw_html or raw_html_path is required")
 	try:
-		result = run_ingestion(
+		result = await asyncio.to_thread(
+			run_ingestion,
 			domain=req.domain,
 			source_id=req.source_id,
 			release_id=req.release_id,
@@ -309,7 +552,7 @@ def ingestion_run(req: IngestionRunRequest) -> IngestionRunResponse:
 			created_by=req.created_by,
 			write_release=True,
 		)
-		ObservabilityStore().record_event(
+		await _record_event(
 			domain=req.domain,
 			event="ingestion_run",
 			status="success",
@@ -317,7 +560,7 @@ def ingestion_run(req: IngestionRunRequest) -> IngestionRunResponse:
 			source_id=req.source_id,
 		)
 	except Exception as exc:
-		ObservabilityStore().record_event(
+		await _record_event(
 			domain=req.domain,
 			event="ingestion_run",
 			status="error",
@@ -329,15 +572,16 @@ def ingestion_run(req: IngestionRunRequest) -> IngestionRunResponse:
 	return IngestionRunResponse(**result.__dict__)
 
 @app.post("/ingestion/run/batch", response_model=IngestionRunBatchResponse)
-def ingestion_run_batch(req: IngestionRunBatchRequest) -> IngestionRunBatchResponse:
-	if not req.domain or not req.domain.strip():
+async def ingestion_run_batch(req: IngestionRunBatchRequest) -> Response:
+	if _is_blank(req.domain):
 		raise HTTPException(status_code=400, detail="domain is required")
 	if not req.items:
 		raise HTTPException(status_code=400, detail="items is required")
 
 	release_id = (req.release_id or "").strip() or _generate_release_id(req.domain)
-	release_manager = ReleaseManager()
-	release_meta = release_manager.create_release(
+	release_manager = _get_release_manager()
+	release_meta = await asyncio.to_thread(
+		release_manager.create_release,
 		domain=req.domain,
 		release_id=release_id,
 		created_by=req.created_by,
@@ -348,14 +592,14 @@ def ingestion_run_batch(req: IngestionRunBatchRequest) -> IngestionRunBatchRespo
 	agg_counts: Dict[str, int] = {"sections_total": 0, "sections_kept": 0, "canonical_objects": 0, "chunks": 0, "embeddings": 0}
 	succeeded = 0
 
-	def _load_item_raw_html(item: IngestionRunBatchItem) -> str:
-		if item.raw_html and item.raw_html.strip():
+	def _load_item_raw_html(item: IngestionRunBatchItem) -> Union[str, bytes]:
+		if not _is_blank(item.raw_html):
 			return item.raw_html
 		if item.raw_html_path:
 			path = Path(item.raw_html_path).expanduser().resolve()
 			if not path.exists():
 				raise FileNotFoundError("raw_html_path not found")
-			return path.read_text(encoding="utf-8")
+			return path.read_bytes()
 		if item.capture_id:
 			meta = _load_capture(req.domain, item.capture_id)
 			path = Path(str(meta.get("raw_html_path", ""))).expanduser().resolve()
@@ -367,25 +611,59 @@ def ingestion_run_batch(req: IngestionRunBatchRequest) -> IngestionRunBatchRespo
 				http_status = meta.get("http_status")
 				if quarantined or not capture_ok:
 					raise RuntimeError(f"capture not usable (http_status={http_status}, quarantined={quarantined})")
-			return path.read_text(encoding="utf-8")
+			return path.read_bytes()
 		raise RuntimeError("raw_html/raw_html_path/capture_id is required")
 
-	for item in req.items:
+	# Load inputs up front, then prepare items in worker processes. prepare_ingestion
+	# writes nothing; finish_ingestion writes every artifact, here, in request order,
+	# so fail-fast never leaves rows from items after the failing one.
+	outcomes: List[Any] = [None] * len(req.items)
+	jobs: Dict[int, Dict[str, Any]] = {}
+	for idx, item in enumerate(req.items):
 		try:
-			raw_html = _load_item_raw_html(item)
-			run_result = run_ingestion(
-				domain=req.domain,
-				source_id=item.source_id,
-				release_id=release_id,
-				raw_html=raw_html,
-				created_by=req.created_by,
-				write_release=False,
-			)
+			raw_html = await asyncio.to_thread(_load_item_raw_html, item)
+		except Exception as exc:
+			outcomes[idx] = exc
+			if not req.continue_on_error:
+				break
+			continue
+		jobs[idx] = {"domain": req.domain, "source_id": item.source_id, "release_id": release_id, "raw_html": raw_html}
+
+	if len(jobs) > 1:
+		loop = asyncio.get_running_loop()
+		pool = get_ingestion_pool()
+		futures = {loop.run_in_executor(pool, partial(prepare_ingestion, **kwargs)): idx for idx, kwargs in jobs.items()}
+		waiting = set(futures)
+		while waiting:
+			done, waiting = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+			for fut in done:
+				if fut.cancelled():
+					continue
+				idx = futures[fut]
+				exc = fut.exception()
+				outcomes[idx] = exc if exc is not None else fut.result()
+				if exc is not None and not req.continue_on_error:
+					# Fail-fast: later items will never be written, so don't prepare them.
+					for other in waiting:
+						if futures[other] > idx:
+							other.cancel()
+	else:
+		for idx, kwargs in jobs.items():
+			try:
+				outcomes[idx] = await asyncio.to_thread(prepare_ingestion, **kwargs)
+			except Exception as exc:
+				outcomes[idx] = exc
+
+	for item, outcome in zip(req.items, outcomes):
+		try:
+			if isinstance(outcome, BaseException):
+				raise outcome
+			run_result = await asyncio.to_thread(finish_ingestion, outcome, created_by=req.created_by, write_release=False)
 			succeeded += 1
 			for k, v in (run_result.counts or {}).items():
 				agg_counts[k] = int(agg_counts.get(k, 0)) + int(v)
 			results.append({"source_id": item.source_id, "ok": True, "counts": run_result.counts})
-			ObservabilityStore().record_event(
+			await _record_event(
 				domain=req.domain,
 				event="ingestion_run_batch_item",
 				status="success",
@@ -394,7 +672,7 @@ def ingestion_run_batch(req: IngestionRunBatchRequest) -> IngestionRunBatchRespo
 			)
 		except Exception as exc:
 			results.append({"source_id": item.source_id, "ok": False, "error": {"message": str(exc)}})
-			ObservabilityStore().record_event(
+			await _record_event(
 				domain=req.domain,
 				event="ingestion_run_batch_item",
 				status="error",
@@ -415,7 +693,7 @@ def ingestion_run_batch(req: IngestionRunBatchRequest) -> IngestionRunBatchRespo
 		"counts": agg_counts,
 	}
 	status = "success" if succeeded == len(req.items) else ("failed" if succeeded == 0 else "partial")
-	ObservabilityStore().record_event(
+	await _record_event(
 		domain=req.domain,
 		event="ingestion_run_batch",
 		status=status,
@@ -424,123 +702,193 @@ def ingestion_run_batch(req: IngestionRunBatchRequest) -> IngestionRunBatchRespo
 		succeeded=succeeded,
 		failed=len(req.items) - succeeded,
 	)
-	return IngestionRunBatchResponse(domain=req.domain, release_id=release_id, release=release_meta, summary=summary, results=results)
+	return _json_response({"domain": req.domain, "release_id": release_id, "release": release_meta, "summary": summary, "results": results})
 
 
-@app.post("/ingestion/raw-capture", response_model=IngestionRawCaptureResponse)
-def ingestion_raw_capture(req: IngestionRawCaptureRequest) -> IngestionRawCaptureResponse:
-	if not req.domain or not req.domain.strip():
-		raise HTTPException(status_code=400, detail="domain is required")
-	if not req.source_id or not req.source_id.strip():
-		raise HTTPException(status_code=400, detail="source_id is required")
-	if not req.url or not req.url.strip():
-		raise HTTPException(status_code=400, detail="url is required")
-	try:
-		status, headers, raw = _fetch_url(req.url, timeout=int(req.timeout or 10))
-	except Exception as exc:
-		ObservabilityStore().record_event(
-			domain=req.domain,
-			event="ingestion_raw_capture",
-			status="error",
-			source_id=req.source_id,
-			url=req.url,
-			error=str(exc),
-		)
-		raise HTTPException(status_code=400, detail=str(exc)) from exc
+def _open_capture_sink(domain: str, raw_path: Path, keep_body: bool) -> _CaptureSink:
+	_ensure_capture_root(domain)
+	return _CaptureSink(raw_path, keep_body=keep_body)
 
-	capture_ok = 200 <= status < 300 and bool(raw.strip())
-	quarantined = bool(req.quarantine_suspicious and not capture_ok)
-	quarantine_reason = None if not quarantined else "capture_failed"
 
-	root = _capture_root(req.domain)
-	root.mkdir(parents=True, exist_ok=True)
-	raw_path = _capture_html_path(req.domain, req.source_id)
-	raw_path.write_text(raw, encoding="utf-8")
+def _persist_raw_capture(
+	sink: _CaptureSink,
+	*,
+	domain: str,
+	source_id: str,
+	url: str,
+	status: int,
+	headers: Dict[str, Any],
+	clean: bool,
+	quarantine_suspicious: bool,
+) -> tuple[Dict[str, Any], Optional[bytes]]:
+	"""Commit a fetched body and write its capture metadata. Blocking; run off the event loop."""
+	digest, raw_bytes = sink.commit()
+	if raw_bytes is not None:
+		_remember_capture_html(domain, source_id, raw_bytes)
+
+	# The sink tracks ASCII-whitespace-only bodies, so nothing is decoded unless cleaning.
+	capture_ok = 200 <= status < 300 and not sink.blank
+	quarantined = bool(quarantine_suspicious and not capture_ok)
+	quarantine_reason = None if not quarantined else "capture_failed"
 
-	content_hash = f"sha256:{_sha256_hex(raw)}"
+	content_hash = f"sha256:{digest}"
 	content_signature = sign_content_hash(content_hash)
 	payload: Dict[str, Any] = {
-		"source_id": req.source_id,
-		"domain": req.domain,
-		"url": req.url,
+		"source_id": source_id,
+		"domain": domain,
+		"url": url,
 		"http_status": status,
 		"headers": headers,
-		"raw_html_path": str(raw_path),
+		"raw_html_path": str(sink.dest),
 		"content_hash": content_hash,
 		"content_signature": content_signature,
 		"retrieved_at": _utc_now_iso(),
 		"capture_ok": capture_ok,
-		"cleaned_text": clean_html_text(raw) if req.clean else None,
+		"cleaned_text": clean_html_text(raw_bytes) if clean else None,
 		"quarantined": quarantined,
 		"quarantine_reason": quarantine_reason,
 		"quarantined_at": None,
 		"db_persisted": False,
 		"db_error": None,
 	}
-	_save_capture(req.domain, req.source_id, payload)
-	ObservabilityStore().record_event(
-		domain=req.domain,
+	_save_capture(domain, source_id, payload)
+	return payload, raw_bytes
+
+
+async def _do_raw_capture(
+	*,
+	domain: str,
+	source_id: str,
+	url: str,
+	timeout: int,
+	clean: bool,
+	quarantine_suspicious: bool,
+	keep_body: bool = False,
+) -> tuple[Dict[str, Any], Optional[bytes]]:
+	"""Fetch and persist one capture; returns (capture payload, raw body bytes).
+
+	The body is streamed to disk; it is only returned when `keep_body` or `clean`
+	is set, or when it is small enough to keep for the recent-capture cache.
+	"""
+	if _is_blank(domain):
+		raise HTTPException(status_code=400, detail="domain is required")
+	if _is_blank(source_id):
+		raise HTTPException(status_code=400, detail="source_id is required")
+	if _is_blank(url):
+		raise HTTPException(status_code=400, detail="url is required")
+	raw_path = _capture_html_path(domain, source_id)
+	sink = await asyncio.to_thread(_open_capture_sink, domain, raw_path, keep_body or clean)
+	try:
+		status, headers = await _fetch_url(url, timeout=int(timeout or 10), sink=sink)
+	except BaseException as exc:
+		# A client disconnect cancels the task with CancelledError, a BaseException;
+		# the .part file and its fd are released on that path too.
+		sink.discard()
+		if not isinstance(exc, Exception):
+			raise
+		await _record_event(
+			domain=domain,
+			event="ingestion_raw_capture",
+			status="error",
+			source_id=source_id,
+			url=url,
+			error=str(exc),
+		)
+		raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+	payload, raw_bytes = await asyncio.to_thread(
+		_persist_raw_capture,
+		sink,
+		domain=domain,
+		source_id=source_id,
+		url=url,
+		status=status,
+		headers=headers,
+		clean=clean,
+		quarantine_suspicious=quarantine_suspicious,
+	)
+	await _record_event(
+		domain=domain,
 		event="ingestion_raw_capture",
-		status="success" if capture_ok else "failed",
+		status="success" if payload["capture_ok"] else "failed",
+		source_id=source_id,
+		url=url,
+		http_status=status,
+		quarantined=payload["quarantined"],
+	)
+	return payload, raw_bytes
+
+
+@app.post("/ingestion/raw-capture", response_model=IngestionRawCaptureResponse)
+async def ingestion_raw_capture(req: IngestionRawCaptureRequest) -> IngestionRawCaptureResponse:
+	payload, _ = await _do_raw_capture(
+		domain=req.domain,
 		source_id=req.source_id,
 		url=req.url,
-		http_status=status,
-		quarantined=quarantined,
+		timeout=req.timeout,
+		clean=req.clean,
+		quarantine_suspicious=req.quarantine_suspicious,
 	)
-	return IngestionRawCaptureResponse(**payload)
+	# payload is built by _do_raw_capture itself; skip re-validating it.
+	return IngestionRawCaptureResponse.model_construct(**payload)
 
 @app.post("/ingestion/raw-capture/batch", response_model=IngestionRawCaptureBatchResponse)
-def ingestion_raw_capture_batch(req: IngestionRawCaptureBatchRequest) -> IngestionRawCaptureBatchResponse:
-	if not req.domain or not req.domain.strip():
+async def ingestion_raw_capture_batch(req: IngestionRawCaptureBatchRequest) -> Response:
+	if _is_blank(req.domain):
 		raise HTTPException(status_code=400, detail="domain is required")
 	if not req.items:
 		raise HTTPException(status_code=400, detail="items is required")
 
 	results: List[Dict[str, Any]] = []
 	counts = {"total": len(req.items), "capture_ok": 0, "failed": 0, "quarantined": 0}
+	sem = asyncio.Semaphore(_CAPTURE_CONCURRENCY)
 
-	for item in req.items:
-		try:
-			r = ingestion_raw_capture(
-				IngestionRawCaptureRequest(
-					source_id=item.source_id,
-					domain=req.domain,
-					url=item.url,
-					timeout=item.timeout,
-					persist_to_db=item.persist_to_db,
-					clean=item.clean,
-					quarantine_suspicious=item.quarantine_suspicious,
-				)
+	async def _bounded(item: IngestionRawCaptureBatchItem) -> Dict[str, Any]:
+		async with sem:
+			payload, _ = await _do_raw_capture(
+				domain=req.domain,
+				source_id=item.source_id,
+				url=item.url,
+				timeout=item.timeout,
+				clean=item.clean,
+				quarantine_suspicious=item.quarantine_suspicious,
 			)
-			ok = bool(r.capture_ok)
-			if ok:
-				counts["capture_ok"] += 1
-			else:
-				counts["failed"] += 1
-			if bool(r.quarantined):
-				counts["quarantined"] += 1
-			results.append({"source_id": item.source_id, "ok": ok, "capture": _model_to_dict(r)})
-		except Exception as exc:
+			return payload
+
+	# Fetch concurrently, then report in request order so fail-fast still names the first failing item.
+	outcomes = await asyncio.gather(*[_bounded(item) for item in req.items], return_exceptions=True)
+	for item, outcome in zip(req.items, outcomes):
+		if isinstance(outcome, BaseException):
 			counts["failed"] += 1
-			results.append({"source_id": item.source_id, "ok": False, "error": {"message": str(exc)}})
+			results.append({"source_id": item.source_id, "ok": False, "error": {"message": str(outcome)}})
 			if not req.continue_on_error:
 				raise HTTPException(
 					status_code=400,
-					detail={"message": "Batch capture failed", "failed_source_id": item.source_id, "error": str(exc)},
-				) from exc
+					detail={"message": "Batch capture failed", "failed_source_id": item.source_id, "error": str(outcome)},
+				) from outcome
+			continue
+		ok = bool(outcome["capture_ok"])
+		if ok:
+			counts["capture_ok"] += 1
+		else:
+			counts["failed"] += 1
+		if bool(outcome["quarantined"]):
+			counts["quarantined"] += 1
+		results.append({"source_id": item.source_id, "ok": ok, "capture": outcome})
 
-	return IngestionRawCaptureBatchResponse(domain=req.domain, summary=counts, results=results)
+	return _json_response({"domain": req.domain, "summary": counts, "results": results})
 
 @app.post("/ingestion/ingest/batch", response_model=IngestionIngestBatchResponse)
-def ingestion_ingest_batch(req: IngestionIngestBatchRequest) -> IngestionIngestBatchResponse:
-	if not req.domain or not req.domain.strip():
+async def ingestion_ingest_batch(req: IngestionIngestBatchRequest) -> Response:
+	if _is_blank(req.domain):
 		raise HTTPException(status_code=400, detail="domain is required")
 	if not req.items:
 		raise HTTPException(status_code=400, detail="items is required")
 
 	release_id = (req.release_id or "").strip() or _generate_release_id(req.domain)
-	release_manager = ReleaseManager()
-	release_meta = release_manager.create_release(
+	release_manager = _get_release_manager()
+	release_meta = await asyncio.to_thread(
+		release_manager.create_release,
 		domain=req.domain,
 		release_id=release_id,
 		created_by=req.created_by,
@@ -553,25 +901,23 @@ def ingestion_ingest_batch(req: IngestionIngestBatchRequest) -> IngestionIngestB
 
 	for item in req.items:
 		try:
-			capture = ingestion_raw_capture(
-				IngestionRawCaptureRequest(
-					source_id=item.source_id,
-					domain=req.domain,
-					url=item.url,
-					timeout=item.timeout,
-					persist_to_db=False,
-					clean=item.clean,
-					quarantine_suspicious=item.quarantine_suspicious,
-				)
+			payload, raw_bytes = await _do_raw_capture(
+				domain=req.domain,
+				source_id=item.source_id,
+				url=item.url,
+				timeout=item.timeout,
+				clean=item.clean,
+				quarantine_suspicious=item.quarantine_suspicious,
+				keep_body=True,
 			)
-			if (not req.force) and (not capture.capture_ok or capture.quarantined):
-				raise RuntimeError(f"capture not usable (http_status={capture.http_status}, quarantined={capture.quarantined})")
-			raw_html = Path(capture.raw_html_path).read_text(encoding="utf-8")
-			run_result = run_ingestion(
+			if (not req.force) and (not payload["capture_ok"] or payload["quarantined"]):
+				raise RuntimeError(f"capture not usable (http_status={payload['http_status']}, quarantined={payload['quarantined']})")
+			run_result = await asyncio.to_thread(
+				run_ingestion,
 				domain=req.domain,
 				source_id=item.source_id,
 				release_id=release_id,
-				raw_html=raw_html,
+				raw_html=raw_bytes,
 				created_by=req.created_by,
 				write_release=False,
 			)
@@ -582,11 +928,11 @@ def ingestion_ingest_batch(req: IngestionIngestBatchRequest) -> IngestionIngestB
 				{
 					"source_id": item.source_id,
 					"ok": True,
-					"capture": _model_to_dict(capture),
+					"capture": payload,
 					"counts": run_result.counts,
 				}
 			)
-			ObservabilityStore().record_event(
+			await _record_event(
 				domain=req.domain,
 				event="ingestion_ingest_batch_item",
 				status="success",
@@ -595,7 +941,7 @@ def ingestion_ingest_batch(req: IngestionIngestBatchRequest) -> IngestionIngestB
 			)
 		except Exception as exc:
 			results.append({"source_id": item.source_id, "ok": False, "error": {"message": str(exc)}})
-			ObservabilityStore().record_event(
+			await _record_event(
 				domain=req.domain,
 				event="ingestion_ingest_batch_item",
 				status="error",
@@ -616,7 +962,7 @@ def ingestion_ingest_batch(req: IngestionIngestBatchRequest) -> IngestionIngestB
 		"counts": agg_counts,
 	}
 	status = "success" if succeeded == len(req.items) else ("failed" if succeeded == 0 else "partial")
-	ObservabilityStore().record_event(
+	await _record_event(
 		domain=req.domain,
 		event="ingestion_ingest_batch",
 		status=status,
@@ -625,58 +971,63 @@ def ingestion_ingest_batch(req: IngestionIngestBatchRequest) -> IngestionIngestB
 		succeeded=succeeded,
 		failed=len(req.items) - succeeded,
 	)
-	return IngestionIngestBatchResponse(domain=req.domain, release_id=release_id, release=release_meta, summary=summary, results=results)
+	return _json_response({"domain": req.domain, "release_id": release_id, "release": release_meta, "summary": summary, "results": results})
 
-@app.post("/ingestion/file-capture", response_model=IngestionRawCaptureResponse)
-async def ingestion_file_capture(
-	domain: str = Form(...),
-	source_id: str = Form(...),
-	file: UploadFile = File(...),
-	clean: bool = Form(False),
-	quarantine_suspicious: bool = Form(True),
-) -> IngestionRawCaptureResponse:
-	if not domain or not domain.strip():
-		raise HTTPException(status_code=400, detail="domain is required")
-	if not source_id or not source_id.strip():
-		raise HTTPException(status_code=400, detail="source_id is required")
-	if not file:
-		raise HTTPException(status_code=400, detail="file is required")
+def _wrap_text_as_html(text: str) -> str:
+	escaped = _html.escape(text or "")
+	return f"<pre>{escaped}</pre>"
 
-	raw_bytes = await file.read()
-	filename = (file.filename or "").strip()
-	ext = filename.lower().rsplit(".", 1)[-1] if "." in filename else ""
-
-	def _wrap_text_as_html(text: str) -> str:
-		escaped = _html.escape(text or "")
-		return f"<pre>{escaped}</pre>"
+def _best_effort_doc_text(data: bytes) -> str:
+	for enc in ("utf-16le", "utf-8", "latin-1"):
+		try:
+			t = data.decode(enc, errors="ignore")
+			t = t.replace("\x00", "")
+			if t.strip():
+				return t
+		except Exception:
+			continue
+	return ""
 
-	def _best_effort_doc_text(data: bytes) -> str:
-		for enc in ("utf-16le", "utf-8", "latin-1"):
-			try:
-				t = data.decode(enc, errors="ignore")
-				t = t.replace("\x00", "")
-				if t.strip():
-					return t
-			except Exception:
-				continue
-		return ""
-
-	def _extract_docx_text(data: bytes) -> str:
-		with zipfile.ZipFile(io.BytesIO(data)) as zf:
-			xml_bytes = zf.read("word/document.xml")
-		root = ET.fromstring(xml_bytes)
-		parts: List[str] = []
-		for el in root.iter():
-			if el.tag.endswith("}t") and el.text:
-				parts.append(el.text)
-		return "\n".join(parts).strip()
+# <w:p> in the transitional and strict OOXML namespaces.
+_DOCX_PARAGRAPH_TAGS = frozenset(
+	(
+		"{http://schemas.openxmlformats.org/wordprocessingml/2006/main}p",
+		"{http://purl.oclc.org/ooxml/wordprocessingml/main}p",
+	)
+)
 
+def _extract_docx_text(data: bytes) -> str:
+	parts: List[str] = []
+	with zipfile.ZipFile(io.BytesIO(data)) as zf:
+		# Stream-decompress and parse. Any "}t" element carries text (w:t, m:t in equations,
+		# a:t in drawings and text boxes); paragraphs are cleared once read so their
+		# subtrees do not accumulate under the body.
+		with zf.open("word/document.xml") as stream:
+			for _event, el in ET.iterparse(stream, events=("end",)):
+				if el.tag.endswith("}t") and el.text:
+					parts.append(el.text)
+				elif el.tag in _DOCX_PARAGRAPH_TAGS:
+					el.clear()
+	return "\n".join(parts).strip()
+
+def _process_file_upload(
+	*,
+	domain: str,
+	source_id: str,
+	filename: str,
+	content_type: Optional[str],
+	raw_bytes: bytes,
+	clean: bool,
+	quarantine_suspicious: bool,
+) -> Dict[str, Any]:
+	"""Parse, hash and persist an uploaded file. Blocking; run off the event loop."""
+	ext = filename.lower().rsplit(".", 1)[-1] if "." in filename else ""
 	raw_text = ""
 	raw_html = ""
 	parse_error: Optional[str] = None
 	try:
 		if ext in ("html", "htm"):
-			raw_html = raw_bytes.decode("utf-8", errors="replace")
+			raw_html = _decode_html(raw_bytes)
 		elif ext in ("txt", "md"):
 			raw_text = raw_bytes.decode("utf-8", errors="replace")
 			raw_html = _wrap_text_as_html(raw_text)
@@ -692,7 +1043,7 @@ async def ingestion_file_capture(
 	except Exception as exc:
 		raw_html = ""
 		parse_error = str(exc)
-		ObservabilityStore().record_event(
+		_get_obs().record_event(
 			domain=domain,
 			event="ingestion_file_capture",
 			status="error",
@@ -701,7 +1052,7 @@ async def ingestion_file_capture(
 			error=f"Failed to parse file: {exc}",
 		)
 
-	capture_ok = bool(raw_html.strip())
+	capture_ok = not _is_blank(raw_html)
 	quarantined = bool(quarantine_suspicious and not capture_ok)
 	if not quarantined:
 		quarantine_reason = None
@@ -710,19 +1061,21 @@ async def ingestion_file_capture(
 	else:
 		quarantine_reason = "empty_file"
 
-	root = _capture_root(domain)
-	root.mkdir(parents=True, exist_ok=True)
+	# HTML uploads are stored as received; anything wrapped is encoded once for both write and hash.
+	stored = raw_bytes if ext in ("html", "htm") and parse_error is None else raw_html.encode("utf-8")
+	_ensure_capture_root(domain)
 	raw_path = _capture_html_path(domain, source_id)
-	raw_path.write_text(raw_html, encoding="utf-8")
+	raw_path.write_bytes(stored)
+	_remember_capture_html(domain, source_id, stored)
 
-	content_hash = f"sha256:{_sha256_hex(raw_html)}"
+	content_hash = f"sha256:{_sha256_hex_bytes(stored)}"
 	content_signature = sign_content_hash(content_hash)
 	payload: Dict[str, Any] = {
 		"source_id": source_id,
 		"domain": domain,
 		"url": None,
 		"http_status": 200 if capture_ok else 400,
-		"headers": {"filename": filename, "content_type": file.content_type, "ext": ext},
+		"headers": {"filename": filename, "content_type": content_type, "ext": ext},
 		"raw_html_path": str(raw_path),
 		"content_hash": content_hash,
 		"content_signature": content_signature,
@@ -736,28 +1089,56 @@ async def ingestion_file_capture(
 		"db_error": None,
 	}
 	_save_capture(domain, source_id, payload)
-	ObservabilityStore().record_event(
+	_get_obs().record_event(
 		domain=domain,
 		event="ingestion_file_capture",
 		status="success" if capture_ok else "failed",
 		source_id=source_id,
-		filename=file.filename,
+		filename=filename,
 		quarantined=quarantined,
 	)
-	return IngestionRawCaptureResponse(**payload)
+	return payload
+
+@app.post("/ingestion/file-capture", response_model=IngestionRawCaptureResponse)
+async def ingestion_file_capture(
+	domain: str = Form(...),
+	source_id: str = Form(...),
+	file: UploadFile = File(...),
+	clean: bool = Form(False),
+	quarantine_suspicious: bool = Form(True),
+) -> IngestionRawCaptureResponse:
+	if _is_blank(domain):
+		raise HTTPException(status_code=400, detail="domain is required")
+	if _is_blank(source_id):
+		raise HTTPException(status_code=400, detail="source_id is required")
+	if not file:
+		raise HTTPException(status_code=400, detail="file is required")
+
+	raw_bytes = await file.read()
+	payload = await asyncio.to_thread(
+		_process_file_upload,
+		domain=domain,
+		source_id=source_id,
+		filename=(file.filename or "").strip(),
+		content_type=file.content_type,
+		raw_bytes=raw_bytes,
+		clean=clean,
+		quarantine_suspicious=quarantine_suspicious,
+	)
+	return IngestionRawCaptureResponse.model_construct(**payload)
 
 
 @app.post("/ingestion/quarantine", response_model=IngestionRawCaptureResponse)
-def ingestion_quarantine(req: IngestionQuarantineRequest) -> IngestionRawCaptureResponse:
+async def ingestion_quarantine(req: IngestionQuarantineRequest) -> IngestionRawCaptureResponse:
 	try:
-		payload = _load_capture(req.domain, req.capture_id)
+		payload = await asyncio.to_thread(_load_capture, req.domain, req.capture_id)
 	except FileNotFoundError:
 		raise HTTPException(status_code=404, detail="capture not found")
 	payload["quarantined"] = True
 	payload["quarantine_reason"] = req.reason or "manual_quarantine"
 	payload["quarantined_at"] = _utc_now_iso()
-	_save_capture(req.domain, req.capture_id, payload)
-	ObservabilityStore().record_event(
+	await asyncio.to_thread(_save_capture, req.domain, req.capture_id, payload)
+	await _record_event(
 		domain=req.domain,
 		event="ingestion_quarantine",
 		status="success",
@@ -768,37 +1149,49 @@ def ingestion_quarantine(req: IngestionQuarantineRequest) -> IngestionRawCapture
 
 
 @app.get("/ingestion/{domain}/events")
-def ingestion_events(domain: str, limit: int = 100) -> Dict[str, Any]:
-	store = ObservabilityStore()
-	return {"domain": domain, "events": store.list_events(domain=domain, limit=limit)}
+async def ingestion_events(domain: str, limit: int = 100) -> Dict[str, Any]:
+	store = _get_obs()
+	events = await asyncio.to_thread(store.list_events, domain=domain, limit=limit)
+	return {"domain": domain, "events": events}
 
 
 @app.get("/ingestion/{domain}/metrics")
-def ingestion_metrics(domain: str, hours: int = 24) -> Dict[str, Any]:
-	store = ObservabilityStore()
-	return store.summarize(domain=domain, hours=hours)
+async def ingestion_metrics(domain: str, hours: int = 24) -> Dict[str, Any]:
+	store = _get_obs()
+	return await asyncio.to_thread(store.summarize, domain=domain, hours=hours)
 
 
 @app.get("/releases/{domain}")
 def list_releases(domain: str) -> Dict[str, Any]:
-	manager = ReleaseManager()
+	manager = _get_release_manager()
 	active = manager.get_active_release(domain)
 	releases_dir = manager.root / domain / "releases"
-	release_ids = []
-	if releases_dir.exists():
-		release_ids = sorted([p.name for p in releases_dir.iterdir() if p.is_dir()])
+	try:
+		# A directory's mtime changes whenever an entry is added or removed.
+		release_ids = list(_release_list_cache.get(releases_dir, lambda p: sorted(_iter_domain_dirs(p))))
+	except FileNotFoundError:
+		release_ids = []
 	return {"domain": domain, "active_release": active, "releases": release_ids}
 
-def _is_file_embedding_ref(ref: str) -> bool:
-	return isinstance(ref, str) and ref.startswith("file:") and bool(ref[len("file:") :])
-
-def _copy_rewrite_json(src: Path, dest: Path, patcher) -> None:
-	payload = json.loads(src.read_text(encoding="utf-8"))
+def _copy_rewrite_json(src: Path, dest: Path, patcher: Callable[[Dict[str, Any]], None]) -> None:
+	payload = jsonio.read_json(src)
 	if not isinstance(payload, dict):
 		raise ValueError("expected JSON object")
 	patcher(payload)
 	dest.parent.mkdir(parents=True, exist_ok=True)
-	dest.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+	jsonio.write_json(dest, payload)
+
+def _copy_embedding(kind: str, src: Path, dest: Path, patcher: Callable[[Dict[str, Any]], None]) -> None:
+	if kind == "f32":
+		# The vector bytes are scope-free; only the sidecar is rewritten.
+		dest.parent.mkdir(parents=True, exist_ok=True)
+		shutil.copyfile(src, dest)
+		_copy_rewrite_json(f32_sidecar_path(src), f32_sidecar_path(dest), patcher)
+	else:
+		_copy_rewrite_json(src, dest, patcher)
+
+# Merge copies are independent small-file reads/writes; overlap them on a thread pool.
+_MERGE_IO_WORKERS = 16
 
 def _merge_releases(
 	*,
@@ -821,80 +1214,122 @@ def _merge_releases(
 	target_embeddings_dir.mkdir(parents=True, exist_ok=True)
 	target_index_path.parent.mkdir(parents=True, exist_ok=True)
 
+	def _patch_canonical(obj: Dict[str, Any]) -> None:
+		obj["domain"] = domain
+		prov = obj.get("provenance")
+		if isinstance(prov, dict):
+			prov["release_id"] = target_release_id
+
+	def _patch_scope(obj: Dict[str, Any]) -> None:
+		obj["domain"] = domain
+		obj["release_id"] = target_release_id
+
+	# First pass: resolve everything serially (dedupe + existence checks); embedding
+	# copies then run on a thread pool and chunk/canonical rows land in one shard append each.
+	copies: List[Tuple[str, Path, Path, Callable[[Dict[str, Any]], None]]] = []
+	packed_store = PackedEmbeddingStore(root=embeddings_root)
 	merged_rows: Dict[str, Dict[str, Any]] = {}
+	merged_chunks: Dict[str, Dict[str, Any]] = {}
 	duplicates = 0
 
-	# Copy canonical artifacts (best-effort; not required for retrieval but useful for consistency)
+	# Merge canonical artifacts (best-effort; not required for retrieval but useful for consistency)
+	target_canonical_shard = target_canonical_dir / CANONICAL_SHARD_NAME
+	seen_canonical: set[str] = set()
+	if target_canonical_shard.exists():
+		seen_canonical.update(str(clo.get("id")) for clo in read_canonical(target_canonical_shard))
+	canonical_rows: List[Dict[str, Any]] = []
 	for src_rid in source_release_ids:
 		src_dir = canonical_root / domain / src_rid
 		if not src_dir.exists():
 			continue
+		src_objs: Dict[str, Dict[str, Any]] = {}
 		for p in src_dir.glob("*.json"):
-			dest = target_canonical_dir / p.name
-			if dest.exists():
+			payload = jsonio.read_json(p)
+			if isinstance(payload, dict):
+				src_objs[str(payload.get("id", p.stem))] = payload
+		src_shard = src_dir / CANONICAL_SHARD_NAME
+		if src_shard.exists():
+			for clo in read_canonical(src_shard):
+				src_objs[str(clo.get("id"))] = clo
+		for clo_id in sorted(src_objs):
+			if clo_id in seen_canonical:
 				continue
-			def _patch(obj: Dict[str, Any]) -> None:
-				obj["domain"] = domain
-				prov = obj.get("provenance")
-				if isinstance(prov, dict):
-					prov["release_id"] = target_release_id
-			_copy_rewrite_json(p, dest, _patch)
-
-	# Merge index rows and copy chunk + embedding artifacts
+			seen_canonical.add(clo_id)
+			clo = src_objs[clo_id]
+			_patch_canonical(clo)
+			canonical_rows.append(clo)
+
+	# Merge index rows and chunks; collect embedding copies
 	for src_rid in source_release_ids:
 		src_index_path = vector_root / domain / src_rid / "index.jsonl"
 		if not src_index_path.exists():
 			continue
-		for line in src_index_path.read_text(encoding="utf-8").splitlines():
-			line = line.strip()
-			if not line:
-				continue
-			row = json.loads(line)
+		src_chunks = load_release_chunks(domain, src_rid, storage_root=chunks_root)
+		# Upserts append to index.jsonl, so within one release the last row for a chunk_id wins.
+		src_rows: Dict[str, Dict[str, Any]] = {}
+		for row in jsonio.iter_jsonl(src_index_path):
 			if not isinstance(row, dict):
 				continue
 			chunk_id = str(row.get("chunk_id", "")).strip()
-			if not chunk_id:
-				continue
+			if chunk_id:
+				src_rows[chunk_id] = row
+		for chunk_id, row in src_rows.items():
 			if chunk_id in merged_rows:
 				duplicates += 1
 				continue
 
-			src_chunk_path = chunks_root / domain / src_rid / f"{chunk_id}.json"
-			if not src_chunk_path.exists():
-				raise FileNotFoundError(f"missing chunk file for {chunk_id} in release {src_rid}")
-			dest_chunk_path = target_chunks_dir / f"{chunk_id}.json"
-			def _patch_chunk(obj: Dict[str, Any]) -> None:
-				obj["domain"] = domain
-				obj["release_id"] = target_release_id
-			_copy_rewrite_json(src_chunk_path, dest_chunk_path, _patch_chunk)
+			chunk = src_chunks.get(chunk_id)
+			if chunk is None:
+				raise FileNotFoundError(f"missing chunk for {chunk_id} in release {src_rid}")
+			chunk = dict(chunk)
+			_patch_scope(chunk)
+			merged_chunks[chunk_id] = chunk
 
 			emb_ref = str(row.get("embedding_ref", "")).strip()
-			if not _is_file_embedding_ref(emb_ref):
-				raise ValueError(f"unsupported embedding_ref for {chunk_id}: {emb_ref}")
-			src_emb_path = Path(emb_ref[len("file:") :]).expanduser().resolve()
-			if not src_emb_path.exists():
-				raise FileNotFoundError(f"missing embedding file for {chunk_id}: {src_emb_path}")
-			dest_emb_path = target_embeddings_dir / src_emb_path.name
-			def _patch_emb(obj: Dict[str, Any]) -> None:
-				obj["domain"] = domain
-				obj["release_id"] = target_release_id
-			_copy_rewrite_json(src_emb_path, dest_emb_path, _patch_emb)
+			if parse_det_embedding_ref(emb_ref) is not None:
+				# Deterministic refs carry the vector themselves; nothing to copy.
+				new_emb_ref = emb_ref
+			elif parse_packed_embedding_ref(emb_ref) is not None:
+				# Packed rows are re-appended to the target release's matrix.
+				vec = load_embedding_vector(emb_ref)
+				new_emb_ref = packed_store.put(domain=domain, release_id=target_release_id, chunk_id=chunk_id, vector=vec)
+			else:
+				parsed_ref = parse_embedding_ref(emb_ref)
+				if parsed_ref is None:
+					raise ValueError(f"unsupported embedding_ref for {chunk_id}: {emb_ref}")
+				emb_kind, src_emb_path = parsed_ref
+				src_emb_path = src_emb_path.expanduser().resolve()
+				if not src_emb_path.exists():
+					raise FileNotFoundError(f"missing embedding file for {chunk_id}: {src_emb_path}")
+				dest_emb_path = target_embeddings_dir / src_emb_path.name
+				copies.append((emb_kind, src_emb_path, dest_emb_path, _patch_scope))
+				new_emb_ref = make_embedding_ref(emb_kind, dest_emb_path)
 
 			new_row = dict(row)
 			new_row["domain"] = domain
 			new_row["release_id"] = target_release_id
-			new_row["embedding_ref"] = f"file:{dest_emb_path.as_posix()}"
+			new_row["embedding_ref"] = new_emb_ref
 			merged_rows[chunk_id] = new_row
 
-	# Deterministic write order
-	lines = [json.dumps(merged_rows[k], ensure_ascii=False) for k in sorted(merged_rows.keys())]
-	target_index_path.write_text("\n".join(lines) + ("\n" if lines else ""), encoding="utf-8")
-	return {"rows_written": len(lines), "duplicates_skipped": duplicates, "source_releases": len(source_release_ids)}
+	if copies:
+		with ThreadPoolExecutor(max_workers=min(_MERGE_IO_WORKERS, len(copies))) as ex:
+			# list() drains the iterator so the first copy error propagates.
+			list(ex.map(lambda c: _copy_embedding(*c), copies))
+	jsonio.append_jsonl(target_canonical_shard, canonical_rows)
+	jsonio.append_jsonl(target_chunks_dir / CHUNKS_SHARD_NAME, (merged_chunks[k] for k in sorted(merged_chunks)))
+
+	# Deterministic write order; stream rows through one buffered handle instead of joining in memory.
+	dumps = jsonio.dumps
+	with target_index_path.open("wb", buffering=1 << 20) as f:
+		for k in sorted(merged_rows):
+			f.write(dumps(merged_rows[k]))
+			f.write(b"\n")
+	return {"rows_written": len(merged_rows), "duplicates_skipped": duplicates, "source_releases": len(source_release_ids)}
 
 
 @app.post("/releases/{domain}/merge", response_model=ReleaseMergeResponse)
-def merge_releases(domain: str, req: ReleaseMergeRequest) -> ReleaseMergeResponse:
-	if not domain or not domain.strip():
+async def merge_releases(domain: str, req: ReleaseMergeRequest) -> ReleaseMergeResponse:
+	if _is_blank(domain):
 		raise HTTPException(status_code=400, detail="domain is required")
 	source_release_ids = [str(x).strip() for x in (req.source_release_ids or []) if str(x).strip()]
 	if len(source_release_ids) < 2:
@@ -902,8 +1337,9 @@ def merge_releases(domain: str, req: ReleaseMergeRequest) -> ReleaseMergeRespons
 
 	target_release_id = (req.target_release_id or "").strip() or _generate_release_id(domain)
 
-	manager = ReleaseManager()
-	release_meta = manager.create_release(
+	manager = _get_release_manager()
+	release_meta = await asyncio.to_thread(
+		manager.create_release,
 		domain=domain,
 		release_id=target_release_id,
 		created_by=req.created_by,
@@ -911,8 +1347,13 @@ def merge_releases(domain: str, req: ReleaseMergeRequest) -> ReleaseMergeRespons
 	)
 
 	try:
-		summary = _merge_releases(domain=domain, source_release_ids=source_release_ids, target_release_id=target_release_id)
-		ObservabilityStore().record_event(
+		summary = await asyncio.to_thread(
+			_merge_releases,
+			domain=domain,
+			source_release_ids=source_release_ids,
+			target_release_id=target_release_id,
+		)
+		await _record_event(
 			domain=domain,
 			event="release_merge",
 			status="success",
@@ -921,7 +1362,7 @@ def merge_releases(domain: str, req: ReleaseMergeRequest) -> ReleaseMergeRespons
 			summary=summary,
 		)
 	except Exception as exc:
-		ObservabilityStore().record_event(
+		await _record_event(
 			domain=domain,
 			event="release_merge",
 			status="error",
@@ -942,7 +1383,7 @@ def merge_releases(domain: str, req: ReleaseMergeRequest) -> ReleaseMergeRespons
 
 @app.get("/releases/{domain}/audit")
 def release_audit(domain: str, limit: int = 100) -> Dict[str, Any]:
-	manager = ReleaseManager()
+	manager = _get_release_manager()
 	return {"domain": domain, "events": manager.list_audit(domain=domain, limit=limit)}
 
 
@@ -951,7 +1392,7 @@ def promote_release_compat(domain: str, body: Dict[str, Any]) -> Dict[str, Any]:
 	release_id = str(body.get("release_id") or "").strip()
 	if not release_id:
 		raise HTTPException(status_code=400, detail="release_id is required")
-	manager = ReleaseManager()
+	manager = _get_release_manager()
 	try:
 		event = manager.promote_release(
 			domain=domain,
@@ -959,7 +1400,7 @@ def promote_release_compat(domain: str, body: Dict[str, Any]) -> Dict[str, Any]:
 			promoted_by=body.get("promoted_by"),
 			reason=body.get("reason"),
 		)
-		ObservabilityStore().record_event(
+		_get_obs().record_event(
 			domain=domain,
 			event="release_promoted",
 			status="success",
@@ -978,7 +1419,7 @@ def promote_release_compat(domain: str, body: Dict[str, Any]) -> Dict[str, Any]:
 
 @app.post("/releases/{domain}/{release_id}/promote")
 def promote_release(domain: str, release_id: str, req: ReleasePromoteRequest) -> Dict[str, Any]:
-	manager = ReleaseManager()
+	manager = _get_release_manager()
 	try:
 		event = manager.promote_release(
 			domain=domain,
@@ -986,7 +1427,7 @@ def promote_release(domain: str, release_id: str, req: ReleasePromoteRequest) ->
 			promoted_by=req.promoted_by,
 			reason=req.reason,
 		)
-		ObservabilityStore().record_event(
+		_get_obs().record_event(
 			domain=domain,
 			event="release_promoted",
 			status="success",
@@ -999,10 +1440,11 @@ def promote_release(domain: str, release_id: str, req: ReleasePromoteRequest) ->
 
 
 @app.post("/retrieve")
-def retrieve(req: RetrieveRequest) -> Dict[str, Any]:
-	service = RetrievalService.from_env()
+async def retrieve(req: RetrieveRequest) -> Dict[str, Any]:
+	service = _get_retrieval_service()
 	try:
-		return service.query(
+		return await asyncio.to_thread(
+			service.query,
 			domain=req.domain,
 			query=req.query,
 			filters=req.filters,
@@ -1016,5 +1458,5 @@ def retrieve(req: RetrieveRequest) -> Dict[str, Any]:
 
 
 @app.post("/retrieval/query")
-def retrieve_compat(req: RetrieveRequest) -> Dict[str, Any]:
-	return retrieve(req)
+async def retrieve_compat(req: RetrieveRequest) -> Dict[str, Any]:
+	return await retrieve(req)
@@ -13,18 +13,20 @@ Schema target: docs/schemas/canonical_object.json
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
+from operator import itemgetter
 import hashlib
-import json
 
 from env import get_canonical_root
+import jsonio
 
 DEFAULT_CANONICAL_ROOT = get_canonical_root()
 
+# One NDJSON shard per <domain>/<release_id>; re-runs append, readers keep the last line per id.
+CANONICAL_SHARD_NAME = "canonical.ndjson"
+
 def _sha256_hex(text: str) -> str:
-	h = hashlib.sha256()
-	h.update(text.encode("utf-8"))
-	return h.hexdigest()
+	return hashlib.sha256(text.encode("utf-8")).hexdigest()
 
 def _canonical_id(domain: str, release_id: str, source_id: str, section_id: str) -> str:
 	base = f"{domain}|{release_id}|{source_id}|{section_id}"
@@ -42,6 +44,37 @@ def _body_from_clean_text(clean_text: str) -> List[str]:
 	parts = [p.strip() for p in clean_text.split("\n\n")]
 	return [p for p in parts if p]
 
+def canonical_object_from_section(
+	section: Dict[str, Any],
+	*,
+	domain: str,
+	source_id: str,
+	release_id: str,
+) -> Dict[str, Any]:
+	section_id = str(section.get("section_id", ""))
+	return {
+		"id": _canonical_id(domain=domain, release_id=release_id, source_id=source_id, section_id=section_id),
+		"domain": domain,
+		"title": _title_from_section(section),
+		"body": _body_from_clean_text(str(section.get("clean_text", ""))),
+		"concepts": [],
+		"provenance": {
+			"source_id": source_id,
+			"release_id": release_id,
+		},
+	}
+
+def persist_canonical(clos: List[Dict[str, Any]], *, domain: str, release_id: str, storage_root: Optional[Path] = None) -> Optional[Path]:
+	"""Append CLOs to the release shard; returns the shard path (None when nothing was written)."""
+	if not clos:
+		return None
+	base = DEFAULT_CANONICAL_ROOT if storage_root is None else Path(storage_root)
+	dest_dir = base / domain / release_id
+	dest_dir.mkdir(parents=True, exist_ok=True)
+	shard = dest_dir / CANONICAL_SHARD_NAME
+	jsonio.append_jsonl(shard, clos)
+	return shard
+
 def canonicalize_sections(
 	sections: List[Dict[str, Any]],
 	*,
@@ -51,34 +84,19 @@ def canonicalize_sections(
 	storage_root: Optional[Path] = None,
 	persist: bool = False,
 ) -> List[Dict[str, Any]]:
-	if storage_root is None:
-		base = DEFAULT_CANONICAL_ROOT
-	else:
-		base = Path(storage_root)
-	out: List[Dict[str, Any]] = []
-	ordered = sorted(sections, key=lambda s: str(s.get("section_id", "")))
-	for sec in ordered:
-		section_id = str(sec.get("section_id", ""))
-		clean_text = str(sec.get("clean_text", ""))
-		clo_id = _canonical_id(domain=domain, release_id=release_id, source_id=source_id, section_id=section_id)
-		title = _title_from_section(sec)
-		body = _body_from_clean_text(clean_text)
-		clo: Dict[str, Any] = {
-			"id": clo_id,
-			"domain": domain,
-			"title": title,
-			"body": body,
-			"concepts": [],
-			"provenance": {
-				"source_id": source_id,
-				"release_id": release_id,
-			},
-		}
-		out.append(clo)
-		if persist:
-			dest_dir = base / domain / release_id
-			dest_dir.mkdir(parents=True, exist_ok=True)
-			dest_path = dest_dir / f"{clo_id}.json"
-			dest_path.write_text(json.dumps(clo, ensure_ascii=False, indent=2), encoding="utf-8")
+	# Decorate once and sort on the precomputed key (stable, so ties keep input order).
+	keyed = [(str(s.get("section_id", "")), s) for s in sections]
+	keyed.sort(key=itemgetter(0))
+	out = [
+		canonical_object_from_section(sec, domain=domain, source_id=source_id, release_id=release_id)
+		for _, sec in keyed
+	]
+	if persist:
+		persist_canonical(out, domain=domain, release_id=release_id, storage_root=storage_root)
 	return out
+
+def read_canonical(path: Path) -> Iterator[Dict[str, Any]]:
+	for row in jsonio.iter_jsonl(path):
+		if isinstance(row, dict):
+			yield row
 # Moved from ingestion/canonicalizer.py
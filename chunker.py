@@ -14,23 +14,37 @@ Design goals:
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import chain
+from operator import itemgetter
 import hashlib
-import json
+import multiprocessing
+import os
 import re
 
 from env import get_chunks_root
+import jsonio
 
 DEFAULT_CHUNKS_ROOT = get_chunks_root()
 
-def _sha256_hex(text: str) -> str:
-	h = hashlib.sha256()
-	h.update(text.encode("utf-8"))
-	return h.hexdigest()
+# One NDJSON shard per <domain>/<release_id>; re-runs append, readers keep the last line per chunk_id.
+CHUNKS_SHARD_NAME = "chunks.ndjson"
+
+def _chunk_id_prefix(domain: str, release_id: str, clo_id: str) -> "hashlib._Hash":
+	return hashlib.sha256(f"{domain}|{release_id}|{clo_id}|".encode("utf-8"))
 
-def _chunk_id(domain: str, release_id: str, clo_id: str, chunk_index: int, text: str) -> str:
-	base = f"{domain}|{release_id}|{clo_id}|{chunk_index}|{text}"
-	return f"chk_{_sha256_hex(base)[:24]}"
+def _chunk_id(domain: str, release_id: str, clo_id: str, chunk_index: int, text: str, *, prefix: Optional["hashlib._Hash"] = None) -> str:
+	"""sha256 of "domain|release_id|clo_id|index|text", fed piecewise.
+
+	Pass `prefix` (from `_chunk_id_prefix`) to reuse the per-CLO part across chunks.
+	"""
+	h = prefix.copy() if prefix is not None else _chunk_id_prefix(domain, release_id, clo_id)
+	h.update(b"%d|" % chunk_index)
+	h.update(text.encode("utf-8"))
+	return f"chk_{h.hexdigest()[:24]}"
 
 _SENTENCE_SPLIT_RE = re.compile(r"(?<=[\.!\?])\s+")
 
@@ -41,20 +55,19 @@ def _split_long_paragraph(text: str, max_chars: int) -> List[str]:
 	sentences = [s.strip() for s in _SENTENCE_SPLIT_RE.split(t) if s.strip()]
 	if len(sentences) <= 1:
 		return [t[i : i + max_chars].strip() for i in range(0, len(t), max_chars) if t[i : i + max_chars].strip()]
-	parts: List[str] = []
-	cur: List[str] = []
-	cur_len = 0
+	# Greedy packing via prefix sums: prefix[k] is the length of sentences[:k] joined
+	# with single spaces, plus one, so sentences[i:j] fits when
+	# prefix[j] - prefix[i] - 1 <= max_chars. bisect finds the largest such j.
+	prefix = [0]
 	for s in sentences:
-		add = (" " if cur else "") + s
-		if cur and (cur_len + len(add) > max_chars):
-			parts.append("".join(cur).strip())
-			cur = [s]
-			cur_len = len(s)
-		else:
-			cur.append(add)
-			cur_len += len(add)
-	if cur:
-		parts.append("".join(cur).strip())
+		prefix.append(prefix[-1] + len(s) + 1)
+	parts: List[str] = []
+	i = 0
+	n = len(sentences)
+	while i < n:
+		j = max(i + 1, bisect_right(prefix, prefix[i] + max_chars + 1) - 1)
+		parts.append(" ".join(sentences[i:j]))
+		i = j
 	final: List[str] = []
 	for p in parts:
 		if len(p) <= max_chars:
@@ -63,6 +76,8 @@ def _split_long_paragraph(text: str, max_chars: int) -> List[str]:
 			final.extend([p[i : i + max_chars].strip() for i in range(0, len(p), max_chars) if p[i : i + max_chars].strip()])
 	return final
 
+_CHUNK_EXTRA_FIELDS = ("concept_id", "level", "graph_id", "graph_version", "dataset_version", "index_version")
+
 def chunk_canonical_object(
 	clo: Dict[str, Any],
 	*,
@@ -80,64 +95,46 @@ def chunk_canonical_object(
 	units: List[str] = []
 	for p in paragraphs:
 		units.extend(_split_long_paragraph(p, max_chars=max_chars))
-	chunks: List[Dict[str, Any]] = []
-	cur: List[str] = []
-	cur_len = 0
-	chunk_index = 0
-	def _opt_str_field(key: str) -> Optional[str]:
+	# Optional metadata copied onto every chunk, in this key order.
+	extra: Dict[str, str] = {}
+	for key in _CHUNK_EXTRA_FIELDS:
 		v = clo.get(key)
 		if isinstance(v, str) and v.strip():
-			return v.strip()
-		return None
-	concept_id = _opt_str_field("concept_id")
-	level = _opt_str_field("level")
-	graph_id = _opt_str_field("graph_id")
-	graph_version = _opt_str_field("graph_version")
-	dataset_version = _opt_str_field("dataset_version")
-	index_version = _opt_str_field("index_version")
-	def flush() -> None:
-		nonlocal cur, cur_len, chunk_index
-		if not cur:
-			return
-		text = "\n\n".join(cur).strip()
-		if not text:
-			cur = []
-			cur_len = 0
-			return
-		cid = _chunk_id(domain=domain, release_id=release_id, clo_id=clo_id, chunk_index=chunk_index, text=text)
-		ch: Dict[str, Any] = {
-			"chunk_id": cid,
-			"domain": domain,
-			"release_id": release_id,
-			"text": text,
-		}
-		if concept_id:
-			ch["concept_id"] = concept_id
-		if level:
-			ch["level"] = level
-		if graph_id:
-			ch["graph_id"] = graph_id
-		if graph_version:
-			ch["graph_version"] = graph_version
-		if dataset_version:
-			ch["dataset_version"] = dataset_version
-		if index_version:
-			ch["index_version"] = index_version
-		chunks.append(ch)
-		chunk_index += 1
-		cur = []
-		cur_len = 0
+			extra[key] = v.strip()
+	id_prefix = _chunk_id_prefix(domain, release_id, clo_id)
+	# Greedily pack units into groups of at most max_chars (joined by blank lines).
+	groups: List[List[str]] = []
+	cur: List[str] = []
+	cur_len = 0
 	for u in units:
 		if not u:
 			continue
 		add_len = len(u) + (2 if cur else 0)
 		if cur and (cur_len + add_len > max_chars):
-			flush()
+			groups.append(cur)
+			cur = []
+			cur_len = 0
 		cur.append(u)
 		cur_len += add_len
-	flush()
+	if cur:
+		groups.append(cur)
+	chunks: List[Dict[str, Any]] = []
+	for group in groups:
+		text = "\n\n".join(group).strip()
+		if not text:
+			continue
+		cid = _chunk_id(domain, release_id, clo_id, len(chunks), text, prefix=id_prefix)
+		ch: Dict[str, Any] = {"chunk_id": cid, "domain": domain, "release_id": release_id, "text": text}
+		if extra:
+			ch.update(extra)
+		chunks.append(ch)
 	return chunks
 
+# Chunking costs ~0.1ms per CLO; below a few thousand, starting a pool and pickling
+# CLOs to it costs more than the chunking itself.
+_PARALLEL_MIN_CLOS = 4096
+_PARALLEL_CHUNKSIZE = 64
+
 def chunk_canonical_objects(
 	clos: List[Dict[str, Any]],
 	*,
@@ -145,23 +142,54 @@ def chunk_canonical_objects(
 	release_id: str,
 	max_chars: int = 800,
 ) -> List[Dict[str, Any]]:
-	ordered = sorted(clos, key=lambda c: str(c.get("id", "")))
+	keyed = [(str(c.get("id", "")), c) for c in clos]
+	keyed.sort(key=itemgetter(0))
+	ordered = [c for _, c in keyed]
+	# Large releases fan out across cores. Workers (e.g. a batch-ingestion pool) stay
+	# serial so pools never nest.
+	if len(ordered) >= _PARALLEL_MIN_CLOS and (os.cpu_count() or 1) > 1 and multiprocessing.parent_process() is None:
+		fn = partial(chunk_canonical_object, domain=domain, release_id=release_id, max_chars=max_chars)
+		with ProcessPoolExecutor() as ex:
+			return list(chain.from_iterable(ex.map(fn, ordered, chunksize=_PARALLEL_CHUNKSIZE)))
 	out: List[Dict[str, Any]] = []
 	for clo in ordered:
 		out.extend(chunk_canonical_object(clo, domain=domain, release_id=release_id, max_chars=max_chars))
 	return out
 
 def persist_chunks(chunks: List[Dict[str, Any]], storage_root: Optional[Path] = None) -> List[str]:
+	"""Append chunks to their release shard(s); returns the shard paths written."""
 	base = DEFAULT_CHUNKS_ROOT if storage_root is None else Path(storage_root)
-	written: List[str] = []
+	groups: Dict[tuple[str, str], List[Dict[str, Any]]] = {}
 	for ch in chunks:
-		domain = str(ch.get("domain"))
-		release_id = str(ch.get("release_id"))
-		chunk_id = str(ch.get("chunk_id"))
+		groups.setdefault((str(ch.get("domain")), str(ch.get("release_id"))), []).append(ch)
+	written: List[str] = []
+	for (domain, release_id), rows in groups.items():
 		dest_dir = base / domain / release_id
 		dest_dir.mkdir(parents=True, exist_ok=True)
-		dest = dest_dir / f"{chunk_id}.json"
-		dest.write_text(json.dumps(ch, ensure_ascii=False, indent=2), encoding="utf-8")
+		dest = dest_dir / CHUNKS_SHARD_NAME
+		jsonio.append_jsonl(dest, rows)
 		written.append(str(dest.as_posix()))
 	return written
+
+def read_chunks(path: Path) -> Iterator[Dict[str, Any]]:
+	for row in jsonio.iter_jsonl(path):
+		if isinstance(row, dict):
+			yield row
+
+def load_release_chunks(domain: str, release_id: str, storage_root: Optional[Path] = None) -> Dict[str, Dict[str, Any]]:
+	"""chunk_id -> chunk for one release (last shard line wins; legacy per-chunk files fill gaps)."""
+	base = DEFAULT_CHUNKS_ROOT if storage_root is None else Path(storage_root)
+	rel_dir = base / domain / release_id
+	out: Dict[str, Dict[str, Any]] = {}
+	if not rel_dir.is_dir():
+		return out
+	for p in rel_dir.glob("*.json"):
+		payload = jsonio.read_json(p)
+		if isinstance(payload, dict):
+			out[str(payload.get("chunk_id", p.stem))] = payload
+	shard = rel_dir / CHUNKS_SHARD_NAME
+	if shard.exists():
+		for ch in read_chunks(shard):
+			out[str(ch.get("chunk_id"))] = ch
+	return out
 # Moved from ingestion/chunker.py
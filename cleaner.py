@@ -4,7 +4,7 @@ Provides functions to clean raw HTML into normalized plain text for downstream
 stages. Implemented without heavy external dependencies to remain CI-friendly.
 
 Functions:
-- clean_html_text(html_text: str) -> str
+- clean_html_text(html_text: str | bytes) -> str
 - clean_html_file(path: Path) -> str
 """
 from __future__ import annotations
@@ -12,34 +12,35 @@ from __future__ import annotations
 from pathlib import Path
 import re
 import html
-from typing import Optional
+from typing import Optional, Union
 
-# Patterns to remove script/style blocks
-_RE_SCRIPT = re.compile(r"<script[\s\S]*?<\/script>", flags=re.IGNORECASE)
-_RE_STYLE = re.compile(r"<style[\s\S]*?<\/style>", flags=re.IGNORECASE)
-# Strip all tags
-_RE_TAGS = re.compile(r"<[^>]+>")
+# Script/style blocks and all other tags, stripped in one left-to-right scan
+_RE_STRIP = re.compile(r"<script[\s\S]*?<\/script>|<style[\s\S]*?<\/style>|<[^>]+>", flags=re.IGNORECASE)
+# Same scan over undecoded UTF-8; markup is ASCII, so spans match the str pattern's
+_RE_STRIP_BYTES = re.compile(_RE_STRIP.pattern.encode("ascii"), flags=re.IGNORECASE)
+# Whitespace run directly before punctuation (e.g. turn "word !" into "word!")
+_RE_SPACE_BEFORE_PUNC = re.compile(r"\s+(?=[\.,!\?:;])")
 # Collapse whitespace
 _RE_WS = re.compile(r"\s+")
-# Remove space before punctuation (e.g. turn "word !" into "word!")
-_RE_SPACE_BEFORE_PUNC = re.compile(r"\s+([\.,!\?:;])")
 
-def clean_html_text(html_text: Optional[str]) -> str:
+def clean_html_text(html_text: Optional[Union[str, bytes]]) -> str:
+	"""Accepts str or raw UTF-8 bytes; bytes are stripped before the (single) decode."""
 	if not html_text:
 		return ""
-	t = html_text
-	t = _RE_SCRIPT.sub(" ", t)
-	t = _RE_STYLE.sub(" ", t)
-	t = _RE_TAGS.sub(" ", t)
+	if isinstance(html_text, (bytes, bytearray)):
+		t = _RE_STRIP_BYTES.sub(b" ", html_text).decode("utf-8", errors="replace")
+	else:
+		t = _RE_STRIP.sub(" ", html_text)
 	t = html.unescape(t)
+	# Dropping pre-punctuation runs first gives the same result as collapsing then
+	# removing the single space, without a callback.
+	t = _RE_SPACE_BEFORE_PUNC.sub("", t)
 	t = _RE_WS.sub(" ", t)
-	t = _RE_SPACE_BEFORE_PUNC.sub(r"\1", t)
 	return t.strip()
 
 def clean_html_file(path: Path) -> str:
 	p = Path(path)
 	if not p.exists():
 		raise FileNotFoundError(str(p))
-	raw = p.read_text(encoding="utf-8")
-	return clean_html_text(raw)
+	return clean_html_text(p.read_bytes())
 # Moved from ingestion/cleaner.py
@@ -11,7 +11,8 @@ Evidence offsets are character offsets into the *raw HTML* input.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+from itertools import chain
 import hashlib
 import re
 
@@ -20,32 +21,43 @@ from cleaner import clean_html_text
 _CONTAINER_TAGS = ("nav", "footer", "header", "aside")
 
 def _sha256_hex(text: str) -> str:
-	h = hashlib.sha256()
-	h.update(text.encode("utf-8"))
-	return h.hexdigest()
+	return hashlib.sha256(text.encode("utf-8")).hexdigest()
 
 def _make_section_id(domain: str, source_hash: str, kind: str, title: Optional[str], clean_text: str) -> str:
 	base = f"{domain}|{source_hash}|{kind}|{title or ''}|{clean_text}"
 	return f"sec_{_sha256_hex(base)[:24]}"
 
+def _blank_keep_newlines(segment: str) -> str:
+	return "\n".join(" " * len(line) for line in segment.split("\n"))
+
 def _mask_ranges(raw_html: str, ranges: List[Tuple[int, int]]) -> str:
+	# Splice blanked slices between untouched ones; offsets (and newlines) are preserved.
 	if not ranges:
 		return raw_html
-	chars = list(raw_html)
-	for start, end in ranges:
-		start = max(0, start)
-		end = min(len(chars), end)
-		for i in range(start, end):
-			if chars[i] != "\n":
-				chars[i] = " "
-	return "".join(chars)
+	n = len(raw_html)
+	parts: List[str] = []
+	pos = 0
+	for start, end in sorted(ranges):
+		start = max(pos, start)
+		end = min(n, end)
+		if start >= end:
+			continue
+		parts.append(raw_html[pos:start])
+		parts.append(_blank_keep_newlines(raw_html[start:end]))
+		pos = end
+	parts.append(raw_html[pos:])
+	return "".join(parts)
+
+# All container tags in one scan. The zero-width lookahead reports a match at every
+# opening tag, so overlapping containers of different kinds are found just as
+# separate per-tag scans would find them; \2 pairs each opener with its own closer.
+_CONTAINER_RE = re.compile(
+	r"(?=(<\s*(" + "|".join(_CONTAINER_TAGS) + r")[^>]*>[\s\S]*?<\s*/\s*\2\s*>))",
+	re.IGNORECASE,
+)
 
 def _find_container_ranges(raw_html: str) -> List[Tuple[int, int]]:
-	ranges: List[Tuple[int, int]] = []
-	for tag in _CONTAINER_TAGS:
-		pattern = re.compile(rf"<\s*{tag}[^>]*>[\s\S]*?<\s*/\s*{tag}\s*>", re.IGNORECASE)
-		for m in pattern.finditer(raw_html):
-			ranges.append((m.start(), m.end()))
+	ranges = [(m.start(), m.start() + len(m.group(1))) for m in _CONTAINER_RE.finditer(raw_html)]
 	if not ranges:
 		return []
 	ranges.sort()
@@ -77,21 +89,16 @@ def _guess_kind(title: Optional[str], text: str) -> str:
 		return "example"
 	return "explanation"
 
+_BOILERPLATE_TEXT = frozenset({
+	"home",
+	"docs",
+	"edit this page",
+	"last updated",
+})
+
 def _is_boilerplate(clean_text: str) -> bool:
 	s = clean_text.strip().lower()
-	if not s:
-		return True
-	boiler = {
-		"home",
-		"docs",
-		"edit this page",
-		"last updated",
-	}
-	if s in boiler:
-		return True
-	if len(s) < 3:
-		return True
-	return False
+	return len(s) < 3 or s in _BOILERPLATE_TEXT
 
 @dataclass(frozen=True)
 class _Block:
@@ -106,83 +113,66 @@ def extract_blocks(raw_html: str) -> List[_Block]:
 	mask_ranges = _find_container_ranges(raw_html)
 	masked = _mask_ranges(raw_html, mask_ranges)
 	blocks: List[_Block] = []
+	# Keyed on the text itself: str caches its hash, and a truncated digest could collide.
+	seen: Set[str] = set()
 	for m in _BLOCK_RE.finditer(masked):
-		tag = m.group(1).lower()
-		inner = m.group(2) or ""
-		clean = clean_html_text(inner)
-		if _is_boilerplate(clean):
-			continue
-		blocks.append(_Block(tag=tag, start=m.start(), end=m.end(), text=clean))
-	seen = set()
-	deduped: List[_Block] = []
-	for b in blocks:
-		key = b.text
-		if key in seen:
+		clean = clean_html_text(m.group(2) or "")
+		if clean in seen or _is_boilerplate(clean):
 			continue
-		seen.add(key)
-		deduped.append(b)
-	return deduped
+		seen.add(clean)
+		blocks.append(_Block(tag=m.group(1).lower(), start=m.start(), end=m.end(), text=clean))
+	return blocks
 
-def distill_sections_from_html(raw_html: str, domain: str, source_hash: str) -> List[Dict[str, Any]]:
+def iter_sections_from_html(raw_html: str, domain: str, source_hash: str) -> Iterator[Dict[str, Any]]:
+	"""Yield sections as each heading closes the previous one (see distill_sections_from_html)."""
 	blocks = extract_blocks(raw_html)
-	sections: List[Dict[str, Any]] = []
-	current_title: Optional[str] = None
-	current_evidence: List[Dict[str, Any]] = []
-	current_parts: List[str] = []
-	def flush() -> None:
-		nonlocal current_title, current_evidence, current_parts
-		if not current_parts:
-			current_title = None
-			current_evidence = []
-			current_parts = []
-			return
-		clean_text = "\n\n".join(current_parts).strip()
-		if not clean_text:
-			current_title = None
-			current_evidence = []
-			current_parts = []
-			return
-		kind = _guess_kind(current_title, clean_text)
-		section_id = _make_section_id(domain=domain, source_hash=source_hash, kind=kind, title=current_title, clean_text=clean_text)
-		sec: Dict[str, Any] = {
-			"section_id": section_id,
-			"domain": domain,
-			"kind": kind,
-			"title": current_title,
-			"clean_text": clean_text,
-			"evidence": current_evidence,
-		}
-		if current_title is None:
-			sec.pop("title")
-		sections.append(sec)
-		current_title = None
-		current_evidence = []
-		current_parts = []
-	for b in blocks:
-		if b.tag.startswith("h"):
-			flush()
-			current_title = b.text
-			current_evidence.append({"source_hash": source_hash, "offset": [b.start, b.end]})
+	emitted = False
+	title: Optional[str] = None
+	evidence: List[Dict[str, Any]] = []
+	parts: List[str] = []
+	# A trailing None flushes the last open section.
+	for b in chain(blocks, (None,)):
+		if b is not None and not b.tag.startswith("h"):
+			parts.append(b.text)
+			evidence.append({"source_hash": source_hash, "offset": [b.start, b.end]})
 			continue
-		current_parts.append(b.text)
-		current_evidence.append({"source_hash": source_hash, "offset": [b.start, b.end]})
-	flush()
-	if not sections and blocks:
-		clean_text = "\n\n".join([b.text for b in blocks]).strip()
-		kind = _guess_kind(None, clean_text)
-		section_id = _make_section_id(domain=domain, source_hash=source_hash, kind=kind, title=None, clean_text=clean_text)
-		sections = [
-			{
-				"section_id": section_id,
+		clean_text = "\n\n".join(parts).strip() if parts else ""
+		if clean_text:
+			kind = _guess_kind(title, clean_text)
+			sec: Dict[str, Any] = {
+				"section_id": _make_section_id(domain=domain, source_hash=source_hash, kind=kind, title=title, clean_text=clean_text),
 				"domain": domain,
 				"kind": kind,
+				"title": title,
 				"clean_text": clean_text,
-				"evidence": [{"source_hash": source_hash, "offset": [b.start, b.end]} for b in blocks],
+				"evidence": evidence,
 			}
-		]
-	return sections
+			if title is None:
+				sec.pop("title")
+			emitted = True
+			yield sec
+		title = None
+		evidence = []
+		parts = []
+		if b is not None:
+			title = b.text
+			evidence.append({"source_hash": source_hash, "offset": [b.start, b.end]})
+	if not emitted and blocks:
+		clean_text = "\n\n".join([b.text for b in blocks]).strip()
+		kind = _guess_kind(None, clean_text)
+		yield {
+			"section_id": _make_section_id(domain=domain, source_hash=source_hash, kind=kind, title=None, clean_text=clean_text),
+			"domain": domain,
+			"kind": kind,
+			"clean_text": clean_text,
+			"evidence": [{"source_hash": source_hash, "offset": [b.start, b.end]} for b in blocks],
+		}
+
+def distill_sections_from_html(raw_html: str, domain: str, source_hash: str) -> List[Dict[str, Any]]:
+	return list(iter_sections_from_html(raw_html, domain=domain, source_hash=source_hash))
 
 def distill_sections_from_file(raw_html_path: str, domain: str, source_hash: str) -> List[Dict[str, Any]]:
-	raw = open(raw_html_path, "r", encoding="utf-8").read()
+	with open(raw_html_path, "rb") as f:
+		raw = f.read().decode("utf-8", errors="replace")
 	return distill_sections_from_html(raw, domain=domain, source_hash=source_hash)
 # Moved from ingestion/distiller.py
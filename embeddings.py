@@ -6,17 +6,38 @@ embedding store. For tests (and deterministic runs), a hash-based embedding
 provider is included.
 
 Now also includes an OllamaEmbeddingProvider that uses the local Ollama HTTP API.
+
+Stored embeddings are either:
+  - `file+f32:<path>.f32`: little-endian float32 vector, with a `<path>.json`
+    sidecar holding {"chunk_id", "domain", "release_id", "dim", "dtype"} (default)
+  - `file:<path>.json`: legacy JSON payload with the vector inline
+  - `packed:<dir>/vectors.f32#row=<i>&dim=<n>`: row i of a per-release float32
+    matrix, with the row's chunk_id on line i of `<dir>/chunk_ids.txt`
+  - `det:sha256:<hex>:dim=<n>`: a DeterministicHashEmbeddingProvider vector,
+    recomputed from the digest bytes on read; nothing is written to disk
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Protocol, Sequence
+from array import array
+from typing import Any, Dict, List, Optional, Protocol, Sequence, Tuple
 import hashlib
+import http.client
 import json
-import urllib.request
-import urllib.error
+import os
+import re
+import sys
+import tempfile
+import threading
+import urllib.parse
+
+try:
+    import fcntl  # type: ignore
+except ModuleNotFoundError:
+    fcntl = None  # type: ignore[assignment]
 
 
 class EmbeddingProvider(Protocol):
@@ -30,14 +51,130 @@ class EmbeddingStore(Protocol):
 
 
 from env import get_embeddings_root
+import jsonio
 
 DEFAULT_EMBEDDINGS_ROOT = get_embeddings_root()
 
+JSON_REF_PREFIX = "file:"
+F32_REF_PREFIX = "file+f32:"
+DET_REF_PREFIX = "det:"
+PACKED_REF_PREFIX = "packed:"
+PACKED_VECTORS_NAME = "vectors.f32"
+PACKED_IDS_NAME = "chunk_ids.txt"
+
+_PACKED_REF_RE = re.compile(r"packed:(.+)#row=(0|[1-9][0-9]*)&dim=([1-9][0-9]*)")
+
+_DET_REF_RE = re.compile(r"det:sha256:((?:[0-9a-f]{2}){1,32}):dim=([1-9][0-9]*)")
+
+
+def parse_embedding_ref(embedding_ref: str) -> Optional[Tuple[str, Path]]:
+    """Return ("f32" | "json", path) for a supported embedding_ref, else None."""
+    ref = str(embedding_ref or "")
+    if ref.startswith(F32_REF_PREFIX) and len(ref) > len(F32_REF_PREFIX):
+        return "f32", Path(ref[len(F32_REF_PREFIX) :])
+    if ref.startswith(JSON_REF_PREFIX) and len(ref) > len(JSON_REF_PREFIX):
+        return "json", Path(ref[len(JSON_REF_PREFIX) :])
+    return None
+
+
+def make_embedding_ref(kind: str, path: Path) -> str:
+    return f"{F32_REF_PREFIX if kind == 'f32' else JSON_REF_PREFIX}{path.as_posix()}"
+
+
+def f32_sidecar_path(path: Path) -> Path:
+    return path.with_suffix(".json")
+
+
+def read_f32_bytes(path: Path) -> bytes:
+    """Raw little-endian float32 payload of a `file+f32:` embedding (os.open/os.read, no file object)."""
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        parts = []
+        while True:
+            part = os.read(fd, 1 << 16)
+            if not part:
+                break
+            parts.append(part)
+    finally:
+        os.close(fd)
+    return parts[0] if len(parts) == 1 else b"".join(parts)
+
+
+def read_f32_vector(path: Path) -> List[float]:
+    vec = array("f")
+    vec.frombytes(read_f32_bytes(path))
+    if sys.byteorder != "little":
+        vec.byteswap()
+    return vec.tolist()
+
+
+def parse_det_embedding_ref(embedding_ref: str) -> Optional[Tuple[bytes, int]]:
+    """Return (digest bytes, dim) for a well-formed `det:` ref, else None."""
+    m = _DET_REF_RE.fullmatch(str(embedding_ref or ""))
+    if m is None:
+        return None
+    key, dim = bytes.fromhex(m.group(1)), int(m.group(2))
+    return (key, dim) if len(key) == min(dim, 32) else None
+
+
+def parse_packed_embedding_ref(embedding_ref: str) -> Optional[Tuple[Path, int, int]]:
+    """Return (vectors.f32 path, row, dim) for a `packed:` ref, else None."""
+    m = _PACKED_REF_RE.fullmatch(str(embedding_ref or ""))
+    if m is None:
+        return None
+    return Path(m.group(1)), int(m.group(2)), int(m.group(3))
+
+
+def make_packed_embedding_ref(path: Path, row: int, dim: int) -> str:
+    return f"{PACKED_REF_PREFIX}{path.as_posix()}#row={row}&dim={dim}"
+
+
+def read_packed_vector(path: Path, row: int, dim: int) -> List[float]:
+    size = dim * 4
+    with open(path, "rb") as fh:
+        fh.seek(row * size)
+        data = fh.read(size)
+    if len(data) != size:
+        raise ValueError(f"{path} has no row {row} of dim {dim}")
+    vec = array("f")
+    vec.frombytes(data)
+    if sys.byteorder != "little":
+        vec.byteswap()
+    return vec.tolist()
+
+
+def load_embedding_vector(embedding_ref: str) -> List[float]:
+    """Load the vector behind an embedding_ref ([] for unknown schemes)."""
+    det = parse_det_embedding_ref(embedding_ref)
+    if det is not None:
+        return _det_vector(*det)
+    packed = parse_packed_embedding_ref(embedding_ref)
+    if packed is not None:
+        return read_packed_vector(*packed)
+    parsed = parse_embedding_ref(embedding_ref)
+    if parsed is None:
+        return []
+    kind, path = parsed
+    if kind == "f32":
+        return read_f32_vector(path)
+    vec = jsonio.read_json(path).get("vector")
+    if isinstance(vec, list):
+        return [float(x) for x in vec]
+    return []
+
 
 def _sha256_hex(text: str) -> str:
-    h = hashlib.sha256()
-    h.update(text.encode("utf-8"))
-    return h.hexdigest()
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+# byte -> (b / 255) * 2 - 1, computed once with the same float ops as before.
+_BYTE_TO_UNIT = tuple((b / 255.0) * 2.0 - 1.0 for b in range(256))
+_UNIT_TO_BYTE = {v: b for b, v in enumerate(_BYTE_TO_UNIT)}
+
+
+def _det_vector(key: bytes, dim: int) -> List[float]:
+    # Digest bytes repeat when dim > 32.
+    return list(map(_BYTE_TO_UNIT.__getitem__, (key * -(-dim // len(key)))[:dim]))
 
 
 @dataclass
@@ -50,15 +187,8 @@ class DeterministicHashEmbeddingProvider:
     dim: int = 16
 
     def embed_texts(self, texts: Sequence[str]) -> List[List[float]]:
-        out: List[List[float]] = []
-        for t in texts:
-            digest = hashlib.sha256((t or "").encode("utf-8")).digest()
-            vec: List[float] = []
-            for i in range(self.dim):
-                b = digest[i % len(digest)]
-                vec.append((b / 255.0) * 2.0 - 1.0)
-            out.append(vec)
-        return out
+        dim = self.dim
+        return [_det_vector(hashlib.sha256((t or "").encode("utf-8")).digest(), dim) for t in texts]
 
 
 @dataclass
@@ -71,37 +201,101 @@ class OllamaEmbeddingProvider:
       - Model pulled (e.g. mxbai-embed-large)
 
     Uses:
-      POST /api/embeddings
-      body: {"model": "...", "prompt": "..."}
-      resp: {"embedding": [ ... floats ... ]}
+      POST /api/embed
+      body: {"model": "...", "input": ["...", ...]}
+      resp: {"embeddings": [[ ... floats ... ], ...]}
+
+    Servers that predate /api/embed (404) fall back to one
+    POST /api/embeddings {"model", "prompt"} per text.
     """
 
     model: str = "mxbai-embed-large"
     base_url: str = "http://localhost:11434"
     timeout_s: int = 60
-
-    def _embed_one(self, text: str) -> List[float]:
-        url = f"{self.base_url.rstrip('/')}/api/embeddings"
-        payload = {"model": self.model, "prompt": text or ""}
+    batch_size: int = 64
+    max_parallel: int = 4
+    _legacy_api: bool = field(default=False, init=False, repr=False)
+    # One keep-alive connection per thread. Batches run on an executor owned by the
+    # provider, so its threads (and their connections) outlive a single call.
+    _local: threading.local = field(default_factory=threading.local, init=False, repr=False, compare=False)
+    _conns: List[http.client.HTTPConnection] = field(default_factory=list, init=False, repr=False, compare=False)
+    _executor: Optional[ThreadPoolExecutor] = field(default=None, init=False, repr=False, compare=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+
+    def _connection(self) -> http.client.HTTPConnection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            parts = urllib.parse.urlsplit(self.base_url)
+            cls = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+            conn = cls(parts.netloc, timeout=self.timeout_s)
+            self._local.conn = conn
+            with self._lock:
+                self._conns.append(conn)
+        return conn
+
+    def _drop_connection(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        self._local.conn = None
+        if conn is not None:
+            with self._lock:
+                if conn in self._conns:
+                    self._conns.remove(conn)
+            conn.close()
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_parallel, thread_name_prefix="ollama-embed")
+            return self._executor
+
+    def close(self) -> None:
+        """Shut down the batch executor and close every keep-alive connection (reopened on next use)."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        with self._lock:
+            conns, self._conns = self._conns, []
+        for conn in conns:
+            conn.close()
+        self._local = threading.local()
+
+    def _request(self, path: str, data: bytes) -> Tuple[int, bytes]:
+        target = urllib.parse.urlsplit(self.base_url).path.rstrip("/") + path
+        headers = {"Content-Type": "application/json"}
+        # A pooled connection the server already closed fails on first use; retry once on a fresh one.
+        for attempt in (0, 1):
+            conn = self._connection()
+            try:
+                conn.request("POST", target, body=data, headers=headers)
+                resp = conn.getresponse()
+                return resp.status, resp.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                self._drop_connection()
+                if attempt:
+                    raise
+            except Exception:
+                self._drop_connection()
+                raise
+        raise AssertionError("unreachable")
+
+    def _post(self, path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        url = f"{self.base_url.rstrip('/')}{path}"
         data = json.dumps(payload).encode("utf-8")
 
-        req = urllib.request.Request(
-            url=url,
-            data=data,
-            method="POST",
-            headers={"Content-Type": "application/json"},
-        )
-
         try:
-            with urllib.request.urlopen(req, timeout=self.timeout_s) as resp:
-                raw = resp.read().decode("utf-8", errors="replace")
-        except urllib.error.HTTPError as e:
-            body = e.read().decode("utf-8", errors="replace") if hasattr(e, "read") else ""
-            raise RuntimeError(f"Ollama HTTPError {e.code}: {body}") from e
+            status, body = self._request(path, data)
         except Exception as e:
             raise RuntimeError(f"Failed calling Ollama embeddings at {url}: {e}") from e
+        if status >= 400:
+            if status == 404 and path == "/api/embed":
+                raise _EmbedEndpointMissing()
+            raise RuntimeError(f"Ollama HTTPError {status}: {body.decode('utf-8', errors='replace')}")
+
+        return json.loads(body)
 
-        obj = json.loads(raw)
+    def _embed_one(self, text: str) -> List[float]:
+        obj = self._post("/api/embeddings", {"model": self.model, "prompt": text or ""})
         emb = obj.get("embedding")
         if not isinstance(emb, list) or not emb:
             raise RuntimeError(f"Ollama embeddings response missing 'embedding': {obj}")
@@ -109,34 +303,241 @@ class OllamaEmbeddingProvider:
         # Ensure floats
         return [float(x) for x in emb]
 
-    def embed_texts(self, texts: Sequence[str]) -> List[List[float]]:
+    def _embed_batch(self, texts: Sequence[str]) -> List[List[float]]:
+        obj = self._post("/api/embed", {"model": self.model, "input": [t or "" for t in texts]})
+        embs = obj.get("embeddings")
+        if not isinstance(embs, list) or len(embs) != len(texts) or not all(isinstance(e, list) and e for e in embs):
+            raise RuntimeError(f"Ollama embed response missing 'embeddings' for {len(texts)} inputs: {obj}")
+        return [[float(x) for x in e] for e in embs]
+
+    def _embed_slice(self, texts: Sequence[str]) -> List[List[float]]:
+        if not self._legacy_api:
+            try:
+                return self._embed_batch(texts)
+            except _EmbedEndpointMissing:
+                self._legacy_api = True
         return [self._embed_one(t) for t in texts]
 
+    def embed_texts(self, texts: Sequence[str]) -> List[List[float]]:
+        bs = max(1, int(self.batch_size))
+        batches = [texts[i : i + bs] for i in range(0, len(texts), bs)]
+        if len(batches) <= 1 or self.max_parallel <= 1:
+            results = [self._embed_slice(b) for b in batches]
+        else:
+            # Requests are I/O-bound on our side; Ollama serves them concurrently.
+            results = list(self._pool().map(self._embed_slice, batches))
+        return [vec for batch in results for vec in batch]
+
+
+class _EmbedEndpointMissing(Exception):
+    """Server has no /api/embed (Ollama before 0.3)."""
+
+
+_CACHE_TAG_RE = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+@dataclass
+class CachingEmbeddingProvider:
+    """Wraps a provider with an on-disk cache keyed by sha256(text) per model.
+
+    Layout: <cache_root>/<model_tag>/<hash[:2]>/<hash>.json -> {"vector": [...]}
+    Only cache misses are sent to `inner`; new vectors are written through.
+    """
+
+    inner: EmbeddingProvider
+    model_tag: str
+    cache_root: Path = DEFAULT_EMBEDDINGS_ROOT / ".cache"
+
+    def close(self) -> None:
+        close = getattr(self.inner, "close", None)
+        if callable(close):
+            close()
+
+    def _path(self, key: str) -> Path:
+        tag = _CACHE_TAG_RE.sub("_", self.model_tag) or "default"
+        return self.cache_root / tag / key[:2] / f"{key}.json"
+
+    def _get(self, path: Path) -> Optional[List[float]]:
+        try:
+            vec = jsonio.read_json(path).get("vector")
+        except (OSError, ValueError, AttributeError):
+            return None
+        return vec if isinstance(vec, list) and vec else None
+
+    def _put(self, path: Path, vector: List[float]) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(jsonio.dumps({"vector": vector}))
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+    def embed_texts(self, texts: Sequence[str]) -> List[List[float]]:
+        paths = [self._path(_sha256_hex(t or "")) for t in texts]
+        out: List[Optional[List[float]]] = [self._get(p) for p in paths]
+        miss = [i for i, v in enumerate(out) if v is None]
+        if miss:
+            vectors = self.inner.embed_texts([texts[i] for i in miss])
+            for i, v in zip(miss, vectors):
+                out[i] = v
+                self._put(paths[i], v)
+        return out  # type: ignore[return-value]
+
 
 @dataclass
 class FileEmbeddingStore:
     root: Path = DEFAULT_EMBEDDINGS_ROOT
+    # "f32" (binary vector + JSON sidecar) or "json" (legacy inline vector).
+    vector_format: str = "f32"
 
     def put(self, *, domain: str, release_id: str, chunk_id: str, vector: List[float]) -> str:
         dest_dir = self.root / domain / release_id
         dest_dir.mkdir(parents=True, exist_ok=True)
-        emb_id = f"emb_{_sha256_hex(json.dumps(vector, separators=(',', ':'), ensure_ascii=False))[:24]}"
-        dest = dest_dir / f"{chunk_id}_{emb_id}.json"
-        payload = {"chunk_id": chunk_id, "domain": domain, "release_id": release_id, "vector": vector}
-        dest.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
-        return f"file:{dest.as_posix()}"
+        # emb_id hashes the little-endian float32 bytes, which the f32 file stores verbatim.
+        # Both read the array through the buffer protocol, so no bytes copy is made.
+        vec = array("f", vector)
+        if sys.byteorder != "little":
+            vec.byteswap()
+        emb_id = f"emb_{hashlib.sha256(vec).hexdigest()[:24]}"
+        if self.vector_format == "json":
+            dest = dest_dir / f"{chunk_id}_{emb_id}.json"
+            payload = {"chunk_id": chunk_id, "domain": domain, "release_id": release_id, "vector": vector}
+            dest.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+            return make_embedding_ref("json", dest)
+        dest = dest_dir / f"{chunk_id}_{emb_id}.f32"
+        dest.write_bytes(vec)
+        meta = {"chunk_id": chunk_id, "domain": domain, "release_id": release_id, "dim": len(vec), "dtype": "float32"}
+        jsonio.write_json(f32_sidecar_path(dest), meta)
+        return make_embedding_ref("f32", dest)
 
 
-def attach_embeddings_for_chunks(
+@dataclass
+class VirtualDeterministicStore:
+    """Store for DeterministicHashEmbeddingProvider vectors that writes nothing.
+
+    The vector is a pure function of the text digest, so `put` encodes the digest
+    bytes in a `det:` ref and readers recompute the vector from it.
+    """
+
+    def put(self, *, domain: str, release_id: str, chunk_id: str, vector: List[float]) -> str:
+        try:
+            data = bytes(map(_UNIT_TO_BYTE.__getitem__, vector))
+        except (KeyError, TypeError):
+            raise ValueError(f"vector for {chunk_id} is not a deterministic hash embedding") from None
+        key = data[:32]
+        if not key or _det_vector(key, len(data)) != list(vector):
+            raise ValueError(f"vector for {chunk_id} is not a deterministic hash embedding")
+        return f"{DET_REF_PREFIX}sha256:{key.hex()}:dim={len(data)}"
+
+
+_packed_lock = threading.Lock()
+
+# chunk_ids.txt path -> (bytes read, row count, chunk_id -> row); read incrementally under _packed_lock.
+_packed_rows: Dict[str, Tuple[int, int, Dict[str, int]]] = {}
+
+
+def _read_packed_rows(ids_path: Path) -> Tuple[int, Dict[str, int]]:
+    """Row count and chunk_id -> row for a packed release. Caller holds the packed locks.
+
+    A trailing line without its newline (a put interrupted mid-write) is cut off.
+    """
+    key = str(ids_path)
+    consumed, n, rows = _packed_rows.get(key, (0, 0, {}))
+    try:
+        size = os.stat(ids_path).st_size
+    except FileNotFoundError:
+        size = 0
+    if size < consumed:
+        consumed, n, rows = 0, 0, {}
+    if size > consumed:
+        with open(ids_path, "rb") as fh:
+            fh.seek(consumed)
+            data = fh.read()
+        end = data.rfind(b"\n") + 1
+        if end < len(data):
+            os.truncate(ids_path, consumed + end)
+        rows = dict(rows)
+        for line in data[:end].splitlines():
+            rows.setdefault(line.decode("utf-8"), n)
+            n += 1
+        consumed += end
+    _packed_rows[key] = (consumed, n, rows)
+    return n, rows
+
+
+@dataclass
+class PackedEmbeddingStore:
+    """Appends vectors as rows of one float32 matrix per domain/release.
+
+    `<root>/<domain>/<release_id>/vectors.f32` holds the rows back to back and
+    `chunk_ids.txt` the matching chunk_id per line, so readers need one open per
+    release instead of one (or two) per chunk. All rows in a release share a dim.
+    """
+
+    root: Path = DEFAULT_EMBEDDINGS_ROOT
+
+    def put(self, *, domain: str, release_id: str, chunk_id: str, vector: List[float]) -> str:
+        dest_dir = self.root / domain / release_id
+        dest_dir.mkdir(parents=True, exist_ok=True)
+        vec = array("f", vector)
+        if sys.byteorder != "little":
+            vec.byteswap()
+        row_bytes = len(vec) * 4
+        if not row_bytes:
+            raise ValueError(f"empty vector for {chunk_id}")
+        vectors_path = dest_dir / PACKED_VECTORS_NAME
+        ids_path = dest_dir / PACKED_IDS_NAME
+        # Row numbers come from chunk_ids.txt, so puts are serialized: a thread lock
+        # in-process and flock across processes where available. The vector is written
+        # before its id line, so an interrupted put leaves at most one orphan row.
+        with _packed_lock, open(vectors_path, "ab") as fh:
+            if fcntl is not None:
+                fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+            n, rows = _read_packed_rows(ids_path)
+            row = rows.get(chunk_id)
+            if row is not None:
+                # Re-ingested or re-merged chunk: its vector is already in the release.
+                return make_packed_embedding_ref(vectors_path, row, len(vec))
+            size = os.fstat(fh.fileno()).st_size
+            if size == (n + 1) * row_bytes:
+                fh.truncate(n * row_bytes)
+            elif size != n * row_bytes:
+                raise ValueError(f"{vectors_path} does not hold {n} {len(vec)}-dim rows")
+            fh.write(vec)
+            fh.flush()
+            line = (chunk_id + "\n").encode("utf-8")
+            with open(ids_path, "ab") as ids:
+                ids.write(line)
+            consumed, _, _ = _packed_rows[str(ids_path)]
+            rows[chunk_id] = n
+            _packed_rows[str(ids_path)] = (consumed + len(line), n + 1, rows)
+        return make_packed_embedding_ref(vectors_path, n, len(vec))
+
+
+def embed_chunks(chunks: List[Dict[str, Any]], *, provider: EmbeddingProvider) -> List[List[float]]:
+    """One vector per chunk text; writes nothing."""
+    texts = [str(c.get("text", "")) for c in chunks]
+    # Repeated texts (templated sections) are embedded once and shared.
+    slots: Dict[str, int] = {}
+    for t in texts:
+        slots.setdefault(t, len(slots))
+    unique = provider.embed_texts(list(slots)) if slots else []
+    return [unique[slots[t]] for t in texts]
+
+
+def store_chunk_embeddings(
     chunks: List[Dict[str, Any]],
+    vectors: List[List[float]],
     *,
-    provider: EmbeddingProvider,
     store: EmbeddingStore,
 ) -> List[Dict[str, Any]]:
-    """Return new chunk dicts with `embedding_ref` attached. Does not mutate input list."""
-    texts = [str(c.get("text", "")) for c in chunks]
-    vectors = provider.embed_texts(texts)
-
+    """Put each chunk's vector in `store`; return new chunk dicts with `embedding_ref` attached."""
     out: List[Dict[str, Any]] = []
     for c, v in zip(chunks, vectors):
         domain = str(c.get("domain"))
@@ -148,3 +549,13 @@ def attach_embeddings_for_chunks(
         out.append(new_c)
 
     return out
+
+
+def attach_embeddings_for_chunks(
+    chunks: List[Dict[str, Any]],
+    *,
+    provider: EmbeddingProvider,
+    store: EmbeddingStore,
+) -> List[Dict[str, Any]]:
+    """Return new chunk dicts with `embedding_ref` attached. Does not mutate input list."""
+    return store_chunk_embeddings(chunks, embed_chunks(chunks, provider=provider), store=store)
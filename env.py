@@ -1,11 +1,29 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, List, Optional, TypeVar
 import os
 
 BASE_DIR = Path(__file__).resolve().parent
 
+# Getters are memoized: environment variables are read (and paths resolved) once
+# per process. Call clear_env_cache() after changing os.environ at runtime.
+_CACHED_GETTERS: List[Any] = []
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+def _cached(fn: _F) -> _F:
+	wrapped = lru_cache(maxsize=None)(fn)
+	_CACHED_GETTERS.append(wrapped)
+	return wrapped  # type: ignore[return-value]
+
+
+def clear_env_cache() -> None:
+	for fn in _CACHED_GETTERS:
+		fn.cache_clear()
+
 
 def _env_path(name: str) -> Optional[Path]:
 	raw = os.environ.get(name)
@@ -14,6 +32,7 @@ def _env_path(name: str) -> Optional[Path]:
 	return Path(str(raw)).expanduser().resolve()
 
 
+@_cached
 def get_ingestion_data_root() -> Path:
 	"""Base data root for all ingestion artifacts."""
 	root = _env_path("INGESTION_DATA_ROOT")
@@ -22,6 +41,7 @@ def get_ingestion_data_root() -> Path:
 	return BASE_DIR / "data"
 
 
+@_cached
 def get_vector_index_root() -> Path:
 	root = _env_path("VECTOR_INDEX_ROOT")
 	if root is not None:
@@ -29,18 +49,22 @@ def get_vector_index_root() -> Path:
 	return get_ingestion_data_root() / "vector_index"
 
 
+@_cached
 def get_canonical_root() -> Path:
 	return get_ingestion_data_root() / "canonical"
 
 
+@_cached
 def get_chunks_root() -> Path:
 	return get_ingestion_data_root() / "chunks"
 
 
+@_cached
 def get_embeddings_root() -> Path:
 	return get_ingestion_data_root() / "embeddings"
 
 
+@_cached
 def get_releases_root() -> Path:
 	root = _env_path("RELEASES_ROOT")
 	if root is not None:
@@ -48,6 +72,7 @@ def get_releases_root() -> Path:
 	return get_ingestion_data_root() / "releases"
 
 
+@_cached
 def get_observability_root() -> Path:
 	root = _env_path("OBSERVABILITY_ROOT")
 	if root is not None:
@@ -55,6 +80,7 @@ def get_observability_root() -> Path:
 	return get_ingestion_data_root() / "observability"
 
 
+@_cached
 def get_retrieval_embed_provider() -> str:
 	raw = (os.getenv("RETRIEVAL_EMBED_PROVIDER") or "").strip().lower()
 	if raw:
@@ -65,6 +91,7 @@ def get_retrieval_embed_provider() -> str:
 	return "deterministic"
 
 
+@_cached
 def get_ingestion_embed_provider() -> str:
 	model = (os.getenv("OLLAMA_EMBED_MODEL") or "").strip().lower()
 	if model == "deterministic":
@@ -72,16 +99,19 @@ def get_ingestion_embed_provider() -> str:
 	return "ollama"
 
 
+@_cached
 def get_ollama_embed_model(default: str = "mxbai-embed-large") -> str:
 	raw = (os.getenv("OLLAMA_EMBED_MODEL") or "").strip()
 	return raw or default
 
 
+@_cached
 def get_ollama_base_url(default: str = "http://localhost:11434") -> str:
 	raw = (os.getenv("OLLAMA_URL") or "").strip()
 	return raw or default
 
 
+@_cached
 def get_ollama_timeout_s(default: int = 60) -> int:
 	raw = (os.getenv("OLLAMA_TIMEOUT_S") or "").strip()
 	if not raw:
@@ -92,6 +122,29 @@ def get_ollama_timeout_s(default: int = 60) -> int:
 		return default
 
 
+@_cached
+def get_embed_cache_enabled() -> bool:
+	"""EMBED_CACHE=1 reuses stored vectors for chunk texts already embedded with the same model."""
+	raw = (os.getenv("EMBED_CACHE") or "").strip().lower()
+	return raw in ("1", "true", "yes", "on")
+
+
+@_cached
+def get_embed_store_format(default: str = "f32") -> str:
+	"""EMBED_STORE_FORMAT: `f32` (binary float32 + JSON sidecar), `packed` (one float32 matrix per
+	release), `json` (legacy) or `det` (no files)."""
+	raw = (os.getenv("EMBED_STORE_FORMAT") or "").strip().lower()
+	return raw if raw in ("f32", "packed", "json", "det") else default
+
+
+@_cached
+def get_vector_quantization() -> str:
+	"""VECTOR_QUANTIZE=int8 scores local indexes on int8-quantized vectors (needs numpy); else `none`."""
+	raw = (os.getenv("VECTOR_QUANTIZE") or "").strip().lower()
+	return "int8" if raw == "int8" else "none"
+
+
+@_cached
 def get_retrieval_embed_dim(default: int = 16) -> int:
 	raw = (os.getenv("RETRIEVAL_EMBED_DIM") or "").strip()
 	if not raw:
@@ -102,6 +155,7 @@ def get_retrieval_embed_dim(default: int = 16) -> int:
 		return default
 
 
+@_cached
 def get_retrieval_embed_max_chars(default: int = 2000) -> int:
 	raw = (os.getenv("RETRIEVAL_EMBED_MAX_CHARS") or "").strip()
 	if raw:
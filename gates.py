@@ -13,18 +13,32 @@ If no artifacts exist, the gates will pass (useful for CI in a clean repo).
 
 from __future__ import annotations
 
+from array import array
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import argparse
-import json
+import math
+import os
+import sys
 
+import jsonio
 from schema_validator import validate_instance
 from releases import get_releases_root
 from vector_store import DEFAULT_INDEX_ROOT
-from chunker import DEFAULT_CHUNKS_ROOT
-from canonicalizer import DEFAULT_CANONICAL_ROOT
-from embeddings import DEFAULT_EMBEDDINGS_ROOT
+from chunker import CHUNKS_SHARD_NAME, DEFAULT_CHUNKS_ROOT
+from canonicalizer import CANONICAL_SHARD_NAME, DEFAULT_CANONICAL_ROOT
+from embeddings import (
+	DEFAULT_EMBEDDINGS_ROOT,
+	DET_REF_PREFIX,
+	PACKED_IDS_NAME,
+	f32_sidecar_path,
+	parse_det_embedding_ref,
+	parse_embedding_ref,
+	parse_packed_embedding_ref,
+)
 
 @dataclass(frozen=True)
 class GateIssue:
@@ -37,13 +51,27 @@ class GateError(RuntimeError):
 		super().__init__("Gating checks failed")
 		self.issues = issues
 
+# Per-file checks are dominated by open/read syscalls, so threads overlap well.
+_GATE_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
 def _iter_files(root: Path, *, pattern: str) -> Iterable[Path]:
 	if not root.exists():
 		return
 	yield from root.rglob(pattern)
 
 def _read_json(path: Path) -> Dict[str, Any]:
-	return json.loads(path.read_text(encoding="utf-8"))
+	return jsonio.loads(path.read_bytes())
+
+def _iter_ndjson(path: Path) -> Iterable[Tuple[int, Optional[Dict[str, Any]], Optional[Exception]]]:
+	"""Yield (line_no, payload, parse_error) for each non-blank line, streaming the file."""
+	with path.open("rb") as fh:
+		for i, line in enumerate(fh, start=1):
+			if not line.strip():
+				continue
+			try:
+				yield i, jsonio.loads(line), None
+			except Exception as e:
+				yield i, None, e
 
 def _domain_release_from_path(root: Path, file_path: Path) -> Tuple[Optional[str], Optional[str]]:
 	try:
@@ -56,39 +84,123 @@ def _domain_release_from_path(root: Path, file_path: Path) -> Tuple[Optional[str
 	return str(parts[0]), str(parts[1])
 
 def _path_from_embedding_ref(embedding_ref: str) -> Optional[Path]:
-	if not embedding_ref:
-		return None
-	if not str(embedding_ref).startswith("file:"):
-		return None
-	raw = str(embedding_ref)[len("file:") :]
-	if not raw:
-		return None
-	return Path(raw)
+	parsed = parse_embedding_ref(embedding_ref)
+	return None if parsed is None else parsed[1]
 
-def check_release_records(*, releases_root: Path) -> List[GateIssue]:
-	issues: List[GateIssue] = []
-	for release_json in _iter_files(releases_root, pattern="release.json"):
-		try:
-			payload = _read_json(release_json)
-		except Exception as e:
-			issues.append(GateIssue("release_json_invalid", f"Could not parse JSON: {e}", str(release_json)))
-			continue
+def _load_embedding_payload(emb_path: Path) -> Dict[str, Any]:
+	"""Legacy JSON payloads as-is; f32 files as their sidecar plus `vector_bytes`."""
+	if emb_path.suffix != ".f32":
+		return _read_json(emb_path)
+	meta = _read_json(f32_sidecar_path(emb_path))
+	if not isinstance(meta, dict):
+		raise ValueError("embedding sidecar is not an object")
+	meta["vector_bytes"] = emb_path.stat().st_size
+	return meta
+
+def _f32_vector_ok(payload: Dict[str, Any]) -> bool:
+	dim = payload.get("dim")
+	size = payload.get("vector_bytes")
+	return isinstance(dim, int) and dim > 0 and payload.get("dtype") == "float32" and size == dim * 4
+
+@dataclass(frozen=True)
+class _PackedRelease:
+	size: int
+	chunk_ids: List[str]
+	# Kept only when some value is NaN/inf, to find the affected rows.
+	nonfinite: Optional[array]
+
+def _read_packed_release(vectors_path: Path) -> _PackedRelease:
+	"""Read a packed release once: byte size, row chunk_ids and a whole-matrix finiteness scan."""
+	data = vectors_path.read_bytes()
+	vec = array("f")
+	vec.frombytes(data[: len(data) - len(data) % 4])
+	if sys.byteorder != "little":
+		vec.byteswap()
+	try:
+		finite = math.isfinite(math.fsum(vec))
+	except (ValueError, OverflowError):  # inf + -inf
+		finite = False
+	chunk_ids = vectors_path.with_name(PACKED_IDS_NAME).read_text(encoding="utf-8").splitlines()
+	return _PackedRelease(size=len(data), chunk_ids=chunk_ids, nonfinite=None if finite else vec)
+
+def _check_packed_row(
+	packed: Tuple[Path, int, int],
+	*,
+	line: int,
+	chunk_id: str,
+	row_domain: str,
+	row_rid: str,
+	embeddings_root: Path,
+	cache: Dict[Path, _PackedRelease],
+) -> List[GateIssue]:
+	vectors_path, row, dim = packed
+	where = f"Line {line}: "
+	if vectors_path not in cache:
+		if not vectors_path.exists():
+			return [GateIssue("index_missing_embedding", f"{where}embedding file missing", str(vectors_path))]
 		try:
-			validate_instance("release.json", payload)
+			cache[vectors_path] = _read_packed_release(vectors_path)
 		except Exception as e:
-			issues.append(GateIssue("release_schema_invalid", f"Schema validation failed: {e}", str(release_json)))
-		try:
-			rel = release_json.relative_to(releases_root)
-			parts = rel.parts
-			if len(parts) >= 4 and parts[1] == "releases":
-				domain_from_path = parts[0]
-				rid_from_path = parts[2]
-				if str(payload.get("domain")) != str(domain_from_path):
-					issues.append(GateIssue("release_domain_mismatch","Release record domain does not match path",str(release_json)))
-				if str(payload.get("release_id")) != str(rid_from_path):
-					issues.append(GateIssue("release_id_mismatch","Release record release_id does not match path",str(release_json)))
-		except Exception:
-			pass
+			return [GateIssue("embedding_json_invalid", f"{where}packed embeddings unreadable: {e}", str(vectors_path))]
+	rel = cache[vectors_path]
+	issues: List[GateIssue] = []
+	if row >= len(rel.chunk_ids) or str(rel.chunk_ids[row]) != chunk_id:
+		issues.append(GateIssue("embedding_chunk_id_mismatch", f"{where}embedding chunk_id mismatch", str(vectors_path)))
+	domain_from_path, rid_from_path = _domain_release_from_path(embeddings_root, vectors_path)
+	if domain_from_path is not None and domain_from_path != row_domain:
+		issues.append(GateIssue("embedding_domain_mismatch", f"{where}embedding domain mismatch", str(vectors_path)))
+	if rid_from_path is not None and rid_from_path != row_rid:
+		issues.append(GateIssue("embedding_release_id_mismatch", f"{where}embedding release_id mismatch", str(vectors_path)))
+	start = row * dim
+	vec_ok = rel.size % (dim * 4) == 0 and (start + dim) * 4 <= rel.size
+	if vec_ok and rel.nonfinite is not None:
+		vec_ok = all(map(math.isfinite, rel.nonfinite[start : start + dim]))
+	if not vec_ok:
+		issues.append(GateIssue("embedding_vector_invalid", f"{where}embedding vector invalid", str(vectors_path)))
+	try:
+		vectors_path.relative_to(embeddings_root)
+	except ValueError:
+		issues.append(GateIssue("embedding_outside_root", f"{where}embedding file not under embeddings root", str(vectors_path)))
+	return issues
+
+def _map_files(fn: Callable[[Path], List[GateIssue]], paths: Iterable[Path]) -> List[GateIssue]:
+	"""Run a per-file check over `paths` on a thread pool; issues keep path order."""
+	paths = list(paths)
+	if len(paths) <= 1:
+		return [it for p in paths for it in fn(p)]
+	with ThreadPoolExecutor(max_workers=min(_GATE_WORKERS, len(paths))) as ex:
+		return [it for file_issues in ex.map(fn, paths) for it in file_issues]
+
+def _check_release_file(release_json: Path, *, releases_root: Path) -> List[GateIssue]:
+	issues: List[GateIssue] = []
+	try:
+		payload = _read_json(release_json)
+	except Exception as e:
+		issues.append(GateIssue("release_json_invalid", f"Could not parse JSON: {e}", str(release_json)))
+		return issues
+	try:
+		validate_instance("release.json", payload)
+	except Exception as e:
+		issues.append(GateIssue("release_schema_invalid", f"Schema validation failed: {e}", str(release_json)))
+	try:
+		rel = release_json.relative_to(releases_root)
+		parts = rel.parts
+		if len(parts) >= 4 and parts[1] == "releases":
+			domain_from_path = parts[0]
+			rid_from_path = parts[2]
+			if str(payload.get("domain")) != str(domain_from_path):
+				issues.append(GateIssue("release_domain_mismatch","Release record domain does not match path",str(release_json)))
+			if str(payload.get("release_id")) != str(rid_from_path):
+				issues.append(GateIssue("release_id_mismatch","Release record release_id does not match path",str(release_json)))
+	except Exception:
+		pass
+	return issues
+
+def check_release_records(*, releases_root: Path) -> List[GateIssue]:
+	issues = _map_files(
+		partial(_check_release_file, releases_root=releases_root),
+		_iter_files(releases_root, pattern="release.json"),
+	)
 	if releases_root.exists():
 		for domain_dir in releases_root.iterdir():
 			if not domain_dir.is_dir():
@@ -105,72 +217,148 @@ def check_release_records(*, releases_root: Path) -> List[GateIssue]:
 				issues.append(GateIssue("active_release_missing","active_release.txt points to a missing release.json",str(active_path)))
 	return issues
 
-def check_canonical_store(*, canonical_root: Path) -> List[GateIssue]:
+def _check_canonical_payload(payload: Dict[str, Any], *, canonical_root: Path, p: Path, where: str) -> List[GateIssue]:
 	issues: List[GateIssue] = []
-	for p in _iter_files(canonical_root, pattern="*.json"):
-		if p.name == "release.json":
-			continue
-		try:
-			payload = _read_json(p)
-		except Exception as e:
-			issues.append(GateIssue("canonical_json_invalid", f"Could not parse JSON: {e}", str(p)))
+	try:
+		validate_instance("canonical_object.json", payload)
+	except Exception as e:
+		issues.append(GateIssue("canonical_schema_invalid", f"{where}Schema validation failed: {e}", str(p)))
+	domain_from_path, rid_from_path = _domain_release_from_path(canonical_root, p)
+	if domain_from_path and str(payload.get("domain")) != str(domain_from_path):
+		issues.append(GateIssue("canonical_domain_mismatch", f"{where}Canonical domain does not match path", str(p)))
+	prov = payload.get("provenance") if isinstance(payload.get("provenance"), dict) else {}
+	prov_rid = prov.get("release_id")
+	if rid_from_path and prov_rid is not None and str(prov_rid) != str(rid_from_path):
+		issues.append(GateIssue("canonical_release_mismatch", f"{where}Canonical provenance.release_id does not match path", str(p)))
+	return issues
+
+def _check_canonical_shard(p: Path, *, canonical_root: Path) -> List[GateIssue]:
+	issues: List[GateIssue] = []
+	for i, payload, err in _iter_ndjson(p):
+		if err is not None or not isinstance(payload, dict):
+			issues.append(GateIssue("canonical_json_invalid", f"Line {i}: Could not parse JSON object: {err}", str(p)))
 			continue
-		try:
-			validate_instance("canonical_object.json", payload)
-		except Exception as e:
-			issues.append(GateIssue("canonical_schema_invalid", f"Schema validation failed: {e}", str(p)))
-		domain_from_path, rid_from_path = _domain_release_from_path(canonical_root, p)
-		if domain_from_path and str(payload.get("domain")) != str(domain_from_path):
-			issues.append(GateIssue("canonical_domain_mismatch", "Canonical domain does not match path", str(p)))
-		prov = payload.get("provenance") if isinstance(payload.get("provenance"), dict) else {}
-		prov_rid = prov.get("release_id")
-		if rid_from_path and prov_rid is not None and str(prov_rid) != str(rid_from_path):
-			issues.append(GateIssue("canonical_release_mismatch", "Canonical provenance.release_id does not match path", str(p)))
+		issues.extend(_check_canonical_payload(payload, canonical_root=canonical_root, p=p, where=f"Line {i}: "))
+	return issues
+
+def _check_canonical_file(p: Path, *, canonical_root: Path) -> List[GateIssue]:
+	try:
+		payload = _read_json(p)
+	except Exception as e:
+		return [GateIssue("canonical_json_invalid", f"Could not parse JSON: {e}", str(p))]
+	return _check_canonical_payload(payload, canonical_root=canonical_root, p=p, where="")
+
+def check_canonical_store(*, canonical_root: Path) -> List[GateIssue]:
+	issues = _map_files(
+		partial(_check_canonical_shard, canonical_root=canonical_root),
+		_iter_files(canonical_root, pattern=CANONICAL_SHARD_NAME),
+	)
+	# Legacy one-file-per-object layout
+	issues.extend(_map_files(
+		partial(_check_canonical_file, canonical_root=canonical_root),
+		(p for p in _iter_files(canonical_root, pattern="*.json") if p.name != "release.json"),
+	))
 	return issues
 
-def check_chunk_store(*, chunks_root: Path) -> List[GateIssue]:
+# Chunk validation results shared by check_chunk_store and check_vector_index:
+# shard path -> {chunk_id: error or None}, legacy chunk file path -> error or None.
+ChunkVerdicts = Dict[Path, Any]
+
+_UNCHECKED = object()
+
+def _chunk_schema_error(payload: Any) -> Optional[str]:
+	try:
+		validate_instance("chunk.json", payload)
+	except Exception as e:
+		return str(e)
+	return None
+
+def _check_chunk_payload(payload: Dict[str, Any], *, chunks_root: Path, p: Path, where: str, schema_error: Optional[str]) -> List[GateIssue]:
 	issues: List[GateIssue] = []
-	for p in _iter_files(chunks_root, pattern="*.json"):
-		try:
-			payload = _read_json(p)
-		except Exception as e:
-			issues.append(GateIssue("chunk_json_invalid", f"Could not parse JSON: {e}", str(p)))
+	if schema_error is not None:
+		issues.append(GateIssue("chunk_schema_invalid", f"{where}Schema validation failed: {schema_error}", str(p)))
+	domain_from_path, rid_from_path = _domain_release_from_path(chunks_root, p)
+	if domain_from_path and str(payload.get("domain")) != str(domain_from_path):
+		issues.append(GateIssue("chunk_domain_mismatch", f"{where}Chunk domain does not match path", str(p)))
+	if rid_from_path and str(payload.get("release_id")) != str(rid_from_path):
+		issues.append(GateIssue("chunk_release_mismatch", f"{where}Chunk release_id does not match path", str(p)))
+	return issues
+
+def _check_chunk_shard(p: Path, *, chunks_root: Path, verdicts: Optional[ChunkVerdicts] = None) -> List[GateIssue]:
+	issues: List[GateIssue] = []
+	errors: Dict[str, Optional[str]] = {}
+	for i, payload, err in _iter_ndjson(p):
+		if err is not None or not isinstance(payload, dict):
+			issues.append(GateIssue("chunk_json_invalid", f"Line {i}: Could not parse JSON object: {err}", str(p)))
 			continue
-		try:
-			validate_instance("chunk.json", payload)
-		except Exception as e:
-			issues.append(GateIssue("chunk_schema_invalid", f"Schema validation failed: {e}", str(p)))
-		domain_from_path, rid_from_path = _domain_release_from_path(chunks_root, p)
-		if domain_from_path and str(payload.get("domain")) != str(domain_from_path):
-			issues.append(GateIssue("chunk_domain_mismatch", "Chunk domain does not match path", str(p)))
-		if rid_from_path and str(payload.get("release_id")) != str(rid_from_path):
-			issues.append(GateIssue("chunk_release_mismatch", "Chunk release_id does not match path", str(p)))
-		cid_from_path = p.stem
-		if str(payload.get("chunk_id")) != str(cid_from_path):
-			issues.append(GateIssue("chunk_id_mismatch", "Chunk chunk_id does not match filename", str(p)))
+		schema_error = _chunk_schema_error(payload)
+		# Last line wins, matching how the index check resolves a chunk_id.
+		errors[str(payload.get("chunk_id"))] = schema_error
+		issues.extend(_check_chunk_payload(payload, chunks_root=chunks_root, p=p, where=f"Line {i}: ", schema_error=schema_error))
+	if verdicts is not None:
+		verdicts[p] = errors
 	return issues
 
-def check_vector_index(
+def _check_chunk_file(p: Path, *, chunks_root: Path, verdicts: Optional[ChunkVerdicts] = None) -> List[GateIssue]:
+	try:
+		payload = _read_json(p)
+	except Exception as e:
+		if verdicts is not None:
+			verdicts[p] = str(e)
+		return [GateIssue("chunk_json_invalid", f"Could not parse JSON: {e}", str(p))]
+	schema_error = _chunk_schema_error(payload)
+	if verdicts is not None:
+		verdicts[p] = schema_error
+	issues = _check_chunk_payload(payload, chunks_root=chunks_root, p=p, where="", schema_error=schema_error)
+	cid_from_path = p.stem
+	if str(payload.get("chunk_id")) != str(cid_from_path):
+		issues.append(GateIssue("chunk_id_mismatch", "Chunk chunk_id does not match filename", str(p)))
+	return issues
+
+def check_chunk_store(*, chunks_root: Path, verdicts: Optional[ChunkVerdicts] = None) -> List[GateIssue]:
+	"""Validate chunk shards and legacy chunk files; records per-chunk results in `verdicts` if given."""
+	issues = _map_files(
+		partial(_check_chunk_shard, chunks_root=chunks_root, verdicts=verdicts),
+		_iter_files(chunks_root, pattern=CHUNKS_SHARD_NAME),
+	)
+	# Legacy one-file-per-chunk layout
+	issues.extend(_map_files(
+		partial(_check_chunk_file, chunks_root=chunks_root, verdicts=verdicts),
+		_iter_files(chunks_root, pattern="*.json"),
+	))
+	return issues
+
+def _load_shard_chunks(shard: Path) -> Dict[str, Any]:
+	"""chunk_id -> payload from a release shard (last line wins); unparseable lines are skipped."""
+	out: Dict[str, Any] = {}
+	if shard.exists():
+		for _i, payload, err in _iter_ndjson(shard):
+			if err is None and isinstance(payload, dict):
+				out[str(payload.get("chunk_id"))] = payload
+	return out
+
+def _chunk_error(entry: Any) -> Optional[str]:
+	"""Schema error for a shard entry: a cached verdict (str/None) or a payload still to validate."""
+	return _chunk_schema_error(entry) if isinstance(entry, dict) else entry
+
+def _check_index_file(
+	index_path: Path,
 	*,
 	vector_root: Path,
 	chunks_root: Path,
 	embeddings_root: Path,
+	chunk_verdicts: Optional[ChunkVerdicts] = None,
 ) -> List[GateIssue]:
 	issues: List[GateIssue] = []
-	for index_path in _iter_files(vector_root, pattern="index.jsonl"):
-		domain_from_path, rid_from_path = _domain_release_from_path(vector_root, index_path)
-		try:
-			lines = index_path.read_text(encoding="utf-8").splitlines()
-		except Exception as e:
-			issues.append(GateIssue("index_read_failed", f"Could not read index.jsonl: {e}", str(index_path)))
-			continue
-		for i, line in enumerate(lines, start=1):
-			if not line.strip():
-				continue
-			try:
-				row = json.loads(line)
-			except Exception as e:
-				issues.append(GateIssue("index_row_invalid", f"Line {i}: JSON parse failed: {e}", str(index_path)))
+	verdicts: ChunkVerdicts = chunk_verdicts if chunk_verdicts is not None else {}
+	shard_cache: Dict[Tuple[str, str], Dict[str, Any]] = {}
+	packed_cache: Dict[Path, _PackedRelease] = {}
+	domain_from_path, rid_from_path = _domain_release_from_path(vector_root, index_path)
+	# Rows are streamed; an I/O error mid-file is reported once for the index.
+	try:
+		for i, row, err in _iter_ndjson(index_path):
+			if err is not None:
+				issues.append(GateIssue("index_row_invalid", f"Line {i}: JSON parse failed: {err}", str(index_path)))
 				continue
 			chunk_id = str(row.get("chunk_id", ""))
 			row_domain = str(row.get("domain", ""))
@@ -182,16 +370,47 @@ def check_vector_index(
 			if not chunk_id:
 				issues.append(GateIssue("index_missing_chunk_id", f"Line {i}: missing chunk_id", str(index_path)))
 				continue
+			shard_path = chunks_root / row_domain / row_rid / CHUNKS_SHARD_NAME
+			key = (row_domain, row_rid)
+			if key not in shard_cache:
+				# Shards already checked by check_chunk_store are not re-read.
+				cached = verdicts.get(shard_path)
+				shard_cache[key] = cached if cached is not None else _load_shard_chunks(shard_path)
+			shard_entries = shard_cache[key]
 			ch_path = chunks_root / row_domain / row_rid / f"{chunk_id}.json"
-			if not ch_path.exists():
+			if chunk_id in shard_entries:
+				ch_err = _chunk_error(shard_entries[chunk_id])
+				if ch_err is not None:
+					issues.append(GateIssue("index_chunk_invalid", f"Line {i}: chunk invalid: {ch_err}", str(shard_path)))
+			elif not ch_path.exists():
 				issues.append(GateIssue("index_missing_chunk_file", f"Line {i}: missing chunk file", str(ch_path)))
 			else:
-				try:
-					ch_payload = _read_json(ch_path)
-					validate_instance("chunk.json", ch_payload)
-				except Exception as e:
-					issues.append(GateIssue("index_chunk_invalid", f"Line {i}: chunk file invalid: {e}", str(ch_path)))
+				ch_err = verdicts.get(ch_path, _UNCHECKED)
+				if ch_err is _UNCHECKED:
+					try:
+						ch_err = _chunk_schema_error(_read_json(ch_path))
+					except Exception as e:
+						ch_err = str(e)
+				if ch_err is not None:
+					issues.append(GateIssue("index_chunk_invalid", f"Line {i}: chunk file invalid: {ch_err}", str(ch_path)))
 			emb_ref = str(row.get("embedding_ref", ""))
+			if emb_ref.startswith(DET_REF_PREFIX):
+				# Deterministic embeddings have no file; only the ref itself can be checked.
+				if parse_det_embedding_ref(emb_ref) is None:
+					issues.append(GateIssue("index_embedding_ref_invalid", f"Line {i}: malformed det: embedding_ref", str(index_path)))
+				continue
+			packed = parse_packed_embedding_ref(emb_ref)
+			if packed is not None:
+				issues.extend(_check_packed_row(
+					packed,
+					line=i,
+					chunk_id=chunk_id,
+					row_domain=row_domain,
+					row_rid=row_rid,
+					embeddings_root=embeddings_root,
+					cache=packed_cache,
+				))
+				continue
 			emb_path = _path_from_embedding_ref(emb_ref)
 			if emb_path is None:
 				issues.append(GateIssue("index_embedding_ref_invalid", f"Line {i}: unsupported embedding_ref", str(index_path)))
@@ -200,7 +419,7 @@ def check_vector_index(
 				issues.append(GateIssue("index_missing_embedding", f"Line {i}: embedding file missing", str(emb_path)))
 				continue
 			try:
-				emb_payload = _read_json(emb_path)
+				emb_payload = _load_embedding_payload(emb_path)
 			except Exception as e:
 				issues.append(GateIssue("embedding_json_invalid", f"Line {i}: embedding JSON invalid: {e}", str(emb_path)))
 				continue
@@ -210,15 +429,40 @@ def check_vector_index(
 				issues.append(GateIssue("embedding_domain_mismatch", f"Line {i}: embedding domain mismatch", str(emb_path)))
 			if str(emb_payload.get("release_id")) != row_rid:
 				issues.append(GateIssue("embedding_release_id_mismatch", f"Line {i}: embedding release_id mismatch", str(emb_path)))
-			vec = emb_payload.get("vector")
-			if not isinstance(vec, list) or not all(isinstance(x, (int, float)) for x in vec):
+			if "vector_bytes" in emb_payload:
+				vec_ok = _f32_vector_ok(emb_payload)
+			else:
+				vec = emb_payload.get("vector")
+				vec_ok = isinstance(vec, list) and all(isinstance(x, (int, float)) for x in vec)
+			if not vec_ok:
 				issues.append(GateIssue("embedding_vector_invalid", f"Line {i}: embedding vector invalid", str(emb_path)))
 			try:
 				emb_path.relative_to(embeddings_root)
 			except Exception:
 				issues.append(GateIssue("embedding_outside_root",f"Line {i}: embedding file not under embeddings root",str(emb_path)))
+	except OSError as e:
+		issues.append(GateIssue("index_read_failed", f"Could not read index.jsonl: {e}", str(index_path)))
 	return issues
 
+def check_vector_index(
+	*,
+	vector_root: Path,
+	chunks_root: Path,
+	embeddings_root: Path,
+	chunk_verdicts: Optional[ChunkVerdicts] = None,
+) -> List[GateIssue]:
+	"""Check index rows; `chunk_verdicts` from check_chunk_store lets chunk validation be skipped."""
+	return _map_files(
+		partial(
+			_check_index_file,
+			vector_root=vector_root,
+			chunks_root=chunks_root,
+			embeddings_root=embeddings_root,
+			chunk_verdicts=chunk_verdicts,
+		),
+		_iter_files(vector_root, pattern="index.jsonl"),
+	)
+
 def run_all_gates(
 	*,
 	releases_root: Path,
@@ -227,12 +471,23 @@ def run_all_gates(
 	embeddings_root: Path,
 	vector_root: Path,
 ) -> List[GateIssue]:
-	issues: List[GateIssue] = []
-	issues.extend(check_release_records(releases_root=releases_root))
-	issues.extend(check_canonical_store(canonical_root=canonical_root))
-	issues.extend(check_chunk_store(chunks_root=chunks_root))
-	issues.extend(check_vector_index(vector_root=vector_root, chunks_root=chunks_root, embeddings_root=embeddings_root))
-	return issues
+	# Release and canonical checks run alongside the chunk store check; the index check
+	# follows it so chunk files validated there are not parsed and validated again.
+	verdicts: ChunkVerdicts = {}
+	with ThreadPoolExecutor(max_workers=3) as ex:
+		futures = [
+			ex.submit(check_release_records, releases_root=releases_root),
+			ex.submit(check_canonical_store, canonical_root=canonical_root),
+			ex.submit(check_chunk_store, chunks_root=chunks_root, verdicts=verdicts),
+		]
+		futures[2].result()
+		index_issues = check_vector_index(
+			vector_root=vector_root,
+			chunks_root=chunks_root,
+			embeddings_root=embeddings_root,
+			chunk_verdicts=verdicts,
+		)
+		return [it for f in futures for it in f.result()] + index_issues
 
 def main(argv: Optional[List[str]] = None) -> int:
 	parser = argparse.ArgumentParser(description="Run ingestion gating checks (Step 13)")
@@ -15,10 +15,12 @@ lightweight, deterministic integrity check for v1 and for unit tests.
 from __future__ import annotations
 
 import hmac
-import hashlib
 import os
+from functools import lru_cache
 from typing import Optional
 
+# Read once per process (the dev-default warning is emitted at most once).
+@lru_cache(maxsize=1)
 def _get_secret() -> str:
 	secret = os.environ.get("INGESTION_SIGNING_SECRET")
 	if secret and str(secret).strip():
@@ -34,12 +36,16 @@ def _get_secret() -> str:
 	)
 	return "dev-ingestion-signing-secret-CHANGE-IN-PRODUCTION"
 
+@lru_cache(maxsize=1)
+def _get_secret_bytes() -> bytes:
+	return _get_secret().encode("utf-8")
+
 def sign_content_hash(content_hash: str, *, secret: Optional[str] = None) -> str:
 	"""Return an HMAC signature over `content_hash`."""
-	sec = (secret if secret is not None else _get_secret()).encode("utf-8")
+	sec = secret.encode("utf-8") if secret is not None else _get_secret_bytes()
 	msg = (content_hash or "").encode("utf-8")
-	mac = hmac.new(sec, msg, digestmod=hashlib.sha256).hexdigest()
-	return f"hmac-sha256:{mac}"
+	# One-shot C implementation; no HMAC object for these short messages.
+	return f"hmac-sha256:{hmac.digest(sec, msg, 'sha256').hex()}"
 
 def verify_content_hash(content_hash: str, signature: str, *, secret: Optional[str] = None) -> bool:
 	if not signature or not isinstance(signature, str):
@@ -0,0 +1,158 @@
+"""JSON encode/decode helpers shared by the storage layers.
+
+Uses orjson when it is installed and falls back to the stdlib `json` module
+otherwise. Both paths work in bytes: `dumps` returns UTF-8 bytes and `loads`
+accepts bytes or str, so callers can use `read_bytes`/`write_bytes` directly
+instead of decoding and re-encoding text.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Union
+import json
+import mmap
+import os
+
+try:
+	import orjson  # type: ignore
+except ModuleNotFoundError:
+	orjson = None  # type: ignore[assignment]
+
+HAS_ORJSON = orjson is not None
+
+JsonInput = Union[bytes, bytearray, memoryview, str]
+
+
+def loads(data: JsonInput) -> Any:
+	if orjson is not None:
+		return orjson.loads(data)
+	if isinstance(data, memoryview):
+		data = data.tobytes()
+	return json.loads(data)
+
+
+def dumps(
+	obj: Any,
+	*,
+	indent: bool = False,
+	sort_keys: bool = False,
+	default: Optional[Callable[[Any], Any]] = None,
+) -> bytes:
+	"""Serialize `obj` to UTF-8 JSON bytes (2-space indent when `indent`)."""
+	if orjson is not None:
+		option = orjson.OPT_NON_STR_KEYS
+		if indent:
+			option |= orjson.OPT_INDENT_2
+		if sort_keys:
+			option |= orjson.OPT_SORT_KEYS
+		return orjson.dumps(obj, option=option, default=default)
+	return json.dumps(
+		obj,
+		ensure_ascii=False,
+		indent=2 if indent else None,
+		sort_keys=sort_keys,
+		default=default,
+	).encode("utf-8")
+
+
+# Below this size a plain read is cheaper than setting up a mapping.
+_MMAP_MIN_BYTES = 16 * 1024
+
+_READ_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+
+
+def read_json(path: Union[str, Path]) -> Any:
+	# Raw os.open/os.read: no buffered file object and no fstat. A short first
+	# read means EOF, which covers the many small embedding/metadata files.
+	fd = os.open(path, _READ_FLAGS)
+	try:
+		head = os.read(fd, _MMAP_MIN_BYTES)
+		if len(head) < _MMAP_MIN_BYTES:
+			return loads(head)
+		with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+			view = memoryview(mm)
+			try:
+				return loads(view)
+			finally:
+				# The mapping cannot close while a view is exported.
+				view.release()
+	finally:
+		os.close(fd)
+
+
+def write_json(
+	path: Union[str, Path],
+	obj: Any,
+	*,
+	indent: bool = True,
+	default: Optional[Callable[[Any], Any]] = None,
+) -> None:
+	Path(path).write_bytes(dumps(obj, indent=indent, default=default))
+
+
+def iter_lines(path: Union[str, Path]) -> Iterator[bytes]:
+	"""Yield every non-blank line of a file as raw bytes (line ending included).
+
+	Large files are memory-mapped and read line by line, so the whole file is
+	never held as one bytes/str object plus a list of lines.
+	"""
+	with open(path, "rb") as f:
+		if os.fstat(f.fileno()).st_size < _MMAP_MIN_BYTES:
+			for line in f.read().splitlines():
+				if line.strip():
+					yield line
+			return
+		with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+			for line in iter(mm.readline, b""):
+				if line.strip():
+					yield line
+
+
+def iter_jsonl(path: Union[str, Path]) -> Iterator[Any]:
+	"""Yield the decoded value of every non-blank line in a JSONL/NDJSON file."""
+	for line in iter_lines(path):
+		yield loads(line)
+
+
+_TAIL_BLOCK = 64 * 1024
+
+
+def tail_lines(path: Union[str, Path], limit: int) -> List[bytes]:
+	"""Last `limit` lines of a file, read backwards in blocks from the end."""
+	with open(path, "rb") as fh:
+		pos = fh.seek(0, os.SEEK_END)
+		buf = b""
+		# limit + 1 newlines guarantees `limit` complete lines even with a trailing newline.
+		while pos > 0 and buf.count(b"\n") <= limit:
+			step = min(_TAIL_BLOCK, pos)
+			pos -= step
+			fh.seek(pos)
+			buf = fh.read(step) + buf
+	if buf.endswith(b"\n"):
+		buf = buf[:-1]
+	lines = buf.split(b"\n") if buf else []
+	if pos > 0:
+		lines = lines[1:]  # first line is cut off at the block boundary
+	return lines[-limit:]
+
+
+_APPEND_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+
+
+def append_jsonl(path: Union[str, Path], rows: Iterable[Any]) -> int:
+	"""Append `rows` as JSON lines in a single O_APPEND write; returns bytes written.
+
+	One write per call keeps lines from concurrent appenders from interleaving.
+	"""
+	data = b"".join(dumps(row) + b"\n" for row in rows)
+	if not data:
+		return 0
+	fd = os.open(path, _APPEND_FLAGS, 0o644)
+	try:
+		view = memoryview(data)
+		while view:
+			view = view[os.write(fd, view) :]
+	finally:
+		os.close(fd)
+	return len(data)
@@ -1,7 +1,8 @@
 """
 ObservabilityStore: Monitoring & audit for ingestion/retrieval/release operations.
 - Append-only JSONL event log per domain
-- Cheap counters and on-demand summaries
+- Cheap counters (SQLite upserts in WAL mode, mirrored to counters.json
+  every few hundred updates) and on-demand summaries
 - Admin-only API endpoints are implemented in main.py
 
 This avoids adding heavy dependencies (Prometheus/OpenTelemetry) while still
@@ -10,13 +11,19 @@ providing useful operational visibility and a stable contract for future work.
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+import atexit
 import json
+import os
+import sqlite3
+import threading
 
 from env import get_observability_root as _get_observability_root
+import jsonio
 
 def _utc_now_iso() -> str:
     return datetime.now(tz=timezone.utc).isoformat().replace("+00:00", "Z")
@@ -40,6 +47,171 @@ def _parse_iso_z(ts: str) -> Optional[datetime]:
 def get_observability_root() -> Path:
     return _get_observability_root()
 
+
+# Snapshot counters.json for file-based readers after this many counter updates.
+_COUNTERS_EXPORT_EVERY = 200
+
+_UPSERT_SQL = "INSERT INTO counters(k, v) VALUES(?, ?) ON CONFLICT(k) DO UPDATE SET v = v + excluded.v"
+
+
+class _CounterDb:
+    """One shared connection per counters database; a lock serializes its transactions."""
+
+    def __init__(self, path: Path, legacy_json: Path) -> None:
+        self.path = path
+        self.lock = threading.Lock()
+        self.pending = 0
+        self._conn: Optional[sqlite3.Connection] = None
+        with self.lock:
+            conn = self._connect()
+            conn.execute("CREATE TABLE IF NOT EXISTS counters(k TEXT PRIMARY KEY, v INTEGER NOT NULL)")
+            conn.execute("CREATE TABLE IF NOT EXISTS meta(k TEXT PRIMARY KEY)")
+            self._import_json(conn, legacy_json)
+
+    def _connect(self) -> sqlite3.Connection:
+        # Callers hold self.lock. Reopens after close(), for a caller that fetched
+        # this object just before it was evicted from the cache.
+        if self._conn is None:
+            conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        with self.lock:
+            conn, self._conn = self._conn, None
+        if conn is not None:
+            conn.close()
+
+    @staticmethod
+    def _import_json(conn: sqlite3.Connection, legacy_json: Path) -> None:
+        """Seed a new database from the pre-SQLite counters.json, exactly once.
+
+        The marker row is claimed in the same transaction as the import, so processes
+        opening a new domain concurrently cannot both import it.
+        """
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            claimed = conn.execute("INSERT OR IGNORE INTO meta(k) VALUES('legacy_imported')").rowcount == 1
+            # Databases created before the marker existed were already seeded.
+            if claimed and conn.execute("SELECT 1 FROM counters LIMIT 1").fetchone() is None:
+                try:
+                    raw = json.loads(legacy_json.read_text(encoding="utf-8"))
+                except Exception:
+                    raw = None
+                if isinstance(raw, dict):
+                    rows = [(k, v) for k, v in raw.items() if isinstance(k, str) and isinstance(v, int)]
+                    conn.executemany(_UPSERT_SQL, rows)
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def bump(self, rows: Sequence[Tuple[str, int]]) -> bool:
+        """Apply increments in one transaction; True when a json snapshot is due."""
+        with self.lock:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.executemany(_UPSERT_SQL, rows)
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+            self.pending += len(rows)
+            if self.pending < _COUNTERS_EXPORT_EVERY:
+                return False
+            self.pending = 0
+            return True
+
+    def snapshot(self) -> Dict[str, int]:
+        with self.lock:
+            return {k: int(v) for k, v in self._connect().execute("SELECT k, v FROM counters ORDER BY k")}
+
+
+# Domains come from API input, so open connections are capped; the least recently
+# used one is closed when a new database is opened past the cap.
+_COUNTER_DBS_MAX = 32
+
+_counter_dbs: "OrderedDict[Tuple[int, str], _CounterDb]" = OrderedDict()
+_counter_dbs_lock = threading.Lock()
+
+
+def _counter_db(path: Path, legacy_json: Path) -> _CounterDb:
+    # Keyed by pid too: a connection must not be reused across fork().
+    key = (os.getpid(), str(path))
+    evicted: List[_CounterDb] = []
+    with _counter_dbs_lock:
+        db = _counter_dbs.get(key)
+        if db is None:
+            db = _counter_dbs[key] = _CounterDb(path, legacy_json)
+            while len(_counter_dbs) > _COUNTER_DBS_MAX:
+                (pid, _path), old = _counter_dbs.popitem(last=False)
+                if pid == os.getpid():
+                    evicted.append(old)
+        else:
+            _counter_dbs.move_to_end(key)
+    for old in evicted:
+        old.close()
+    return db
+
+_APPEND_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+
+# Like the counter connections, open event logs are capped: least recently used
+# descriptors are closed once more than this many domains have written events.
+_EVENT_FDS_MAX = 32
+
+# (pid, path) -> (O_APPEND fd, inode it was opened on)
+_event_fds: "OrderedDict[Tuple[int, str], Tuple[int, int]]" = OrderedDict()
+_event_fds_lock = threading.Lock()
+
+
+def _append_event(path: Path, data: bytes) -> None:
+    """Append one line to an events log through a cached O_APPEND descriptor.
+
+    The descriptor is reopened when the path no longer names the file it was opened
+    on (rotated by rename, or deleted). Writes happen under the cache lock so an
+    evicted descriptor is never closed mid-write.
+    """
+    pid = os.getpid()
+    key = (pid, str(path))
+    with _event_fds_lock:
+        entry = _event_fds.get(key)
+        if entry is not None:
+            try:
+                ino = os.stat(path).st_ino
+            except FileNotFoundError:
+                ino = None
+            if ino != entry[1]:
+                del _event_fds[key]
+                os.close(entry[0])
+                entry = None
+            else:
+                _event_fds.move_to_end(key)
+        if entry is None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(path, _APPEND_FLAGS, 0o644)
+            entry = _event_fds[key] = (fd, os.fstat(fd).st_ino)
+            while len(_event_fds) > _EVENT_FDS_MAX:
+                (old_pid, _path), (old_fd, _ino) = _event_fds.popitem(last=False)
+                if old_pid == pid:
+                    os.close(old_fd)
+        view = memoryview(data)
+        fd = entry[0]
+        while view:
+            view = view[os.write(fd, view) :]
+
+
+@atexit.register
+def _close_event_fds() -> None:
+    with _event_fds_lock:
+        for (pid, _path), (fd, _ino) in list(_event_fds.items()):
+            if pid == os.getpid():
+                os.close(fd)
+        _event_fds.clear()
+
+
 @dataclass
 class ObservabilityStore:
     root: Path = None  # type: ignore[assignment]
@@ -59,9 +231,35 @@ class ObservabilityStore:
     def _counters_path(self, domain: str) -> Path:
         return self._domain_dir(domain) / "counters.json"
 
-    def record_event(self, *, domain: str, event: str, status: str = "success", level: str = "INFO", **fields: Any) -> Dict[str, Any]:
+    def _counters_db_path(self, domain: str) -> Path:
+        return self._domain_dir(domain) / "counters.sqlite3"
+
+    def _apply_deltas(self, domain: str, deltas: Dict[str, int]) -> None:
+        """Apply all counter deltas for one operation in a single write."""
+        rows = [(k, int(v)) for k, v in deltas.items() if v]
+        if not rows:
+            return
         dd = self._domain_dir(domain)
         dd.mkdir(parents=True, exist_ok=True)
+        db = _counter_db(self._counters_db_path(domain), self._counters_path(domain))
+        if db.bump(rows):
+            self.export_counters(domain=domain)
+
+    def get_counters(self, *, domain: str) -> Dict[str, int]:
+        self._domain_dir(domain).mkdir(parents=True, exist_ok=True)
+        return _counter_db(self._counters_db_path(domain), self._counters_path(domain)).snapshot()
+
+    def export_counters(self, *, domain: str) -> Dict[str, int]:
+        """Write the current counters to counters.json (the pre-SQLite format)."""
+        counters = self.get_counters(domain=domain)
+        path = self._counters_path(domain)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps(counters, ensure_ascii=False, sort_keys=True, indent=2), encoding="utf-8")
+        os.replace(tmp, path)
+        return counters
+
+    def record_event(self, *, domain: str, event: str, status: str = "success", level: str = "INFO", **fields: Any) -> Dict[str, Any]:
+        events_path = self._events_path(domain)
 
         payload: Dict[str, Any] = {
             "timestamp": _utc_now_iso(),
@@ -72,50 +270,37 @@ class ObservabilityStore:
         }
         payload.update(fields)
 
-        with self._events_path(domain).open("a", encoding="utf-8") as fh:
-            fh.write(json.dumps(payload, ensure_ascii=False, default=str) + "\n")
+        # One O_APPEND write per event keeps lines whole across threads and processes.
+        _append_event(events_path, (json.dumps(payload, ensure_ascii=False, default=str) + "\n").encode("utf-8"))
 
         # Update simple counters
-        self.increment(domain=domain, key=f"event:{event}")
-        self.increment(domain=domain, key=f"status:{status}")
-        self.increment(domain=domain, key=f"event_status:{event}:{status}")
+        self._apply_deltas(domain, {
+            f"event:{event}": 1,
+            f"status:{status}": 1,
+            f"event_status:{event}:{status}": 1,
+        })
 
         return payload
 
     def increment(self, *, domain: str, key: str, amount: int = 1) -> None:
-        dd = self._domain_dir(domain)
-        dd.mkdir(parents=True, exist_ok=True)
-        path = self._counters_path(domain)
-
-        counters: Dict[str, int] = {}
-        if path.exists():
-            try:
-                raw = json.loads(path.read_text(encoding="utf-8"))
-                if isinstance(raw, dict):
-                    for k, v in raw.items():
-                        if isinstance(k, str) and isinstance(v, int):
-                            counters[k] = v
-            except Exception:
-                counters = {}
-
-        counters[key] = int(counters.get(key, 0)) + int(amount)
-        path.write_text(json.dumps(counters, ensure_ascii=False, sort_keys=True, indent=2), encoding="utf-8")
+        self._apply_deltas(domain, {key: int(amount)})
 
     def list_events(self, *, domain: str, limit: int = 100) -> List[Dict[str, Any]]:
         if limit <= 0:
             return []
         p = self._events_path(domain)
-        if not p.exists():
+        try:
+            lines = jsonio.tail_lines(p, limit)
+        except FileNotFoundError:
             return []
-        lines = p.read_text(encoding="utf-8").splitlines()
         # last N, newest first
         out: List[Dict[str, Any]] = []
-        for line in reversed(lines[-limit:]):
+        for line in reversed(lines):
             line = line.strip()
             if not line:
                 continue
             try:
-                obj = json.loads(line)
+                obj = jsonio.loads(line)
                 if isinstance(obj, dict):
                     out.append(obj)
             except Exception:
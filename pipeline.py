@@ -2,20 +2,30 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from concurrent.futures import ProcessPoolExecutor
 import hashlib
+import os
+import threading
 
-from canonicalizer import canonicalize_sections
-from chunker import chunk_canonical_objects, persist_chunks
-from distiller import distill_sections_from_html
+from canonicalizer import canonical_object_from_section, persist_canonical
+from chunker import chunk_canonical_object, persist_chunks
+from distiller import iter_sections_from_html
 from embeddings import (
+	CachingEmbeddingProvider,
 	DeterministicHashEmbeddingProvider,
 	EmbeddingProvider,
+	EmbeddingStore,
 	FileEmbeddingStore,
 	OllamaEmbeddingProvider,
-	attach_embeddings_for_chunks,
+	PackedEmbeddingStore,
+	VirtualDeterministicStore,
+	embed_chunks,
+	store_chunk_embeddings,
 )
 from env import (
+	get_embed_cache_enabled,
+	get_embed_store_format,
 	get_embeddings_root,
 	get_ingestion_embed_provider,
 	get_ollama_base_url,
@@ -23,25 +33,122 @@ from env import (
 	get_ollama_timeout_s,
 )
 from releases import ReleaseManager
-from section_classifier import filter_instructional_sections
+from section_classifier import classify_section
 from vector_store import build_vector_store_adapter
 
 
-def _sha256_hex(text: str) -> str:
-	h = hashlib.sha256()
-	h.update((text or "").encode("utf-8"))
-	return h.hexdigest()
+def _is_blank(value: Optional[Union[str, bytes]]) -> bool:
+	# isspace() answers without allocating a stripped copy.
+	return not value or value.isspace()
 
 
-def _build_ingestion_embedder() -> EmbeddingProvider:
+def _sha256_hex(text: Union[str, bytes, memoryview]) -> str:
+	if isinstance(text, str):
+		text = text.encode("utf-8")
+	return hashlib.sha256(text or b"").hexdigest()
+
+
+def _new_ingestion_embedder() -> EmbeddingProvider:
 	provider = get_ingestion_embed_provider()
+	embedder: EmbeddingProvider
 	if provider == "ollama":
-		return OllamaEmbeddingProvider(
-			model=get_ollama_embed_model(),
+		model = get_ollama_embed_model()
+		embedder = OllamaEmbeddingProvider(
+			model=model,
 			base_url=get_ollama_base_url(),
 			timeout_s=get_ollama_timeout_s(),
 		)
-	return DeterministicHashEmbeddingProvider()
+		model_tag = f"ollama-{model}"
+	else:
+		embedder = DeterministicHashEmbeddingProvider()
+		model_tag = f"deterministic-{embedder.dim}"
+	if get_embed_cache_enabled():
+		return CachingEmbeddingProvider(inner=embedder, model_tag=model_tag, cache_root=get_embeddings_root() / ".cache")
+	return embedder
+
+
+_ingestion_embedders: Dict[int, EmbeddingProvider] = {}
+_ingestion_embedders_lock = threading.Lock()
+
+
+def _build_ingestion_embedder() -> EmbeddingProvider:
+	"""Per-process provider, so Ollama keep-alive connections are reused across runs.
+
+	Keyed by pid: a forked pool worker must not share the parent's sockets.
+	"""
+	pid = os.getpid()
+	with _ingestion_embedders_lock:
+		embedder = _ingestion_embedders.get(pid)
+		if embedder is None:
+			embedder = _ingestion_embedders[pid] = _new_ingestion_embedder()
+		return embedder
+
+
+def close_ingestion_embedder() -> None:
+	with _ingestion_embedders_lock:
+		embedder = _ingestion_embedders.pop(os.getpid(), None)
+	close = getattr(embedder, "close", None)
+	if callable(close):
+		close()
+
+
+def _build_ingestion_store() -> EmbeddingStore:
+	# Deterministic vectors are recomputed from their `det:` ref, so by default they are not written.
+	deterministic = get_ingestion_embed_provider() == "deterministic"
+	fmt = get_embed_store_format(default="det" if deterministic else "f32")
+	if fmt == "det" and deterministic:
+		return VirtualDeterministicStore()
+	if fmt == "packed":
+		return PackedEmbeddingStore(root=get_embeddings_root())
+	return FileEmbeddingStore(root=get_embeddings_root(), vector_format="json" if fmt == "json" else "f32")
+
+
+def _iter_canonical_chunks(
+	raw_html: str,
+	*,
+	domain: str,
+	source_id: str,
+	release_id: str,
+	source_hash: str,
+	max_chars: int,
+	stats: Optional[Dict[str, int]],
+) -> Iterator[Tuple[str, Dict[str, Any], List[Dict[str, Any]]]]:
+	for sec in iter_sections_from_html(raw_html, domain=domain, source_hash=source_hash):
+		if stats is not None:
+			stats["sections_total"] = stats.get("sections_total", 0) + 1
+		if not classify_section(sec).is_instructional:
+			continue
+		if stats is not None:
+			stats["sections_kept"] = stats.get("sections_kept", 0) + 1
+		clo = canonical_object_from_section(sec, domain=domain, source_id=source_id, release_id=release_id)
+		yield str(sec.get("section_id", "")), clo, chunk_canonical_object(clo, domain=domain, release_id=release_id, max_chars=max_chars)
+
+
+def stream_sections_to_chunks(
+	raw_html: str,
+	*,
+	domain: str,
+	source_id: str,
+	release_id: str,
+	source_hash: str,
+	max_chars: int = 800,
+	stats: Optional[Dict[str, int]] = None,
+) -> Iterator[Dict[str, Any]]:
+	"""Distill -> classify -> canonicalize -> chunk in one pass, yielding chunks per section.
+
+	Chunks come out in document order rather than the sorted order of
+	`chunk_canonical_objects`; nothing is persisted. Section counts are added to `stats`.
+	"""
+	for _, _, chunks in _iter_canonical_chunks(
+		raw_html,
+		domain=domain,
+		source_id=source_id,
+		release_id=release_id,
+		source_hash=source_hash,
+		max_chars=max_chars,
+		stats=stats,
+	):
+		yield from chunks
 
 
 @dataclass
@@ -53,73 +160,154 @@ class IngestionRunResult:
 	counts: Dict[str, int]
 
 
-def run_ingestion(
+@dataclass
+class PreparedIngestion:
+	"""CPU-bound half of a run: canonical objects, chunks and their vectors, not yet written anywhere."""
+	domain: str
+	source_id: str
+	release_id: str
+	source_hash: str
+	canonical: List[Dict[str, Any]]
+	chunks: List[Dict[str, Any]]
+	vectors: List[List[float]]
+	counts: Dict[str, int]
+
+
+def prepare_ingestion(
 	*,
 	domain: str,
 	source_id: str,
 	release_id: str,
-	raw_html: str,
-	created_by: Optional[str] = None,
-	write_release: bool = True,
-) -> IngestionRunResult:
-	if not domain or not domain.strip():
+	raw_html: Union[str, bytes],
+) -> PreparedIngestion:
+	"""Distill, classify, canonicalize, chunk and embed one capture.
+
+	`raw_html` may be the captured bytes: they are hashed as-is and decoded once.
+	Module-level and pure (returns plain data, writes nothing) so it can run in a
+	worker process; all release artifacts are written by `finish_ingestion`.
+	"""
+	if _is_blank(domain):
 		raise ValueError("domain is required")
-	if not source_id or not source_id.strip():
+	if _is_blank(source_id):
 		raise ValueError("source_id is required")
-	if not release_id or not release_id.strip():
+	if _is_blank(release_id):
 		raise ValueError("release_id is required")
-	if not raw_html or not raw_html.strip():
+	if _is_blank(raw_html):
 		raise ValueError("raw_html is required")
 
 	source_hash = _sha256_hex(raw_html)
-	sections = distill_sections_from_html(raw_html, domain=domain, source_hash=source_hash)
-	kept_sections, _dropped = filter_instructional_sections(sections)
-	canonical = canonicalize_sections(
-		kept_sections,
+	if isinstance(raw_html, bytes):
+		raw_html = raw_html.decode("utf-8", errors="replace")
+	stats = {"sections_total": 0, "sections_kept": 0}
+	fused = list(_iter_canonical_chunks(
+		raw_html,
+		domain=domain,
+		source_id=source_id,
+		release_id=release_id,
+		source_hash=source_hash,
+		max_chars=800,
+		stats=stats,
+	))
+	# Same on-disk order as canonicalize_sections (by section_id) and
+	# chunk_canonical_objects (by CLO id); both sorts are stable.
+	fused.sort(key=lambda t: t[0])
+	canonical = [clo for _, clo, _ in fused]
+	fused.sort(key=lambda t: str(t[1].get("id", "")))
+	chunks = [ch for _, _, clo_chunks in fused for ch in clo_chunks]
+	vectors = embed_chunks(chunks, provider=_build_ingestion_embedder())
+
+	return PreparedIngestion(
 		domain=domain,
 		source_id=source_id,
 		release_id=release_id,
-		persist=True,
+		source_hash=source_hash,
+		canonical=canonical,
+		chunks=chunks,
+		vectors=vectors,
+		counts={
+			"sections_total": stats["sections_total"],
+			"sections_kept": stats["sections_kept"],
+			"canonical_objects": len(canonical),
+			"chunks": len(chunks),
+			"embeddings": len(vectors),
+		},
 	)
-	chunks = chunk_canonical_objects(canonical, domain=domain, release_id=release_id)
-	persist_chunks(chunks)
 
-	embedder = _build_ingestion_embedder()
-	store = FileEmbeddingStore(root=get_embeddings_root())
-	chunks_with_embeddings = attach_embeddings_for_chunks(chunks, provider=embedder, store=store)
 
+def finish_ingestion(
+	prepared: PreparedIngestion,
+	*,
+	created_by: Optional[str] = None,
+	write_release: bool = True,
+) -> IngestionRunResult:
+	"""Write a prepared run's canonical objects, chunks and embeddings, upsert the index, and optionally record the release.
+
+	Callers run this serially, in request order: nothing reaches the release until here.
+	"""
+	persist_canonical(prepared.canonical, domain=prepared.domain, release_id=prepared.release_id)
+	persist_chunks(prepared.chunks)
+	chunks_with_embeddings = store_chunk_embeddings(prepared.chunks, prepared.vectors, store=_build_ingestion_store())
 	vector_store = build_vector_store_adapter()
-	vector_store.upsert(domain=domain, release_id=release_id, chunks=chunks_with_embeddings)
+	vector_store.upsert(domain=prepared.domain, release_id=prepared.release_id, chunks=chunks_with_embeddings)
 
 	release_meta: Dict[str, Any] = {}
 	if write_release:
+		counts = prepared.counts
 		release_manager = ReleaseManager()
 		release_meta = release_manager.create_release(
-			domain=domain,
-			release_id=release_id,
+			domain=prepared.domain,
+			release_id=prepared.release_id,
 			created_by=created_by,
 			payload={
-				"source_id": source_id,
-				"source_hash": source_hash,
+				"source_id": prepared.source_id,
+				"source_hash": prepared.source_hash,
 				"stats": {
-					"sections_total": len(sections),
-					"sections_kept": len(kept_sections),
-					"canonical_objects": len(canonical),
-					"chunks": len(chunks),
+					"sections_total": counts["sections_total"],
+					"sections_kept": counts["sections_kept"],
+					"canonical_objects": counts["canonical_objects"],
+					"chunks": counts["chunks"],
 				},
 			},
 		)
 
 	return IngestionRunResult(
 		status="ok",
-		domain=domain,
-		release_id=release_id,
+		domain=prepared.domain,
+		release_id=prepared.release_id,
 		release=release_meta,
-		counts={
-			"sections_total": len(sections),
-			"sections_kept": len(kept_sections),
-			"canonical_objects": len(canonical),
-			"chunks": len(chunks),
-			"embeddings": len(chunks_with_embeddings),
-		},
+		counts=dict(prepared.counts),
 	)
+
+
+def run_ingestion(
+	*,
+	domain: str,
+	source_id: str,
+	release_id: str,
+	raw_html: Union[str, bytes],
+	created_by: Optional[str] = None,
+	write_release: bool = True,
+) -> IngestionRunResult:
+	prepared = prepare_ingestion(domain=domain, source_id=source_id, release_id=release_id, raw_html=raw_html)
+	return finish_ingestion(prepared, created_by=created_by, write_release=write_release)
+
+
+_ingestion_pool: Optional[ProcessPoolExecutor] = None
+_ingestion_pool_lock = threading.Lock()
+
+
+def get_ingestion_pool() -> ProcessPoolExecutor:
+	"""Process pool for `prepare_ingestion`, created on first use."""
+	global _ingestion_pool
+	with _ingestion_pool_lock:
+		if _ingestion_pool is None:
+			_ingestion_pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+		return _ingestion_pool
+
+
+def shutdown_ingestion_pool() -> None:
+	global _ingestion_pool
+	with _ingestion_pool_lock:
+		pool, _ingestion_pool = _ingestion_pool, None
+	if pool is not None:
+		pool.shutdown(wait=True, cancel_futures=True)
@@ -20,18 +20,43 @@ Environment override:
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
+from decimal import Decimal
 from pathlib import Path
-from typing import Any, Dict, Optional, List
-import json
+from typing import Any, Dict, Optional, List, Tuple
+import os
+import threading
 
 from env import get_releases_root as _get_releases_root
+import jsonio
 
 
 def _utc_now_iso() -> str:
 	return datetime.now(tz=timezone.utc).isoformat().replace("+00:00", "Z")
 
 
+# active_release.txt path -> ((inode, mtime_ns, size), release id). One stat per lookup
+# instead of exists + read; promote_release replaces the file, so the key changes.
+_active_cache: Dict[str, Tuple[Tuple[int, int, int], Optional[str]]] = {}
+
+
+def _release_default(obj: Any) -> Any:
+	"""Encode metadata values JSON has no type for; called only for those values."""
+	if isinstance(obj, (set, frozenset)):
+		return sorted(obj, key=str)
+	if isinstance(obj, Path):
+		return obj.as_posix()
+	if isinstance(obj, Decimal):
+		return float(obj)
+	if isinstance(obj, (datetime, date)):
+		return obj.isoformat()
+	# numpy scalars/arrays (release stats) without requiring numpy here.
+	tolist = getattr(obj, "tolist", None)
+	if callable(tolist):
+		return tolist()
+	raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 def get_releases_root() -> Path:
 	return _get_releases_root()
 
@@ -85,18 +110,22 @@ class ReleaseManager:
 		release_dir = self._release_dir(domain, release_id)
 		release_dir.mkdir(parents=True, exist_ok=True)
 		self._domain_dir(domain).mkdir(parents=True, exist_ok=True)
-		self._release_json_path(domain, release_id).write_text(
-			json.dumps(meta, ensure_ascii=False, indent=2),
-			encoding="utf-8",
-		)
+		jsonio.write_json(self._release_json_path(domain, release_id), meta, default=_release_default)
 		return meta
 
 	def get_active_release(self, domain: str) -> Optional[str]:
 		path = self._active_release_path(domain)
-		if not path.exists():
+		try:
+			st = os.stat(path)
+		except FileNotFoundError:
 			return None
-		raw = path.read_text(encoding="utf-8").strip()
-		return raw or None
+		key = (st.st_ino, st.st_mtime_ns, st.st_size)
+		hit = _active_cache.get(str(path))
+		if hit is not None and hit[0] == key:
+			return hit[1]
+		raw = path.read_text(encoding="utf-8").strip() or None
+		_active_cache[str(path)] = (key, raw)
+		return raw
 
 	def promote_release(
 		self,
@@ -110,7 +139,16 @@ class ReleaseManager:
 		previous = self.get_active_release(domain)
 		self._domain_dir(domain).mkdir(parents=True, exist_ok=True)
 		self._release_dir(domain, release_id).mkdir(parents=True, exist_ok=True)
-		self._active_release_path(domain).write_text(release_id, encoding="utf-8")
+		# Replace rather than rewrite in place: readers never see a partial file, and
+		# the new inode invalidates every process's cached value.
+		active_path = self._active_release_path(domain)
+		tmp = active_path.with_name(f".{active_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+		tmp.write_text(release_id, encoding="utf-8")
+		# Stat the temp file, not active_path: a rename keeps inode, mtime and size, and
+		# another process may promote between os.replace and a later stat.
+		st = os.stat(tmp)
+		os.replace(tmp, active_path)
+		_active_cache[str(active_path)] = ((st.st_ino, st.st_mtime_ns, st.st_size), release_id)
 
 		event = {
 			"timestamp": _utc_now_iso(),
@@ -121,25 +159,27 @@ class ReleaseManager:
 			"actor": promoted_by,
 			"reason": reason,
 		}
-		audit_path = self._audit_path(domain)
-		audit_path.parent.mkdir(parents=True, exist_ok=True)
-		with audit_path.open("a", encoding="utf-8") as fh:
-			fh.write(json.dumps(event, ensure_ascii=False) + "\n")
+		# Domain dir exists (created above); one O_APPEND write per event.
+		jsonio.append_jsonl(self._audit_path(domain), [event])
 		return event
 
 	def list_audit(self, *, domain: str, limit: int = 100) -> List[Dict[str, Any]]:
 		"""Return latest audit events (newest first)."""
 		path = self._audit_path(domain)
-		if not path.exists() or limit <= 0:
+		if limit <= 0:
+			return []
+		try:
+			# Reads only the last `limit` lines, not the whole log.
+			lines = jsonio.tail_lines(path, limit)
+		except FileNotFoundError:
 			return []
-		lines = path.read_text(encoding="utf-8").splitlines()
 		events: List[Dict[str, Any]] = []
-		for line in reversed(lines[-limit:]):
+		for line in reversed(lines):
 			line = line.strip()
 			if not line:
 				continue
 			try:
-				obj = json.loads(line)
+				obj = jsonio.loads(line)
 				if isinstance(obj, dict):
 					events.append(obj)
 			except Exception:
@@ -1,46 +1,78 @@
-import json
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Optional, Pattern, Tuple
 
 from env import BASE_DIR
+import jsonio
 
 SCHEMAS_DIR = BASE_DIR / "docs" / "schemas"
 
 def load_schema(name: str) -> Dict[str, Any]:
-	path = SCHEMAS_DIR / name
-	with open(path, "r", encoding="utf-8") as fh:
-		return json.load(fh)
+	return jsonio.read_json(SCHEMAS_DIR / name)
+
+# Validators below are built once per schema name; schemas ship with the repo and
+# do not change while the process runs. load_schema still returns a fresh copy.
+@lru_cache(maxsize=None)
+def _cached_schema(name: str) -> Dict[str, Any]:
+	return load_schema(name)
 
 try:
-	import jsonschema  # type: ignore
-	from jsonschema import Draft7Validator  # type: ignore
+	import fastjsonschema  # type: ignore
+except ModuleNotFoundError:
+	fastjsonschema = None  # type: ignore[assignment]
 
-	def validate_instance(schema_name: str, instance: Dict[str, Any]) -> None:
-		schema = load_schema(schema_name)
-		validator = Draft7Validator(schema)
-		errors = sorted(validator.iter_errors(instance), key=lambda e: e.path)
-		if errors:
-			msgs = [f"{list(e.path)}: {e.message}" for e in errors]
-			raise ValueError("Schema validation errors: " + "; ".join(msgs))
+if fastjsonschema is not None:
+	# Schemas compile to plain Python functions once per name. Formats stay off to
+	# match Draft7Validator, which ignores "format" without a format checker.
+	@lru_cache(maxsize=None)
+	def _fast_validator(schema_name: str) -> Callable[[Any], Any]:
+		return fastjsonschema.compile(_cached_schema(schema_name), use_formats=False)
 
-except ModuleNotFoundError:
-	# Minimal fallback validator when jsonschema is not installed.
 	def validate_instance(schema_name: str, instance: Dict[str, Any]) -> None:
-		schema = load_schema(schema_name)
-		# Check required fields
-		req = schema.get("required", [])
-		missing = [r for r in req if r not in instance]
-		if missing:
-			raise ValueError(f"Missing required fields: {missing}")
-
-		# Quick pattern checks for fields we care about in tests
-		props = schema.get("properties", {})
-		chash = props.get("content_hash", {})
-		pattern = chash.get("pattern") if isinstance(chash, dict) else None
-		if pattern and "content_hash" in instance:
-			if not re.match(pattern, instance["content_hash"]):
-				raise ValueError("content_hash does not match required pattern")
+		try:
+			_fast_validator(schema_name)(instance)
+		except fastjsonschema.JsonSchemaValueException as e:
+			# e.path starts with the root name ("data"); drop it to match jsonschema.
+			raise ValueError(f"Schema validation errors: {list(e.path[1:])}: {e.message}") from None
+
+else:
+	try:
+		import jsonschema  # type: ignore
+		from jsonschema import Draft7Validator  # type: ignore
+
+		@lru_cache(maxsize=None)
+		def _get_validator(schema_name: str) -> "Draft7Validator":
+			return Draft7Validator(_cached_schema(schema_name))
+
+		def validate_instance(schema_name: str, instance: Dict[str, Any]) -> None:
+			validator = _get_validator(schema_name)
+			errors = sorted(validator.iter_errors(instance), key=lambda e: e.path)
+			if errors:
+				msgs = [f"{list(e.path)}: {e.message}" for e in errors]
+				raise ValueError("Schema validation errors: " + "; ".join(msgs))
+
+	except ModuleNotFoundError:
+		# Minimal fallback validator when jsonschema is not installed.
+		@lru_cache(maxsize=None)
+		def _fallback_rules(schema_name: str) -> Tuple[Tuple[str, ...], Optional[Pattern[str]]]:
+			"""(required fields, compiled content_hash pattern) for a schema, built once."""
+			schema = _cached_schema(schema_name)
+			chash = schema.get("properties", {}).get("content_hash", {})
+			pattern = chash.get("pattern") if isinstance(chash, dict) else None
+			return tuple(schema.get("required", [])), (re.compile(pattern) if pattern else None)
+
+		def validate_instance(schema_name: str, instance: Dict[str, Any]) -> None:
+			req, pattern = _fallback_rules(schema_name)
+			# Check required fields
+			missing = [r for r in req if r not in instance]
+			if missing:
+				raise ValueError(f"Missing required fields: {missing}")
+
+			# Quick pattern checks for fields we care about in tests
+			if pattern is not None and "content_hash" in instance:
+				if not pattern.match(instance["content_hash"]):
+					raise ValueError("content_hash does not match required pattern")
 
 if __name__ == "__main__":
 	ex = {
@@ -11,7 +11,7 @@ not annotate the section dicts in-place. Instead we return filtered lists and
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Tuple
 import re
 
 @dataclass(frozen=True)
@@ -20,9 +20,10 @@ class Classification:
 	score: float
 	reasons: Tuple[str, ...]
 
-_WORD_RE = re.compile(r"[A-Za-z][A-Za-z0-9_-]*")
+# Applied to already-lowercased text.
+_WORD_RE = re.compile(r"[a-z][a-z0-9_-]*")
 
-_NON_INSTRUCTIONAL_PHRASES = {
+_NON_INSTRUCTIONAL_PHRASES = frozenset({
 	"table of contents",
 	"toc",
 	"subscribe",
@@ -40,9 +41,9 @@ _NON_INSTRUCTIONAL_PHRASES = {
 	"share this",
 	"edit this page",
 	"last updated",
-}
+})
 
-_NON_INSTRUCTIONAL_HINTS = {
+_NON_INSTRUCTIONAL_HINTS = frozenset({
 	"next",
 	"previous",
 	"page",
@@ -54,9 +55,9 @@ _NON_INSTRUCTIONAL_HINTS = {
 	"github",
 	"twitter",
 	"linkedin",
-}
+})
 
-_INSTRUCTIONAL_VERBS = {
+_INSTRUCTIONAL_VERBS = frozenset({
 	"run",
 	"use",
 	"create",
@@ -70,10 +71,15 @@ _INSTRUCTIONAL_VERBS = {
 	"apply",
 	"initialize",
 	"init",
-}
+})
+
+# Fixed term order so `reasons` does not depend on set iteration order.
+_PHRASE_ORDER = tuple(sorted(_NON_INSTRUCTIONAL_PHRASES))
+_HINT_ORDER = tuple(sorted(_NON_INSTRUCTIONAL_HINTS))
 
 def _normalize(s: str) -> str:
-	return " ".join((s or "").strip().lower().split())
+	# split() already drops leading/trailing whitespace; it beats a regex sub here.
+	return " ".join((s or "").lower().split())
 
 def classify_section(section: Dict[str, Any]) -> Classification:
 	kind = _normalize(str(section.get("kind", "")))
@@ -89,19 +95,23 @@ def classify_section(section: Dict[str, Any]) -> Classification:
 	elif kind in {"note", "explanation"}:
 		score += 1.0
 		reasons.append(f"kind:{kind}")
-	for phrase in _NON_INSTRUCTIONAL_PHRASES:
-		if phrase in title or phrase in text:
-			score -= 6.0
-			reasons.append(f"non_instr_phrase:{phrase}")
-	for hint in _NON_INSTRUCTIONAL_HINTS:
-		if hint in title or hint in text:
-			score -= 1.0
-			reasons.append(f"non_instr_hint:{hint}")
+	# One substring scan per term over title and text together; normalized strings
+	# never contain "\n", so no match can straddle the two.
+	hay = f"{title}\n{text}"
+	phrase_hits = [p for p in _PHRASE_ORDER if p in hay]
+	if phrase_hits:
+		score -= 6.0 * len(phrase_hits)
+		reasons.extend([f"non_instr_phrase:{p}" for p in phrase_hits])
+	hint_hits = [h for h in _HINT_ORDER if h in hay]
+	if hint_hits:
+		score -= 1.0 * len(hint_hits)
+		reasons.extend([f"non_instr_hint:{h}" for h in hint_hits])
 	if "table of contents" in title or text.startswith("table of contents"):
 		score -= 8.0
 		reasons.append("toc")
-	words = [w.lower() for w in _WORD_RE.findall(text)]
-	verb_hits = sum(1 for w in words if w in _INSTRUCTIONAL_VERBS)
+	words = _WORD_RE.findall(text)
+	# map() keeps the per-word work in C rather than in generator frames.
+	verb_hits = sum(map(_INSTRUCTIONAL_VERBS.__contains__, words))
 	if verb_hits:
 		score += min(2.0, 0.5 * verb_hits)
 		reasons.append(f"verb_hits:{verb_hits}")
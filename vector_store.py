@@ -12,23 +12,67 @@ Key requirements:
 
 Storage layout:
     <root>/<domain>/<release_id>/index.jsonl
+    <root>/<domain>/<release_id>/vectors.bin   (optional, see below)
+    <root>/<domain>/<release_id>/vectors.json
 
 Each line contains:
-    {"chunk_id", "domain", "release_id", "text", "embedding_ref"}
+    {"chunk_id", "domain", "release_id", "text", "embedding_ref", "norm"}
 
-Vectors are loaded from `embedding_ref` (currently supports `file:<path>`)
-that points to a JSON payload containing `vector`.
+Upserts append their rows; a chunk_id may therefore repeat and the last line
+wins. Once appended bytes pass 25% of the last rewrite, the index is compacted
+(deduped and rewritten sorted by chunk_id).
+
+`norm` is the L2 norm of the stored vector, written at upsert so queries do not
+recompute it (rows without it are still scored).
+
+`upsert` also packs every line's vector, in index.jsonl line order, into
+`vectors.bin` (little-endian float32, or float64 when a vector is not exactly
+representable in float32). `vectors.json` records {"rows", "dim", "dtype"},
+the size/mtime of the index.jsonl it was built from, and that file's size at
+the last compaction; queries use the matrix only while that still matches and
+otherwise load each `embedding_ref`.
+
+When hnswlib is installed, compacting a release of at least 20k rows also
+builds an HNSW graph (`hnsw.bin` + `hnsw.json`, labels = index.jsonl line
+numbers). Queries take approximate candidates from it, plus any rows appended
+since, and score them exactly; they fall back to brute force when too few
+candidates survive the filters.
+
+With VECTOR_QUANTIZE=int8 (and numpy), queries score int8 copies of the loaded
+vectors (per-row scale, quantized once per snapshot) against the exact norms.
+
+Vectors are loaded from `embedding_ref` (`file+f32:<path>` binary float32 or
+legacy `file:<path>` JSON payload containing `vector`).
 """
 
-from dataclasses import dataclass
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import cached_property
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Protocol, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Protocol, Tuple
+import heapq
 import importlib
-import json
 import math
 import os
+import sys
+import threading
+
+try:
+    import numpy as np  # type: ignore
+except ModuleNotFoundError:
+    np = None  # type: ignore[assignment]
 
-from env import get_vector_index_root
+try:
+    import hnswlib  # type: ignore
+except ModuleNotFoundError:
+    hnswlib = None  # type: ignore[assignment]
+
+from embeddings import load_embedding_vector, parse_embedding_ref, read_f32_bytes
+from env import get_vector_index_root, get_vector_quantization
+import jsonio
 
 class VectorStoreAdapter(Protocol):
     def upsert(self, *, domain: str, release_id: str, chunks: List[Dict[str, Any]]) -> None:
@@ -98,33 +142,437 @@ def build_vector_store_adapter(*, root: Optional[Path] = None) -> VectorStoreAda
         return target()  # type: ignore[call-arg]
 
 
-def _cosine(a: List[float], b: List[float]) -> float:
+def _l2_norm(v: List[float]) -> float:
+    return math.sqrt(sum(x * x for x in v))
+
+
+def _row_norm(row: Dict[str, Any]) -> Optional[float]:
+    n = row.get("norm")
+    return float(n) if isinstance(n, (int, float)) and not isinstance(n, bool) else None
+
+
+def _cosine(a: List[float], b: List[float], a_norm: Optional[float] = None, b_norm: Optional[float] = None) -> float:
     if not a or not b or len(a) != len(b):
         return 0.0
+    if a_norm is None:
+        a_norm = _l2_norm(a)
+    if b_norm is None:
+        b_norm = _l2_norm(b)
+    if a_norm <= 0.0 or b_norm <= 0.0:
+        return 0.0
     dot = 0.0
-    na = 0.0
-    nb = 0.0
     for x, y in zip(a, b):
         dot += x * y
-        na += x * x
-        nb += y * y
-    if na <= 0.0 or nb <= 0.0:
-        return 0.0
-    return dot / (math.sqrt(na) * math.sqrt(nb))
+    return dot / (a_norm * b_norm)
+
+
+# (matrix, row L2 norms) for a set of equal-length vectors.
+_Stacked = Tuple[Any, Any]
+
+
+def _stack_vectors(vectors: List[List[float]], norms: Optional[List[Optional[float]]] = None) -> Optional[_Stacked]:
+    """Stack vectors for the numpy path; None without numpy or for ragged/empty vectors."""
+    if np is None or not vectors:
+        return None
+    dim = len(vectors[0])
+    if not dim or any(len(v) != dim for v in vectors):
+        return None
+    # float64 keeps scores in line with the pure-Python _cosine.
+    m = np.asarray(vectors, dtype=np.float64)
+    return _with_norms(m, norms)
+
+
+def _with_norms(m: Any, norms: Optional[List[Optional[float]]]) -> _Stacked:
+    if norms is not None and None not in norms:
+        return m, np.asarray(norms, dtype=np.float64)
+    m64 = m.astype(np.float64, copy=False)
+    return m, np.sqrt((m64 * m64).sum(axis=1))
+
+
+def _stacked_cosine(stacked: _Stacked, query_vector: List[float]) -> Any:
+    """Cosine of every stacked row against the query, as a float64 ndarray."""
+    m, norms = stacked
+    if len(query_vector) != m.shape[1]:
+        return np.zeros(len(norms))
+    q = np.asarray(query_vector, dtype=np.float64)
+    denom = norms * math.sqrt(float(q @ q))
+    scores = np.zeros(len(norms))
+    # Row-wise sums rather than m @ q: BLAS may round identical rows differently,
+    # which would reorder exact ties (broken by chunk_id).
+    np.divide((m * q).sum(axis=1), denom, out=scores, where=denom > 0)
+    return scores
+
+
+def _quantize_rows(m: Any) -> _Stacked:
+    """Symmetric per-row int8 quantization: (q, scales) with m ~= q * scales[:, None]."""
+    scales = np.abs(m).max(axis=1) / 127.0
+    q = np.rint(m / np.where(scales > 0, scales, 1.0)[:, None]).astype(np.int8)
+    return q, scales
+
+
+def _quantized_cosine(quantized: _Stacked, norms: Any, query_vector: List[float]) -> Any:
+    """Approximate _stacked_cosine from int8 rows; the norms stay exact."""
+    qm, scales = quantized
+    if len(query_vector) != qm.shape[1]:
+        return np.zeros(len(norms))
+    q = np.asarray(query_vector, dtype=np.float64)
+    (qq,), (q_scale,) = _quantize_rows(q[None, :])
+    dots = np.matmul(qm, qq, dtype=np.int32) * (scales * q_scale)
+    denom = norms * math.sqrt(float(q @ q))
+    scores = np.zeros(len(norms))
+    np.divide(dots, denom, out=scores, where=denom > 0)
+    return scores
+
+
+def _cosine_scores(
+    query_vector: List[float],
+    vectors: List[List[float]],
+    norms: Optional[List[Optional[float]]] = None,
+) -> Any:
+    """Cosine scores (ndarray when the vectors stack, else a list)."""
+    stacked = _stack_vectors(vectors, norms)
+    if stacked is not None:
+        return _stacked_cosine(stacked, query_vector)
+    q_norm = _l2_norm(query_vector)
+    norms = norms or [None] * len(vectors)
+    return [_cosine(query_vector, v, q_norm, n) for v, n in zip(vectors, norms)]
+
+
+def _rank_key(t: Tuple[float, Dict[str, Any]]) -> Tuple[float, str]:
+    # Highest cosine first, deterministic tiebreak on chunk_id
+    return -t[0], str(t[1].get("chunk_id", ""))
+
+
+def _top_k(scores: Any, rows: List[Dict[str, Any]], top_k: int) -> List[Tuple[float, Dict[str, Any]]]:
+    """The `top_k` best (score, row) pairs in rank order, without sorting every candidate."""
+    if np is not None and isinstance(scores, np.ndarray):
+        n = len(scores)
+        if n > top_k:
+            kth = np.partition(scores, n - top_k)[n - top_k]
+            if not np.isnan(kth):
+                # Keep every row tied with the k-th score so chunk_id still breaks ties.
+                idx = np.flatnonzero(scores >= kth)
+                rows = [rows[i] for i in idx]
+                scores = scores[idx]
+        scores = scores.tolist()
+    return heapq.nsmallest(top_k, zip(scores, rows), key=_rank_key)
 
 
 def _load_vector_from_embedding_ref(embedding_ref: str) -> List[float]:
-    if not embedding_ref:
-        return []
-    if embedding_ref.startswith("file:"):
-        path = embedding_ref[len("file:") :]
-        payload = json.loads(Path(path).read_text(encoding="utf-8"))
-        vec = payload.get("vector")
-        if isinstance(vec, list):
-            return [float(x) for x in vec]
-        return []
-    # Unknown provider
-    return []
+    # Unknown providers load as an empty vector.
+    return load_embedding_vector(embedding_ref)
+
+
+# Per-ref embedding reads are I/O bound (file reads release the GIL).
+_LOAD_IO_WORKERS = 32
+_LOAD_PARALLEL_MIN = 64
+
+
+def _map_io(fn: Callable[[Any], Any], items: List[Any]) -> List[Any]:
+    """[fn(x) for x in items], on a thread pool once there are enough items to matter."""
+    if len(items) < _LOAD_PARALLEL_MIN:
+        return [fn(x) for x in items]
+    with ThreadPoolExecutor(max_workers=_LOAD_IO_WORKERS) as ex:
+        return list(ex.map(fn, items, chunksize=16))
+
+
+def _load_vectors_from_embedding_refs(refs: List[str]) -> List[List[float]]:
+    return _map_io(_load_vector_from_embedding_ref, refs)
+
+
+def _load_f32_matrix(refs: List[str]) -> Optional[Any]:
+    """(rows, dim) float32 matrix built straight from `file+f32:` blobs, skipping per-vector lists.
+
+    None without numpy, or unless every ref is an f32 file of the same non-zero size.
+    """
+    if np is None or not refs:
+        return None
+    paths: List[Path] = []
+    for ref in refs:
+        parsed = parse_embedding_ref(ref)
+        if parsed is None or parsed[0] != "f32":
+            return None
+        paths.append(parsed[1])
+    blobs = _map_io(read_f32_bytes, paths)
+    size = len(blobs[0])
+    if not size or size % 4 or any(len(b) != size for b in blobs):
+        return None
+    return np.frombuffer(b"".join(blobs), dtype="<f4").reshape(len(blobs), size // 4)
+
+
+PACKED_VECTORS_NAME = "vectors.bin"
+PACKED_META_NAME = "vectors.json"
+
+_PACKED_TYPECODES = {"float32": "f", "float64": "d"}
+
+# Compact once rows appended since the last rewrite exceed this share of its size.
+_COMPACT_RATIO = 0.25
+
+
+def _pack(vectors: List[List[float]], typecode: Optional[str] = None) -> Optional[array]:
+    """Little-endian packed vectors; float32 unless a value needs float64 (or `typecode` forces one).
+
+    None when a vector does not fit float32 and `typecode` is "f".
+    """
+    flat = array("d", chain.from_iterable(vectors))
+    packed = flat
+    if typecode != "d":
+        packed = array("f", flat)
+        if array("d", packed) != flat:
+            if typecode == "f":
+                return None
+            packed = flat  # keep float64 so scores match the per-ref vectors exactly
+    if sys.byteorder != "little":
+        packed.byteswap()
+    return packed
+
+
+def _write_packed_meta(index_path: Path, *, rows: int, dim: int, typecode: str, compacted_size: int) -> None:
+    st = index_path.stat()
+    jsonio.write_json(index_path.with_name(PACKED_META_NAME), {
+        "rows": rows,
+        "dim": dim,
+        "dtype": "float32" if typecode == "f" else "float64",
+        "index_size": st.st_size,
+        "index_mtime_ns": st.st_mtime_ns,
+        "compacted_size": compacted_size,
+    })
+
+
+def _write_packed_vectors(index_path: Path, vectors: List[List[float]]) -> None:
+    """Pack `vectors` (index.jsonl line order) next to the index; drop the pack if they are ragged."""
+    bin_path = index_path.with_name(PACKED_VECTORS_NAME)
+    meta_path = index_path.with_name(PACKED_META_NAME)
+    dim = len(vectors[0]) if vectors else 0
+    if not dim or any(len(v) != dim for v in vectors):
+        meta_path.unlink(missing_ok=True)
+        bin_path.unlink(missing_ok=True)
+        return
+    packed = _pack(vectors)
+    bin_path.write_bytes(packed)
+    size = index_path.stat().st_size
+    _write_packed_meta(index_path, rows=len(vectors), dim=dim, typecode=packed.typecode, compacted_size=size)
+    _write_ann_index(index_path, vectors, size)
+
+
+ANN_INDEX_NAME = "hnsw.bin"
+ANN_META_NAME = "hnsw.json"
+
+# Releases smaller than this are brute-forced; an HNSW graph is not worth building.
+_ANN_MIN_ROWS = 20_000
+# Filtered queries ask the graph for this many times top_k before filtering.
+_ANN_FILTER_OVERSAMPLE = 5
+# Search breadth floor (hnswlib "ef"); higher trades speed for recall.
+_ANN_MIN_EF = 200
+
+
+def _drop_ann_index(index_path: Path) -> None:
+    index_path.with_name(ANN_META_NAME).unlink(missing_ok=True)
+    index_path.with_name(ANN_INDEX_NAME).unlink(missing_ok=True)
+
+
+def _write_ann_index(index_path: Path, vectors: List[List[float]], compacted_size: int) -> None:
+    """Build hnsw.bin over compacted rows (labels are index.jsonl line numbers) when hnswlib is installed."""
+    if hnswlib is None or len(vectors) < _ANN_MIN_ROWS:
+        return
+    n, dim = len(vectors), len(vectors[0])
+    graph = hnswlib.Index(space="cosine", dim=dim)
+    graph.init_index(max_elements=n, ef_construction=200, M=16)
+    # One thread keeps the graph (and so the results) reproducible.
+    graph.add_items(np.asarray(vectors, dtype=np.float32), np.arange(n), num_threads=1)
+    graph.save_index(str(index_path.with_name(ANN_INDEX_NAME)))
+    jsonio.write_json(index_path.with_name(ANN_META_NAME), {"rows": n, "dim": dim, "compacted_size": compacted_size})
+
+
+@dataclass(frozen=True)
+class _AnnIndex:
+    graph: Any
+    dim: int
+    # Rows covered by the graph: the index.jsonl lines written by the last compaction.
+    rows: int
+    # Snapshot position for each graph label, -1 where a later line superseded it.
+    positions: List[int]
+    # Snapshot positions of lines appended after the graph was built.
+    tail: List[int]
+    # ef is graph-wide state; concurrent queries must not change it under each other.
+    lock: threading.Lock = field(default_factory=threading.Lock, compare=False, repr=False)
+
+    def search(self, query_vector: List[float], k: int) -> Optional[List[int]]:
+        """Snapshot positions of the approximate `k` nearest graph rows, plus every appended row."""
+        k = min(k, self.rows)
+        q = np.asarray(query_vector, dtype=np.float32)
+        try:
+            with self.lock:
+                self.graph.set_ef(max(k * 8, _ANN_MIN_EF))
+                labels, _ = self.graph.knn_query(q, k=k)
+        except RuntimeError:
+            return None
+        found = [self.positions[label] for label in labels[0].tolist()]
+        return [i for i in found if i >= 0] + self.tail
+
+
+def _load_ann_index(index_path: Path, meta: Dict[str, Any], keep: Optional[List[int]], n_lines: int) -> Optional[_AnnIndex]:
+    """The saved HNSW graph if it was built by the compaction `meta` describes, else None."""
+    if hnswlib is None:
+        return None
+    try:
+        ann_meta = jsonio.read_json(index_path.with_name(ANN_META_NAME))
+        rows, dim = int(ann_meta["rows"]), int(ann_meta["dim"])
+        if ann_meta.get("compacted_size") != meta.get("compacted_size") or dim != meta.get("dim") or rows > n_lines:
+            return None
+        graph = hnswlib.Index(space="cosine", dim=dim)
+        graph.load_index(str(index_path.with_name(ANN_INDEX_NAME)), max_elements=rows)
+    except (OSError, RuntimeError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+    lines = keep if keep is not None else range(n_lines)
+    positions = [-1] * rows
+    tail: List[int] = []
+    for pos, line in enumerate(lines):
+        if line < rows:
+            positions[line] = pos
+        else:
+            tail.append(pos)
+    return _AnnIndex(graph=graph, dim=dim, rows=rows, positions=positions, tail=tail)
+
+
+def _packed_meta(index_path: Path) -> Optional[Dict[str, Any]]:
+    """vectors.json if it was written for the current index.jsonl and vectors.bin has its size, else None."""
+    try:
+        meta = jsonio.read_json(index_path.with_name(PACKED_META_NAME))
+        st = index_path.stat()
+        if (meta.get("index_size"), meta.get("index_mtime_ns")) != (st.st_size, st.st_mtime_ns):
+            return None
+        itemsize = array(_PACKED_TYPECODES[meta["dtype"]]).itemsize
+        expected = int(meta["rows"]) * int(meta["dim"]) * itemsize
+        if index_path.with_name(PACKED_VECTORS_NAME).stat().st_size != expected:
+            return None
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+    return meta
+
+
+def _read_packed_vectors(index_path: Path, n_rows: int) -> Optional[Any]:
+    """Packed vectors for the index rows, or None if missing or not built from this index.jsonl.
+
+    Returns an (n_rows, dim) ndarray in the on-disk dtype with numpy, else a list of per-row lists.
+    """
+    meta = _packed_meta(index_path)
+    if meta is None or meta["rows"] != n_rows:
+        return None
+    dim = int(meta["dim"])
+    typecode = _PACKED_TYPECODES[meta["dtype"]]
+    try:
+        data = index_path.with_name(PACKED_VECTORS_NAME).read_bytes()
+    except OSError:
+        return None
+    flat = array(typecode)
+    if len(data) != n_rows * dim * flat.itemsize:
+        return None
+    if np is not None:
+        return np.frombuffer(data, dtype="<" + typecode).reshape(n_rows, dim)
+    flat.frombytes(data)
+    if sys.byteorder != "little":
+        flat.byteswap()
+    return [flat[i * dim : (i + 1) * dim].tolist() for i in range(n_rows)]
+
+
+def _last_occurrences(rows: List[Dict[str, Any]]) -> Optional[List[int]]:
+    """Line indices that survive last-writer-wins dedupe by chunk_id, or None if no chunk_id repeats."""
+    last: Dict[str, int] = {}
+    for i, obj in enumerate(rows):
+        last[str(obj.get("chunk_id", ""))] = i
+    if len(last) == len(rows):
+        return None
+    return sorted(last.values())
+
+
+@dataclass(frozen=True)
+class _IndexSnapshot:
+    rows: List[Dict[str, Any]]
+    # (rows, dim) ndarray when the vectors stack (float32 as packed on disk; scoring
+    # upcasts per query), else one list per row.
+    vectors: Any
+    norms: List[Optional[float]]
+    ann: Optional[_AnnIndex] = None
+
+    @cached_property
+    def quantized(self) -> Optional[_Stacked]:
+        if isinstance(self.vectors, list):
+            return None
+        return _quantize_rows(self.vectors.astype(np.float64, copy=False))
+
+    @property
+    def nbytes(self) -> int:
+        """Rough resident size, for the snapshot cache budget."""
+        if isinstance(self.vectors, list):
+            # A float object plus its list slot per value.
+            matrix = sum(len(v) for v in self.vectors) * 32
+        else:
+            matrix = self.vectors.nbytes
+            if "quantized" in self.__dict__:
+                matrix += self.vectors.size + 8 * len(self.vectors)
+        return matrix + 64 * len(self.rows)
+
+
+def _load_index(index_path: Path) -> _IndexSnapshot:
+    """Parse index.jsonl and load its vectors."""
+    rows = list(jsonio.iter_jsonl(index_path))
+    n_lines = len(rows)
+    vectors = _read_packed_vectors(index_path, n_lines)
+    # Upserts append, so a chunk_id may repeat until the next compaction; the last line wins.
+    keep = _last_occurrences(rows)
+    if keep is not None:
+        rows = [rows[i] for i in keep]
+        if vectors is not None:
+            vectors = [vectors[i] for i in keep] if isinstance(vectors, list) else vectors[keep]
+    ann = None
+    if vectors is not None and not isinstance(vectors, list):
+        meta = _packed_meta(index_path)
+        if meta is not None:
+            ann = _load_ann_index(index_path, meta, keep, n_lines)
+    if vectors is None:
+        refs = [str(obj.get("embedding_ref", "")) for obj in rows]
+        vectors = _load_f32_matrix(refs)
+    if vectors is None:
+        loaded = _load_vectors_from_embedding_refs(refs)
+        stacked = _stack_vectors(loaded)
+        vectors = loaded if stacked is None else stacked[0]
+    if not isinstance(vectors, list):
+        vectors.flags.writeable = False
+    return _IndexSnapshot(rows=rows, vectors=vectors, norms=[_row_norm(obj) for obj in rows], ann=ann)
+
+
+# Snapshots are kept, least recently used first out, while their combined size
+# (index.jsonl bytes plus snapshot.nbytes) stays under this budget.
+_SNAPSHOT_CACHE_BYTES = 512 << 20
+
+# index.jsonl path -> ((mtime_ns, size), snapshot)
+_snapshots: "OrderedDict[str, Tuple[Tuple[int, int], _IndexSnapshot]]" = OrderedDict()
+_snapshots_lock = threading.Lock()
+
+
+def _index_snapshot(index_path: Path) -> Optional[_IndexSnapshot]:
+    """Cached snapshot of an index; a rewrite changes mtime/size and replaces the entry."""
+    try:
+        st = index_path.stat()
+    except FileNotFoundError:
+        return None
+    key, stamp = str(index_path), (st.st_mtime_ns, st.st_size)
+    with _snapshots_lock:
+        entry = _snapshots.get(key)
+        if entry is not None and entry[0] == stamp:
+            _snapshots.move_to_end(key)
+            return entry[1]
+    snap = _load_index(index_path)
+    with _snapshots_lock:
+        _snapshots[key] = (stamp, snap)
+        _snapshots.move_to_end(key)
+        # Measured on every insert: int8 copies are built lazily after caching.
+        total = sum(st_size + cached.nbytes for (_, st_size), cached in _snapshots.values())
+        while total > _SNAPSHOT_CACHE_BYTES and len(_snapshots) > 1:
+            _, (old_stamp, old) = _snapshots.popitem(last=False)
+            total -= old_stamp[1] + old.nbytes
+    return snap
 
 
 @dataclass
@@ -153,31 +601,18 @@ class LocalJsonlVectorStore:
             if not ch.get("embedding_ref"):
                 raise ValueError("embedding_ref is required for indexing")
 
-        index_path = self._index_path(domain, release_id)
-        index_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Read existing into a dict (deterministic overwrite by chunk_id)
-        existing: Dict[str, Dict[str, Any]] = {}
-        if index_path.exists():
-            for line in index_path.read_text(encoding="utf-8").splitlines():
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    obj = json.loads(line)
-                    cid = str(obj.get("chunk_id", ""))
-                    if cid:
-                        existing[cid] = obj
-                except Exception:
-                    continue
-
+        fresh: Dict[str, Dict[str, Any]] = {}
+        vectors: Dict[str, List[float]] = {}
         for ch in chunks:
+            vec = _load_vector_from_embedding_ref(str(ch["embedding_ref"]))
+            vectors[str(ch["chunk_id"])] = vec
             row: Dict[str, Any] = {
                 "chunk_id": str(ch["chunk_id"]),
                 "domain": domain,
                 "release_id": release_id,
                 "text": str(ch["text"]),
                 "embedding_ref": str(ch["embedding_ref"]),
+                "norm": _l2_norm(vec),
             }
             # Optional alignment metadata used for filter enforcement.
             for k in _FILTER_KEYS:
@@ -185,11 +620,72 @@ class LocalJsonlVectorStore:
                 if isinstance(v, str) and v.strip():
                     row[k] = v.strip()
 
-            existing[str(ch["chunk_id"])] = row
+            fresh[str(ch["chunk_id"])] = row
+
+        index_path = self._index_path(domain, release_id)
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        if not fresh and index_path.exists():
+            return
+
+        # Append the batch when the packed vectors can be extended in place; otherwise
+        # (new index, ragged or dtype-incompatible vectors, stale pack) rewrite everything.
+        meta = _packed_meta(index_path) if index_path.exists() else None
+        packed = None
+        if meta is not None:
+            order = sorted(fresh)
+            batch = [vectors[k] for k in order]
+            dim = int(meta["dim"])
+            if all(len(v) == dim for v in batch):
+                packed = _pack(batch, _PACKED_TYPECODES[meta["dtype"]])
+        if packed is None:
+            self._compact(index_path, fresh, vectors)
+            return
+
+        jsonio.append_jsonl(index_path, (fresh[k] for k in order))
+        with index_path.with_name(PACKED_VECTORS_NAME).open("ab") as f:
+            f.write(packed)
+        compacted_size = int(meta.get("compacted_size") or 0)
+        _write_packed_meta(
+            index_path,
+            rows=int(meta["rows"]) + len(order),
+            dim=dim,
+            typecode=packed.typecode,
+            compacted_size=compacted_size,
+        )
+        if index_path.stat().st_size - compacted_size > _COMPACT_RATIO * compacted_size:
+            self._compact(index_path, {}, {})
+
+    def _compact(self, index_path: Path, fresh: Dict[str, Dict[str, Any]], vectors: Dict[str, List[float]]) -> None:
+        """Rewrite index.jsonl deduped (last line wins) and sorted by chunk_id, with `fresh` rows overlaid."""
+        # Line numbers change below; drop the graph first so it never outlives its rows.
+        _drop_ann_index(index_path)
+        existing: Dict[str, Dict[str, Any]] = {}
+        if index_path.exists():
+            lines: List[Dict[str, Any]] = []
+            for line in jsonio.iter_lines(index_path):
+                try:
+                    obj = jsonio.loads(line)
+                    if str(obj.get("chunk_id", "")):
+                        lines.append(obj)
+                except Exception:
+                    continue
+            # Reuse packed vectors rather than reloading every embedding_ref.
+            packed = _read_packed_vectors(index_path, len(lines)) if lines else None
+            for i, obj in enumerate(lines):
+                cid = str(obj["chunk_id"])
+                existing[cid] = obj
+                if packed is not None and cid not in fresh:
+                    vectors[cid] = packed[i] if isinstance(packed, list) else packed[i].tolist()
+        existing.update(fresh)
 
         # Deterministic write order
-        lines = [json.dumps(existing[k], ensure_ascii=False) for k in sorted(existing.keys())]
-        index_path.write_text("\n".join(lines) + ("\n" if lines else ""), encoding="utf-8")
+        order = sorted(existing.keys())
+        lines_out = [jsonio.dumps(existing[k]) for k in order]
+        index_path.write_bytes(b"\n".join(lines_out) + (b"\n" if lines_out else b""))
+        missing = [k for k in order if k not in vectors]
+        loaded = _load_vectors_from_embedding_refs([str(existing[k].get("embedding_ref", "")) for k in missing])
+        vectors.update(zip(missing, loaded))
+        _write_packed_vectors(index_path, [vectors[k] for k in order])
 
     def query(
         self,
@@ -207,27 +703,32 @@ class LocalJsonlVectorStore:
         if top_k <= 0:
             return []
 
-        index_path = self._index_path(domain, release_id)
-        if not index_path.exists():
+        snap = _index_snapshot(self._index_path(domain, release_id))
+        if snap is None:
             return []
 
-        candidates: List[Tuple[float, Dict[str, Any]]] = []
-        for line in index_path.read_text(encoding="utf-8").splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            obj = json.loads(line)
-            if not _matches_filters(obj, filters):
-                continue
-            emb_ref = str(obj.get("embedding_ref", ""))
-            vec = _load_vector_from_embedding_ref(emb_ref)
-            score = _cosine(query_vector, vec)
-            candidates.append((score, obj))
-
-        # Highest cosine first, deterministic tiebreak on chunk_id
-        candidates.sort(key=lambda t: (-t[0], str(t[1].get("chunk_id", ""))))
+        keep: Optional[List[int]] = None
+        if snap.ann is not None and len(query_vector) == snap.ann.dim:
+            # Approximate candidates, scored exactly below; brute force if too few survive.
+            found = snap.ann.search(query_vector, top_k * _ANN_FILTER_OVERSAMPLE if filters else top_k)
+            if found is not None:
+                found = [i for i in found if _matches_filters(snap.rows[i], filters)]
+                if len(found) >= top_k:
+                    keep = found
+        if keep is None:
+            keep = [i for i, obj in enumerate(snap.rows) if _matches_filters(obj, filters)]
+        rows = [snap.rows[i] for i in keep]
+        norms = [snap.norms[i] for i in keep]
+        if isinstance(snap.vectors, list):
+            scores = _cosine_scores(query_vector, [snap.vectors[i] for i in keep], norms)
+        elif get_vector_quantization() == "int8":
+            qm, scales = snap.quantized
+            exact = _with_norms(snap.vectors[keep], norms)
+            scores = _quantized_cosine((qm[keep], scales[keep]), exact[1], query_vector)
+        else:
+            scores = _stacked_cosine(_with_norms(snap.vectors[keep], norms), query_vector)
         out: List[Dict[str, Any]] = []
-        for score, obj in candidates[:top_k]:
+        for score, obj in _top_k(scores, rows, top_k):
             row_out: Dict[str, Any] = {
                 "chunk_id": obj.get("chunk_id"),
                 "domain": obj.get("domain"),
@@ -257,19 +758,40 @@ class InMemoryVectorIndex:
     release_id: str
     items: List[Dict[str, Any]]
 
+    def __post_init__(self) -> None:
+        # Vectors are stacked (with their norms) once, not per query.
+        object.__setattr__(self, "_stacked", _stack_vectors(
+            [it.get("vector") or [] for it in self.items],
+            [_row_norm(it) for it in self.items],
+        ))
+
+    @cached_property
+    def _quantized(self) -> _Stacked:
+        return _quantize_rows(self._stacked[0])  # type: ignore[attr-defined]
+
     def query(self, *, query_vector: List[float], filters: Optional[Dict[str, Any]] = None, top_k: int = 5) -> List[Dict[str, Any]]:
         if top_k <= 0:
             return []
-        candidates: List[Tuple[float, Dict[str, Any]]] = []
-        for it in self.items:
-            if not _matches_filters(it, filters):
-                continue
-            score = _cosine(query_vector, it.get("vector") or [])
-            candidates.append((score, it))
-
-        candidates.sort(key=lambda t: (-t[0], str(t[1].get("chunk_id", ""))))
+        stacked: Optional[_Stacked] = self._stacked  # type: ignore[attr-defined]
+        quantized = self._quantized if stacked is not None and get_vector_quantization() == "int8" else None
+        if filters:
+            keep = [i for i, it in enumerate(self.items) if _matches_filters(it, filters)]
+            selected = [self.items[i] for i in keep]
+            if stacked is not None:
+                stacked = (stacked[0][keep], stacked[1][keep])
+            if quantized is not None:
+                quantized = (quantized[0][keep], quantized[1][keep])
+        else:
+            selected = self.items
+        if quantized is not None and selected:
+            scores = _quantized_cosine(quantized, stacked[1], query_vector)
+        elif stacked is not None and selected:
+            scores = _stacked_cosine(stacked, query_vector)
+        else:
+            q_norm = _l2_norm(query_vector)
+            scores = [_cosine(query_vector, it.get("vector") or [], q_norm, _row_norm(it)) for it in selected]
         out: List[Dict[str, Any]] = []
-        for score, it in candidates[:top_k]:
+        for score, it in _top_k(scores, selected, top_k):
             row_out: Dict[str, Any] = {
                 "chunk_id": it.get("chunk_id"),
                 "domain": it.get("domain"),
@@ -292,29 +814,24 @@ def load_in_memory_index(*, root: Path = DEFAULT_INDEX_ROOT, domain: str, releas
     if not release_id:
         raise ValueError("release_id is required")
 
-    index_path = Path(root) / domain / release_id / "index.jsonl"
-    if not index_path.exists():
+    snap = _index_snapshot(Path(root) / domain / release_id / "index.jsonl")
+    if snap is None:
         return InMemoryVectorIndex(domain=domain, release_id=release_id, items=[])
 
     items: List[Dict[str, Any]] = []
-    for line in index_path.read_text(encoding="utf-8").splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        obj = json.loads(line)
-        emb_ref = str(obj.get("embedding_ref", ""))
-        vec = _load_vector_from_embedding_ref(emb_ref)
+    for obj, vec, norm in zip(snap.rows, snap.vectors, snap.norms):
         it: Dict[str, Any] = {
             "chunk_id": obj.get("chunk_id"),
             "domain": obj.get("domain"),
             "release_id": obj.get("release_id"),
             "text": obj.get("text"),
             "embedding_ref": obj.get("embedding_ref"),
-            "vector": vec,
+            "vector": list(vec) if isinstance(vec, list) else vec.tolist(),
         }
+        if norm is not None:
+            it["norm"] = norm
         for k in _FILTER_KEYS:
             if isinstance(obj.get(k), str):
                 it[k] = obj.get(k)
         items.append(it)
-
-
+    return InMemoryVectorIndex(domain=domain, release_id=release_id, items=items)